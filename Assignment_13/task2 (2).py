@@ -1,4 +1,8 @@
+import mmap
+import os
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Iterator
 
 
 def read_file(filename: str) -> str:
@@ -13,3 +17,192 @@ def read_file(filename: str) -> str:
         raise OSError(f"Failed to read file: {filename}") from exc
 
 
+def iter_chunks(filename: str, size: int = 1 << 16) -> Iterator[str]:
+    """Yield the decoded file contents in pieces of at most `size` characters.
+
+    Errors are wrapped like `read_file`, but surface on the first iteration.
+    """
+    if size <= 0:
+        raise ValueError("Chunk size must be positive")
+    try:
+        with Path(filename).open("r", encoding="utf-8") as source:
+            while True:
+                chunk = source.read(size)
+                if not chunk:
+                    return
+                yield chunk
+    except FileNotFoundError as exc:
+        raise FileNotFoundError(f"File not found: {filename}") from exc
+    except OSError as exc:
+        raise OSError(f"Failed to read file: {filename}") from exc
+
+
+def iter_lines(filename: str) -> Iterator[str]:
+    """Yield decoded lines (with their newline) without loading the whole file."""
+    try:
+        with Path(filename).open("r", encoding="utf-8") as source:
+            yield from source
+    except FileNotFoundError as exc:
+        raise FileNotFoundError(f"File not found: {filename}") from exc
+    except OSError as exc:
+        raise OSError(f"Failed to read file: {filename}") from exc
+
+
+@contextmanager
+def open_mmap(filename: str) -> Iterator[memoryview]:
+    """Map the file read-only and yield a zero-copy memoryview of its raw bytes.
+
+    The view is only valid inside the ``with`` block; slices taken from it must
+    be released (or copied with ``bytes()``) before the block exits.
+    """
+    try:
+        source = Path(filename).open("rb")
+    except FileNotFoundError as exc:
+        raise FileNotFoundError(f"File not found: {filename}") from exc
+    except OSError as exc:
+        raise OSError(f"Failed to read file: {filename}") from exc
+
+    with source:
+        try:
+            # Size the open file, not the path, which may have been replaced.
+            empty = os.fstat(source.fileno()).st_size == 0
+            mapped = None if empty else mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as exc:
+            raise OSError(f"Failed to read file: {filename}") from exc
+        if mapped is None:
+            # mmap cannot map an empty file.
+            yield memoryview(b"")
+            return
+        view = memoryview(mapped)
+        try:
+            yield view
+        finally:
+            view.release()
+            mapped.close()
+
+
+def benchmark_read_modes(filename: str, chunk_size: int = 1 << 16) -> dict:
+    """Measure throughput and peak Python heap use for each read mode.
+
+    Each mode touches every byte once: the text modes sum piece lengths, the
+    mmap mode runs ``zlib.adler32`` over the view (this also pages the file in).
+    Peak memory is the ``tracemalloc`` peak, so mapped pages are not counted.
+    """
+    import time
+    import tracemalloc
+    import zlib
+
+    def whole() -> int:
+        return len(read_file(filename))
+
+    def chunks() -> int:
+        return sum(len(chunk) for chunk in iter_chunks(filename, chunk_size))
+
+    def lines() -> int:
+        return sum(len(line) for line in iter_lines(filename))
+
+    def mapped() -> int:
+        with open_mmap(filename) as view:
+            zlib.adler32(view)
+            return len(view)
+
+    size_mb = Path(filename).stat().st_size / (1 << 20)
+    results = {}
+    for name, mode in [("read_file", whole), ("iter_chunks", chunks),
+                       ("iter_lines", lines), ("open_mmap", mapped)]:
+        tracemalloc.start()
+        started = time.perf_counter()
+        mode()
+        elapsed = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        results[name] = {
+            "mb_per_second": round(size_mb / elapsed, 1) if elapsed else None,
+            "peak_mb": round(peak / (1 << 20), 2),
+        }
+    return results
+
+
+def test_read_modes():
+    """Check the streaming readers against read_file, including error wrapping."""
+    import tempfile
+    from unittest import mock
+
+    def expect_error(action, error_type, message):
+        try:
+            action()
+        except error_type as exc:
+            assert str(exc) == message, str(exc)
+            # Domain errors keep the original OSError as their cause.
+            assert exc.__cause__ is not None or not isinstance(exc, OSError)
+        else:
+            assert False, f"expected {error_type.__name__}"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        sample = Path(tmp) / "sample.txt"
+        text = "first line\nsecond – with ünïcode\n\nno trailing newline"
+        sample.write_text(text, encoding="utf-8")
+        filename = str(sample)
+        assert read_file(filename) == text
+
+        # Chunk sizes count characters, so multi-byte characters never split.
+        for size in (1, 2, 3, 7, len(text) - 1, len(text), len(text) + 1, 1 << 16):
+            chunks = list(iter_chunks(filename, size))
+            assert "".join(chunks) == text, size
+            assert all(len(chunk) == size for chunk in chunks[:-1]), size
+            assert 0 < len(chunks[-1]) <= size, size
+            assert len(chunks) == -(-len(text) // size), size
+        for size in (0, -1):
+            expect_error(lambda: next(iter_chunks(filename, size)), ValueError,
+                         "Chunk size must be positive")
+
+        assert list(iter_lines(filename)) == text.splitlines(keepends=True)
+
+        with open_mmap(filename) as view:
+            assert bytes(view) == text.encode("utf-8")
+
+        empty = Path(tmp) / "empty.txt"
+        empty.write_bytes(b"")
+        assert list(iter_chunks(str(empty), 4)) == []
+        assert list(iter_lines(str(empty))) == []
+        with open_mmap(str(empty)) as view:
+            assert len(view) == 0
+
+        missing = str(Path(tmp) / "missing.txt")
+        directory = str(Path(tmp))
+        readers = [
+            read_file,
+            lambda name: next(iter_chunks(name, 4)),
+            lambda name: next(iter_lines(name)),
+            lambda name: open_mmap(name).__enter__(),
+        ]
+        for reader in readers:
+            expect_error(lambda: reader(missing), FileNotFoundError, f"File not found: {missing}")
+            expect_error(lambda: reader(directory), OSError, f"Failed to read file: {directory}")
+
+        # Failures after the file is open are wrapped too.
+        for target in ("os.fstat", "mmap.mmap"):
+            with mock.patch(target, side_effect=OSError("boom")):
+                expect_error(lambda: open_mmap(filename).__enter__(), OSError,
+                             f"Failed to read file: {filename}")
+
+        results = benchmark_read_modes(filename, chunk_size=4)
+        assert list(results) == ["read_file", "iter_chunks", "iter_lines", "open_mmap"]
+        assert all(result["peak_mb"] >= 0 for result in results.values())
+    print("All read mode tests passed! ✓")
+
+
+if __name__ == "__main__":
+    import json
+    import sys
+    import tempfile
+
+    if "--self-test" in sys.argv:
+        test_read_modes()
+    elif len(sys.argv) > 1:
+        print(json.dumps(benchmark_read_modes(sys.argv[1]), indent=2))
+    else:
+        with tempfile.TemporaryDirectory() as tmp:
+            sample = Path(tmp) / "sample.txt"
+            sample.write_text("sample line for read benchmarks\n" * 1_000_000, encoding="utf-8")
+            print(json.dumps(benchmark_read_modes(str(sample)), indent=2))
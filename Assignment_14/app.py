@@ -1,13 +1,48 @@
-from flask import Flask, request, send_from_directory, redirect, url_for, render_template_string
+import os
+
+from flask import Flask, request, redirect, url_for, render_template, jsonify
 from pathlib import Path
 
-app = Flask(__name__, static_url_path='', static_folder='.')
+import build_assets
+from login_support import VerifierBusy, start_login_logger, verifier_from_store
+from static_cache import StaticCache
+
 ROOT = Path(__file__).parent
+# Serve the minified, fingerprinted build from build_assets.py only when its manifest
+# matches the current sources; a stale or partial dist/ falls back to the sources.
+STATIC_ROOT = build_assets.DIST if build_assets.is_current() else ROOT
+# Static files go through the in-memory cache (ETag/304, gzip/deflate) instead of Flask's static route.
+app = Flask(__name__, static_folder=None)
+STATIC_CACHE = StaticCache(STATIC_ROOT)
+
+# Templates are parsed and compiled once here rather than on every request.
+LOGIN_ERROR_TEMPLATE = app.jinja_env.from_string(
+    '<h2>Login error</h2><p>{{message}} <a href="/">Back</a></p>'
+)
+LOGIN_SUCCESS_TEMPLATE = app.jinja_env.from_string(
+    '<h2>Login successful</h2>'
+    '<p>Welcome, <strong>{{username}}</strong>.</p>'
+    '<p><a href="/">Back to home</a></p>'
+)
+LOGIN_LOG = start_login_logger()
+# Optional: set LOGIN_CREDENTIAL_STORE to a credential JSON file from Assignment_5
+# to check passwords with its PBKDF2 LoginService on a bounded worker pool.
+PASSWORD_VERIFIER = verifier_from_store(os.getenv('LOGIN_CREDENTIAL_STORE'))
 
 @app.route('/', methods=['GET'])
 def index():
-    # Serve the static task1.html file from the workspace root
-    return send_from_directory(str(ROOT), 'task1.html')
+    # Serve task1.html from the build output, or the workspace root if not built
+    return STATIC_CACHE.send('task1.html')
+
+
+@app.route('/<path:filename>', methods=['GET'])
+def static_file(filename):
+    return STATIC_CACHE.send(filename)
+
+
+@app.route('/_stats/static-cache', methods=['GET'])
+def static_cache_stats():
+    return jsonify(STATIC_CACHE.stats())
 
 
 @app.route('/login', methods=['POST'])
@@ -18,19 +53,21 @@ def login():
 
     if not username or not password:
         # If fields are missing, redirect back with a simple message (could be improved)
-        return render_template_string(
-            '<h2>Login error</h2><p>Missing username or password. <a href="/">Back</a></p>'
-        ), 400
-
-    # On 'successful' login: print the username to the server console and show confirmation
-    print(f"User logged in: {username}")
-
-    return render_template_string(
-        '<h2>Login successful</h2>'
-        '<p>Welcome, <strong>{{username}}</strong>.</p>'
-        '<p><a href="/">Back to home</a></p>',
-        username=username,
-    )
+        return render_template(LOGIN_ERROR_TEMPLATE, message='Missing username or password.'), 400
+
+    if PASSWORD_VERIFIER is not None:
+        try:
+            if not PASSWORD_VERIFIER.verify(username, password):
+                return render_template(LOGIN_ERROR_TEMPLATE, message='Invalid username or password.'), 401
+        except VerifierBusy:
+            return render_template(LOGIN_ERROR_TEMPLATE, message='Server busy, please try again.'), 503
+
+    # On 'successful' login: log the username to the server console (written by a background thread)
+    LOGIN_LOG.info('User logged in: %s', username)
+
+    return render_template(LOGIN_SUCCESS_TEMPLATE, username=username)
+
+
 if __name__ == '__main__':
     # Run on localhost port 5000 — development only
     app.run('127.0.0.1', 5000, debug=True)
@@ -0,0 +1,239 @@
+"""
+Build step for the static site: minify, bundle and fingerprint assets.
+
+Reads task1.html, minifies every local stylesheet it links, minifies and bundles
+the local scripts it loads (in page order) into one file, writes each output
+under a content-hashed name in dist/, and rewrites the HTML to point at them.
+
+The build is incremental: dist/manifest.json records the SHA-256 of every input
+and the output name it produced, so unchanged inputs are not re-minified and
+unchanged outputs are not rewritten. Files are written with the atomic helpers
+from refactor_demo.py.
+"""
+import hashlib
+import json
+import re
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from refactor_demo import read_file, rewrite_file
+
+ROOT = Path(__file__).parent
+DIST = ROOT / 'dist'
+PAGE = 'task1.html'
+MANIFEST = 'manifest.json'
+
+_STYLESHEET = re.compile(r'<link\s+rel="stylesheet"\s+href="(?P<href>[^":]+\.css)"\s*/?>')
+_SCRIPT = re.compile(r'<script\s+src="(?P<src>[^":]+\.js)"\s*></script>')
+_LITERAL_MARK = '\x00'
+_LITERAL = re.compile(r'\x00(\d+)\x00')
+_CSS_STRING = re.compile(r'("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\')')
+
+
+def content_hash(data: str) -> str:
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+
+def fingerprint(name: str, content: str) -> str:
+    """Return `name` with a short content hash before the extension (app.css -> app.1a2b3c4d5e.css)."""
+    stem, _, ext = name.rpartition('.')
+    return f"{stem}.{content_hash(content)[:10]}.{ext}"
+
+
+def minify_css(css: str) -> str:
+    """Strip comments and collapse whitespace; quoted strings are left untouched."""
+    parts = _CSS_STRING.split(css)
+    out = []
+    for i, part in enumerate(parts):
+        if i % 2:  # quoted string
+            out.append(part)
+            continue
+        part = re.sub(r'/\*.*?\*/', '', part, flags=re.S)
+        part = re.sub(r'\s+', ' ', part)
+        part = re.sub(r'\s*([{};,>])\s*', r'\1', part)
+        part = re.sub(r':\s+', ':', part)
+        out.append(part.replace(';}', '}'))
+    return ''.join(out).strip()
+
+
+def minify_js(js: str) -> str:
+    """Conservative JS minifier: drop comments, indentation and blank lines.
+
+    Line breaks are kept so automatic semicolon insertion behaves exactly as in
+    the source. Strings, template literals and regex literals are copied verbatim.
+    """
+    if _LITERAL_MARK in js:
+        raise ValueError("JavaScript source must not contain NUL characters")
+    out: List[str] = []
+    literals: List[str] = []
+
+    def keep(literal: str) -> None:
+        # Literals are swapped for a placeholder so the whitespace passes below
+        # never see their contents.
+        out.append(f'{_LITERAL_MARK}{len(literals)}{_LITERAL_MARK}')
+        literals.append(literal)
+
+    i, n = 0, len(js)
+    last_significant = ''
+    while i < n:
+        ch = js[i]
+        if ch in '\'"`':
+            j = i + 1
+            while j < n and js[j] != ch:
+                j += 2 if js[j] == '\\' else 1
+            keep(js[i:j + 1])
+            last_significant = ch
+            i = j + 1
+        elif js.startswith('//', i):
+            while i < n and js[i] != '\n':
+                i += 1
+        elif js.startswith('/*', i):
+            end = js.find('*/', i + 2)
+            i = n if end == -1 else end + 2
+            out.append(' ')
+        elif ch == '/' and (not last_significant or last_significant in '(,=:[!&|?{};+-*%<>~^'):
+            j, in_class = i + 1, False
+            while j < n and (in_class or js[j] != '/') and js[j] != '\n':
+                if js[j] == '\\':
+                    j += 1
+                elif js[j] == '[':
+                    in_class = True
+                elif js[j] == ']':
+                    in_class = False
+                j += 1
+            keep(js[i:j + 1])
+            last_significant = '/'
+            i = j + 1
+        else:
+            out.append(ch)
+            if not ch.isspace():
+                last_significant = ch
+            i += 1
+    lines = (re.sub(r'[ \t]+', ' ', line).strip() for line in ''.join(out).splitlines())
+    code = '\n'.join(line for line in lines if line)
+    return _LITERAL.sub(lambda m: literals[int(m.group(1))], code)
+
+
+def _load_manifest() -> Dict[str, Dict[str, str]]:
+    try:
+        data = json.loads((DIST / MANIFEST).read_text(encoding='utf-8'))
+        return {'inputs': dict(data['inputs']), 'outputs': dict(data['outputs'])}
+    except (OSError, ValueError, KeyError, TypeError):
+        return {'inputs': {}, 'outputs': {}}
+
+
+def _write(name: str, content: str) -> None:
+    if rewrite_file(DIST / name, content, backup=False) == 'failed':
+        raise OSError(f"Failed to write {DIST / name}")
+
+
+def _read_source(name: str) -> str:
+    content = read_file(ROOT / name)
+    if content is None:
+        raise OSError(f"Failed to read {ROOT / name}")
+    return content
+
+
+def build() -> Dict[str, str]:
+    """Build dist/ from the sources. Returns {output key: 'built' | 'cached'}."""
+    DIST.mkdir(exist_ok=True)
+    manifest = _load_manifest()
+    old_inputs, old_outputs = manifest['inputs'], manifest['outputs']
+    inputs: Dict[str, str] = {}
+    outputs: Dict[str, str] = {}
+    report: Dict[str, str] = {}
+
+    html = _read_source(PAGE)
+    inputs[PAGE] = content_hash(html)
+
+    def up_to_date(key: str, sources: List[str]) -> bool:
+        name = old_outputs.get(key)
+        return (name is not None and (DIST / name).exists()
+                and all(old_inputs.get(src) == inputs[src] for src in sources))
+
+    for href in dict.fromkeys(m.group('href') for m in _STYLESHEET.finditer(html)):
+        css = _read_source(href)
+        inputs[href] = content_hash(css)
+        if up_to_date(href, [href]):
+            outputs[href] = old_outputs[href]
+            report[href] = 'cached'
+        else:
+            minified = minify_css(css)
+            outputs[href] = fingerprint(href, minified)
+            _write(outputs[href], minified)
+            report[href] = 'built'
+
+    scripts = list(dict.fromkeys(m.group('src') for m in _SCRIPT.finditer(html)))
+    bundle_key = 'bundle.js:' + ','.join(scripts)
+    for src in scripts:
+        inputs[src] = content_hash(_read_source(src))
+    if scripts:
+        if up_to_date(bundle_key, scripts):
+            outputs[bundle_key] = old_outputs[bundle_key]
+            report[bundle_key] = 'cached'
+        else:
+            bundle = ';\n'.join(minify_js(_read_source(src)) for src in scripts) + ';\n'
+            outputs[bundle_key] = fingerprint('bundle.js', bundle)
+            _write(outputs[bundle_key], bundle)
+            report[bundle_key] = 'built'
+
+    if up_to_date(PAGE, [PAGE]) and outputs == {k: v for k, v in old_outputs.items() if k != PAGE}:
+        outputs[PAGE] = old_outputs[PAGE]
+        report[PAGE] = 'cached'
+    else:
+        page = _STYLESHEET.sub(lambda m: m.group(0).replace(m.group('href'), outputs[m.group('href')]), html)
+        first_script = True
+
+        def replace_script(match: 're.Match[str]') -> str:
+            nonlocal first_script
+            if not first_script:
+                return ''
+            first_script = False
+            return f'<script src="{outputs[bundle_key]}"></script>'
+
+        page = _SCRIPT.sub(replace_script, page)
+        _write(PAGE, page)
+        outputs[PAGE] = PAGE
+        report[PAGE] = 'built'
+
+    # Remove fingerprinted files that no longer belong to the current build.
+    current = set(outputs.values()) | {MANIFEST}
+    for stale in set(old_outputs.values()) - current:
+        (DIST / stale).unlink(missing_ok=True)
+
+    _write(MANIFEST, json.dumps({'inputs': inputs, 'outputs': outputs}, indent=2, sort_keys=True))
+    return report
+
+
+def is_current() -> bool:
+    """True if dist/ holds a complete build of the sources as they are now."""
+    manifest = _load_manifest()
+    inputs, outputs = manifest['inputs'], manifest['outputs']
+    if PAGE not in inputs or PAGE not in outputs:
+        return False
+    for name, digest in inputs.items():
+        try:
+            content = (ROOT / name).read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError):
+            return False
+        if content_hash(content) != digest:
+            return False
+    return all((DIST / name).is_file() for name in outputs.values())
+
+
+def size_report() -> List[Tuple[str, int, int]]:
+    """Return (source, source bytes, built bytes) for each built asset."""
+    outputs = _load_manifest()['outputs']
+    rows = []
+    for key, name in outputs.items():
+        sources = key.split(':', 1)[1].split(',') if key.startswith('bundle.js:') else [key]
+        original = sum((ROOT / src).stat().st_size for src in sources)
+        rows.append((key, original, (DIST / name).stat().st_size))
+    return rows
+
+
+if __name__ == '__main__':
+    for key, status in build().items():
+        print(f'{status:>6}  {key}')
+    for key, before, after in size_report():
+        print(f'{key}: {before} -> {after} bytes')
@@ -0,0 +1,224 @@
+"""
+Local load test for app.py.
+
+Drives GET / and POST /login with concurrent client threads, either straight
+through the WSGI callable (no sockets; measures the app alone) or over HTTP
+against a werkzeug server started on a loopback port. Prints a JSON report with
+throughput, p50/p95/p99 latency and error counts per endpoint, and can diff the
+run against a saved baseline.
+
+Examples:
+    python loadtest.py --clients 8 --requests 500
+    python loadtest.py --mode http --duration 10 --save baseline.json
+    python loadtest.py --mode http --duration 10 --baseline baseline.json
+"""
+import argparse
+import http.client
+import json
+import logging
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+from urllib.parse import urlencode
+
+LOGIN_FORM = {'username': 'loadtest', 'password': 'loadtest-password'}
+ENDPOINTS = ('GET /', 'POST /login')
+METRICS = ('throughput_rps', 'p50_ms', 'p95_ms', 'p99_ms', 'errors')
+
+# Sends one request to an endpoint and returns the HTTP status; raises on transport errors.
+Requester = Callable[[str], int]
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list (0.0 for an empty list)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def _wsgi_requester(flask_app) -> Callable[[], Requester]:
+    def make() -> Requester:
+        client = flask_app.test_client()
+
+        def send(endpoint: str) -> int:
+            if endpoint == 'GET /':
+                return client.get('/').status_code
+            return client.post('/login', data=LOGIN_FORM).status_code
+        return send
+    return make
+
+
+def _http_requester(host: str, port: int) -> Callable[[], Requester]:
+    body = urlencode(LOGIN_FORM)
+    headers = {'Content-Type': 'application/x-www-form-urlencoded'}
+
+    def make() -> Requester:
+        conn = http.client.HTTPConnection(host, port, timeout=10)
+
+        def send(endpoint: str) -> int:
+            nonlocal conn
+            try:
+                if endpoint == 'GET /':
+                    conn.request('GET', '/')
+                else:
+                    conn.request('POST', '/login', body=body, headers=headers)
+                response = conn.getresponse()
+                response.read()
+                return response.status
+            except (OSError, http.client.HTTPException):
+                conn.close()
+                conn = http.client.HTTPConnection(host, port, timeout=10)
+                raise
+        return send
+    return make
+
+
+def _run_endpoint(make_requester: Callable[[], Requester], endpoint: str, clients: int,
+                  requests: Optional[int], duration: Optional[float]) -> Dict[str, float]:
+    latencies: List[float] = []
+    errors = 0
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration if duration else None
+    per_client = [requests // clients + (1 if i < requests % clients else 0)
+                  for i in range(clients)] if requests else [None] * clients
+
+    def worker(quota: Optional[int]) -> None:
+        nonlocal errors
+        send = make_requester()
+        local: List[float] = []
+        local_errors = 0
+        done = 0
+        while (quota is None or done < quota) and (deadline is None or time.perf_counter() < deadline):
+            started = time.perf_counter()
+            try:
+                status = send(endpoint)
+                if status >= 400:
+                    local_errors += 1
+            except Exception:
+                local_errors += 1
+            local.append(time.perf_counter() - started)
+            done += 1
+        with lock:
+            latencies.extend(local)
+            errors += local_errors
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=clients) as pool:
+        list(pool.map(worker, per_client))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        'requests': len(latencies),
+        'errors': errors,
+        'throughput_rps': round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        'p50_ms': round(percentile(latencies, 50) * 1000, 3),
+        'p95_ms': round(percentile(latencies, 95) * 1000, 3),
+        'p99_ms': round(percentile(latencies, 99) * 1000, 3),
+    }
+
+
+def run(mode: str = 'wsgi', clients: int = 4, requests: Optional[int] = 200,
+        duration: Optional[float] = None, endpoints=ENDPOINTS,
+        keep_login_log: bool = False) -> Dict[str, object]:
+    """Run the load test and return the JSON-ready report."""
+    if clients < 1:
+        raise ValueError('clients must be at least 1')
+    if not requests and not duration:
+        raise ValueError('set requests or duration')
+
+    import app as app_module
+
+    login_log = logging.getLogger(app_module.LOGIN_LOG.name)
+    previous_disabled = login_log.disabled
+    login_log.disabled = not keep_login_log
+    server = None
+    try:
+        if mode == 'wsgi':
+            make_requester = _wsgi_requester(app_module.app)
+        elif mode == 'http':
+            from werkzeug.serving import WSGIRequestHandler, make_server
+
+            class QuietHandler(WSGIRequestHandler):
+                # The dev server's per-request access log would dominate the measurement.
+                def log_request(self, *args, **kwargs):
+                    pass
+
+            server = make_server('127.0.0.1', 0, app_module.app, threaded=True,
+                                 request_handler=QuietHandler)
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            make_requester = _http_requester('127.0.0.1', server.server_port)
+        else:
+            raise ValueError(f'Unknown mode: {mode}')
+
+        results = {endpoint: _run_endpoint(make_requester, endpoint, clients, requests, duration)
+                   for endpoint in endpoints}
+    finally:
+        if server is not None:
+            server.shutdown()
+        login_log.disabled = previous_disabled
+
+    return {
+        'config': {'mode': mode, 'clients': clients, 'requests': requests, 'duration': duration},
+        'results': results,
+    }
+
+
+def diff_reports(current: Dict[str, object], baseline: Dict[str, object]) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """Per endpoint and metric: baseline, current, and percentage change."""
+    changes: Dict[str, Dict[str, Dict[str, float]]] = {}
+    for endpoint, metrics in current['results'].items():
+        before = baseline.get('results', {}).get(endpoint)
+        if before is None:
+            continue
+        changes[endpoint] = {}
+        for metric in METRICS:
+            old, new = before.get(metric), metrics.get(metric)
+            if old is None or new is None:
+                continue
+            change = round((new - old) / old * 100, 1) if old else None
+            changes[endpoint][metric] = {'baseline': old, 'current': new, 'change_pct': change}
+    return changes
+
+
+def _parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Load test app.py')
+    parser.add_argument('--mode', choices=('wsgi', 'http'), default='wsgi',
+                        help='call the WSGI app directly or over HTTP on a loopback port')
+    parser.add_argument('--clients', type=int, default=4, help='concurrent client threads')
+    parser.add_argument('--requests', type=int, default=200, help='requests per endpoint')
+    parser.add_argument('--duration', type=float, help='seconds per endpoint (overrides --requests)')
+    parser.add_argument('--endpoint', action='append', choices=ENDPOINTS,
+                        help='endpoint to test (repeatable; default: all)')
+    parser.add_argument('--save', help='write the report to this JSON file')
+    parser.add_argument('--baseline', help='compare against a saved JSON report')
+    parser.add_argument('--keep-login-log', action='store_true',
+                        help="keep app.py's login console log on during the run")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> Dict[str, object]:
+    args = _parse_args(argv)
+    report = run(
+        mode=args.mode,
+        clients=args.clients,
+        requests=None if args.duration else args.requests,
+        duration=args.duration,
+        endpoints=tuple(args.endpoint or ENDPOINTS),
+        keep_login_log=args.keep_login_log,
+    )
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            report['diff'] = diff_reports(report, json.load(f))
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    print(json.dumps(report, indent=2))
+    return report
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+"""
+Helpers that keep slow work off the /login request path in app.py.
+
+- `start_login_logger` routes login messages through a QueueHandler; a
+  QueueListener thread does the actual console write.
+- `PasswordVerifier` runs Assignment_5's PBKDF2 `LoginService.authenticate` on
+  a bounded thread pool. Callers beyond the pool size plus `max_pending` are
+  turned away immediately instead of queueing without limit.
+"""
+import atexit
+import importlib.util
+import logging
+import logging.handlers
+import queue
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from pathlib import Path
+from typing import Optional
+
+LOGIN_MODULE_PATH = Path(__file__).resolve().parent.parent / 'Assignment_5' / 'task1.py'
+
+
+class VerifierBusy(RuntimeError):
+    """Raised when the verification pool is saturated or a check times out."""
+
+
+def start_login_logger(name: str = 'assignment14.login') -> logging.Logger:
+    """Return a logger whose records are written to stdout by a background thread."""
+    logger = logging.getLogger(name)
+    if any(isinstance(h, logging.handlers.QueueHandler) for h in logger.handlers):
+        return logger
+    records: 'queue.SimpleQueue[logging.LogRecord]' = queue.SimpleQueue()
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(logging.Formatter('%(message)s'))
+    listener = logging.handlers.QueueListener(records, console)
+    listener.start()
+    atexit.register(listener.stop)  # flushes queued records on shutdown
+    logger.addHandler(logging.handlers.QueueHandler(records))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    return logger
+
+
+def load_login_module():
+    """Import Assignment_5/task1.py (not a package, so load it by path)."""
+    name = 'assignment5_login'
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, LOGIN_MODULE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module  # dataclasses resolve annotations through sys.modules
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    return module
+
+
+class PasswordVerifier:
+    """Bounded-pool wrapper around a `LoginService`."""
+
+    def __init__(self, service, max_workers: int = 4, max_pending: int = 16,
+                 timeout: float = 5.0) -> None:
+        self.service = service
+        self.timeout = timeout
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='pbkdf2')
+        self._slots = threading.BoundedSemaphore(max_workers + max_pending)
+
+    def verify(self, username: str, password: str) -> bool:
+        """Return the authentication result; raise VerifierBusy when overloaded."""
+        if not self._slots.acquire(blocking=False):
+            raise VerifierBusy('Too many logins in progress')
+        try:
+            future = self._pool.submit(self._authenticate, username, password)
+        except BaseException:
+            self._slots.release()
+            raise
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeout as exc:
+            raise VerifierBusy('Password verification timed out') from exc
+
+    def _authenticate(self, username: str, password: str) -> bool:
+        # Free the slot before the result is published, so a caller returning
+        # from result() always finds it released (a done-callback runs later).
+        try:
+            return self.service.authenticate(username, password)
+        finally:
+            self._slots.release()
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=True)
+
+
+def verifier_from_store(store_path: Optional[str], **options) -> Optional[PasswordVerifier]:
+    """Build a verifier over the credential store at `store_path` (None disables it)."""
+    if not store_path:
+        return None
+    login = load_login_module()
+    service = login.LoginService(login.CredentialStore(Path(store_path)))
+    return PasswordVerifier(service, **options)
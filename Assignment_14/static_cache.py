@@ -0,0 +1,140 @@
+"""
+In-process HTTP cache for the static files served by app.py.
+
+Each file is read once and kept in memory together with a strong ETag and
+pre-compressed gzip/deflate variants. Every request costs one os.stat(); the
+entry is reloaded only when the file's mtime or size changes.
+
+Responses carry:
+- ETag (per encoding) and 304 Not Modified for a matching If-None-Match,
+- Content-Encoding gzip or deflate when Accept-Encoding allows and it is smaller,
+- Cache-Control: immutable for build_assets.py fingerprinted names, no-cache
+  (always revalidate) for everything else.
+"""
+import gzip
+import hashlib
+import mimetypes
+import os
+import re
+import threading
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from flask import Response, abort, request
+from werkzeug.security import safe_join
+
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+REVALIDATE_CACHE_CONTROL = 'no-cache'
+COMPRESSIBLE_TYPES = ('text/', 'application/javascript', 'application/json', 'image/svg+xml')
+MIN_COMPRESS_BYTES = 256
+
+_FINGERPRINTED = re.compile(r'\.[0-9a-f]{10}\.[A-Za-z0-9]+$')
+
+
+@dataclass
+class CacheEntry:
+    """One file held in memory with its validators and encoded variants."""
+
+    mtime_ns: int
+    size: int
+    mimetype: str
+    # encoding ('identity', 'gzip', 'deflate') -> (body, strong etag)
+    variants: Dict[str, Tuple[bytes, str]] = field(default_factory=dict)
+
+
+class StaticCache:
+    """Thread-safe map of filename -> CacheEntry with hit/miss counters."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+        self._entries: Dict[str, CacheEntry] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'not_modified': self.not_modified,
+            'entries': len(self._entries),
+        }
+
+    def _load(self, path: str, st: os.stat_result) -> CacheEntry:
+        with open(path, 'rb') as f:
+            body = f.read()
+        mimetype = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+        digest = hashlib.sha256(body).hexdigest()[:32]
+        entry = CacheEntry(st.st_mtime_ns, st.st_size, mimetype)
+        entry.variants['identity'] = (body, f'"{digest}"')
+        if mimetype.startswith(COMPRESSIBLE_TYPES) and len(body) >= MIN_COMPRESS_BYTES:
+            # mtime=0 keeps the gzip bytes (and so the ETag) stable across reloads.
+            gzipped = gzip.compress(body, compresslevel=9, mtime=0)
+            if len(gzipped) < len(body):
+                entry.variants['gzip'] = (gzipped, f'"{digest}-gzip"')
+            deflated = zlib.compress(body, 9)
+            if len(deflated) < len(body):
+                entry.variants['deflate'] = (deflated, f'"{digest}-deflate"')
+        return entry
+
+    def get(self, filename: str) -> Optional[CacheEntry]:
+        """Return the cached entry for `filename`, (re)loading it if it changed on disk."""
+        path = safe_join(str(self.root), filename)
+        if path is None:
+            return None
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        if not os.path.isfile(path):
+            return None
+
+        entry = self._entries.get(filename)
+        if entry is not None and entry.mtime_ns == st.st_mtime_ns and entry.size == st.st_size:
+            with self._lock:
+                self.hits += 1
+            return entry
+
+        entry = self._load(path, st)
+        with self._lock:
+            self.misses += 1
+            self._entries[filename] = entry
+        return entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def send(self, filename: str) -> Response:
+        """Build the response for `filename` for the current Flask request."""
+        entry = self.get(filename)
+        if entry is None:
+            abort(404)
+
+        encoding = 'identity'
+        accepted = request.accept_encodings
+        for candidate in ('gzip', 'deflate'):
+            if candidate in entry.variants and accepted[candidate]:
+                encoding = candidate
+                break
+        body, etag = entry.variants[encoding]
+
+        if request.if_none_match.contains(etag.strip('"')) or request.if_none_match.star_tag:
+            with self._lock:
+                self.not_modified += 1
+            response = Response(status=304)
+        else:
+            response = Response(body, mimetype=entry.mimetype)
+            if encoding != 'identity':
+                response.headers['Content-Encoding'] = encoding
+
+        response.headers['ETag'] = etag
+        response.headers['Cache-Control'] = (
+            IMMUTABLE_CACHE_CONTROL if _FINGERPRINTED.search(filename) else REVALIDATE_CACHE_CONTROL
+        )
+        if len(entry.variants) > 1:
+            response.headers['Vary'] = 'Accept-Encoding'
+        return response
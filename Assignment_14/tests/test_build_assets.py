@@ -0,0 +1,104 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import build_assets
+
+
+PAGE = ('<html><head><link rel="stylesheet" href="site.css"></head><body>'
+        '<script src="a.js"></script><script src="b.js"></script></body></html>')
+
+
+class TestMinify(unittest.TestCase):
+    def test_css_strips_comments_and_keeps_strings(self):
+        css = '/* note */\nbody  {\n  color: red ;\n  font-family: "Two  Words";\n}\n'
+        self.assertEqual(build_assets.minify_css(css), 'body{color:red;font-family:"Two  Words"}')
+
+    def test_js_drops_comments_and_indentation(self):
+        js = '// header\nfunction f(a,  b) {\n\n    return a + b; /* sum */\n}\n'
+        self.assertEqual(build_assets.minify_js(js), 'function f(a, b) {\nreturn a + b;\n}')
+
+    def test_js_copies_literals_verbatim(self):
+        js = ('var s = "two  spaces";\n'
+              "var q = 'a // not a comment';\n"
+              'var t = `first\n\n    indented  ${x}`;\n'
+              'var r = /a  b\\/c/g;\n')
+        minified = build_assets.minify_js(js)
+        for literal in ('"two  spaces"', "'a // not a comment'",
+                        '`first\n\n    indented  ${x}`', '/a  b\\/c/g'):
+            self.assertIn(literal, minified)
+
+    def test_js_rejects_nul(self):
+        with self.assertRaises(ValueError):
+            build_assets.minify_js('var a = 1;\x00')
+
+
+class TestBuild(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.root = Path(self._tmp.name)
+        self.dist = self.root / 'dist'
+        for name, text in [('task1.html', PAGE), ('site.css', 'body { color: red; }\n'),
+                           ('a.js', 'var a = 1;\n'), ('b.js', 'var b = "x  y";\n')]:
+            (self.root / name).write_text(text, encoding='utf-8')
+        for name, value in [('ROOT', self.root), ('DIST', self.dist)]:
+            patcher = mock.patch.object(build_assets, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def manifest(self):
+        return json.loads((self.dist / 'manifest.json').read_text(encoding='utf-8'))
+
+    def test_build_then_skip_unchanged_inputs(self):
+        first = build_assets.build()
+        self.assertEqual(set(first.values()), {'built'})
+        outputs = self.manifest()['outputs']
+        page = (self.dist / 'task1.html').read_text(encoding='utf-8')
+        self.assertIn(outputs['site.css'], page)
+        self.assertEqual(page.count('<script'), 1)
+        bundle = (self.dist / outputs['bundle.js:a.js,b.js']).read_text(encoding='utf-8')
+        self.assertEqual(bundle, 'var a = 1;;\nvar b = "x  y";;\n')
+
+        with mock.patch.object(build_assets, 'minify_css') as css, \
+                mock.patch.object(build_assets, 'minify_js') as js:
+            second = build_assets.build()
+        self.assertEqual(set(second.values()), {'cached'})
+        css.assert_not_called()
+        js.assert_not_called()
+        self.assertEqual(self.manifest()['outputs'], outputs)
+
+    def test_changed_input_rebuilds_and_removes_stale_output(self):
+        build_assets.build()
+        old_css = self.manifest()['outputs']['site.css']
+        (self.root / 'site.css').write_text('body { color: blue; }\n', encoding='utf-8')
+        report = build_assets.build()
+        self.assertEqual(report['site.css'], 'built')
+        self.assertEqual(report['bundle.js:a.js,b.js'], 'cached')
+        self.assertEqual(report['task1.html'], 'built')
+        new_css = self.manifest()['outputs']['site.css']
+        self.assertNotEqual(new_css, old_css)
+        self.assertFalse((self.dist / old_css).exists())
+        self.assertEqual((self.dist / new_css).read_text(encoding='utf-8'), 'body{color:blue}')
+
+    def test_is_current_tracks_sources_and_outputs(self):
+        self.assertFalse(build_assets.is_current())
+        build_assets.build()
+        self.assertTrue(build_assets.is_current())
+
+        (self.root / 'a.js').write_text('var a = 2;\n', encoding='utf-8')
+        self.assertFalse(build_assets.is_current())
+        build_assets.build()
+        self.assertTrue(build_assets.is_current())
+
+        (self.dist / self.manifest()['outputs']['site.css']).unlink()
+        self.assertFalse(build_assets.is_current())
+        build_assets.build()
+        (self.root / 'site.css').unlink()
+        self.assertFalse(build_assets.is_current())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+import loadtest
+
+
+class TestLoadTest(unittest.TestCase):
+    def test_percentile_nearest_rank(self):
+        values = [float(v) for v in range(1, 101)]
+        self.assertEqual(loadtest.percentile(values, 50), 50.0)
+        self.assertEqual(loadtest.percentile(values, 99), 99.0)
+        self.assertEqual(loadtest.percentile([3.0], 95), 3.0)
+        self.assertEqual(loadtest.percentile([], 50), 0.0)
+
+    def test_wsgi_run(self):
+        report = loadtest.run(mode='wsgi', clients=3, requests=20)
+        for endpoint in loadtest.ENDPOINTS:
+            result = report['results'][endpoint]
+            self.assertEqual(result['requests'], 20)
+            self.assertEqual(result['errors'], 0)
+            self.assertLessEqual(result['p50_ms'], result['p95_ms'])
+            self.assertLessEqual(result['p95_ms'], result['p99_ms'])
+
+    def test_http_run_and_baseline_diff(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            baseline = Path(tmp) / 'baseline.json'
+            first = loadtest.main(['--mode', 'http', '--clients', '2', '--requests', '10',
+                                   '--endpoint', 'GET /', '--save', str(baseline)])
+            self.assertEqual(json.loads(baseline.read_text(encoding='utf-8')), first)
+            second = loadtest.main(['--mode', 'http', '--clients', '2', '--requests', '10',
+                                    '--endpoint', 'GET /', '--baseline', str(baseline)])
+        self.assertEqual(second['results']['GET /']['errors'], 0)
+        change = second['diff']['GET /']['throughput_rps']
+        self.assertEqual(change['baseline'], first['results']['GET /']['throughput_rps'])
+        self.assertIn('change_pct', change)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import logging.handlers
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+import app as app_module
+from login_support import PasswordVerifier, VerifierBusy, load_login_module, verifier_from_store
+
+
+class TestLoginEndpoint(unittest.TestCase):
+    def setUp(self):
+        self.client = app_module.app.test_client()
+        self._verifier = app_module.PASSWORD_VERIFIER
+
+    def tearDown(self):
+        app_module.PASSWORD_VERIFIER = self._verifier
+
+    def test_missing_fields(self):
+        response = self.client.post('/login', data={'username': 'ana', 'password': ' '})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.data,
+            b'<h2>Login error</h2><p>Missing username or password. <a href="/">Back</a></p>',
+        )
+
+    def test_success_is_escaped_and_logged_through_queue(self):
+        response = self.client.post('/login', data={'username': '<b>ana</b>', 'password': 'pw'})
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b'<strong>&lt;b&gt;ana&lt;/b&gt;</strong>', response.data)
+        handlers = app_module.LOGIN_LOG.handlers
+        self.assertTrue(any(isinstance(h, logging.handlers.QueueHandler) for h in handlers))
+
+    def test_password_verification_with_credential_store(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            verifier = verifier_from_store(str(Path(tmp) / 'creds.json'), max_workers=2)
+            verifier.service.store.add_user('ana', 'correct horse')
+            app_module.PASSWORD_VERIFIER = verifier
+            try:
+                ok = self.client.post('/login', data={'username': 'ana', 'password': 'correct horse'})
+                bad = self.client.post('/login', data={'username': 'ana', 'password': 'wrong'})
+                unknown = self.client.post('/login', data={'username': 'bob', 'password': 'x'})
+            finally:
+                verifier.shutdown()
+        self.assertEqual(ok.status_code, 200)
+        self.assertEqual(bad.status_code, 401)
+        self.assertEqual(unknown.status_code, 401)
+
+
+class TestPasswordVerifier(unittest.TestCase):
+    def test_rejects_when_saturated(self):
+        release = threading.Event()
+        started = threading.Event()
+
+        class SlowService:
+            def authenticate(self, username, password):
+                started.set()
+                release.wait(5)
+                return True
+
+        verifier = PasswordVerifier(SlowService(), max_workers=1, max_pending=0, timeout=5)
+        results = []
+        worker = threading.Thread(target=lambda: results.append(verifier.verify('a', 'b')))
+        worker.start()
+        started.wait(5)
+        with self.assertRaises(VerifierBusy):
+            verifier.verify('c', 'd')
+        release.set()
+        worker.join()
+        self.assertEqual(results, [True])
+        # The slot is released once the first check finishes.
+        self.assertTrue(verifier.verify('e', 'f'))
+        verifier.shutdown()
+
+    def test_disabled_without_store(self):
+        self.assertIsNone(verifier_from_store(None))
+        self.assertTrue(hasattr(load_login_module(), 'LoginService'))
+
+
+if __name__ == '__main__':
+    unittest.main()
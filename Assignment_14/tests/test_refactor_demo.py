@@ -0,0 +1,116 @@
+import os
+import stat
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import refactor_demo
+
+
+def mode(path):
+    return stat.S_IMODE(path.stat().st_mode)
+
+
+class TestAtomicWrite(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.root = Path(self._tmp.name)
+
+    def test_new_file_gets_default_mode(self):
+        umask = os.umask(0o022)
+        os.umask(umask)
+        path = self.root / 'new.txt'
+        refactor_demo.atomic_write(path, b'data')
+        self.assertEqual(path.read_bytes(), b'data')
+        self.assertEqual(mode(path), 0o666 & ~umask)
+        self.assertEqual(refactor_demo._UMASK, umask)
+
+    def test_existing_file_keeps_its_mode(self):
+        path = self.root / 'old.txt'
+        path.write_bytes(b'old')
+        path.chmod(0o640)
+        refactor_demo.atomic_write(path, b'new')
+        self.assertEqual(path.read_bytes(), b'new')
+        self.assertEqual(mode(path), 0o640)
+        self.assertEqual([p.name for p in self.root.iterdir()], ['old.txt'])
+
+
+class TestCopyFile(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.root = Path(self._tmp.name)
+        self.src = self.root / 'src.bin'
+        self.data = os.urandom(300_000)
+        self.src.write_bytes(self.data)
+
+    def test_kernel_copy(self):
+        dst = self.root / 'dst.bin'
+        with self.src.open('rb') as fin, dst.open('wb') as fout:
+            copied = refactor_demo._kernel_copy(fin, fout, len(self.data))
+        self.assertEqual(copied, len(self.data))
+        self.assertEqual(dst.read_bytes(), self.data)
+
+    def test_kernel_copy_falls_back_to_sendfile(self):
+        if not hasattr(os, 'sendfile'):
+            self.skipTest('no os.sendfile')
+        dst = self.root / 'dst.bin'
+        with mock.patch.object(os, 'copy_file_range', side_effect=OSError, create=True), \
+                self.src.open('rb') as fin, dst.open('wb') as fout:
+            copied = refactor_demo._kernel_copy(fin, fout, len(self.data))
+        self.assertEqual(copied, len(self.data))
+        self.assertEqual(dst.read_bytes(), self.data)
+
+    def test_copy_file_finishes_a_partial_kernel_copy(self):
+        dst = self.root / 'dst.bin'
+        for copied in (0, 1000):
+            with self.subTest(kernel_copied=copied), \
+                    mock.patch.object(refactor_demo, '_kernel_copy',
+                                      side_effect=self._partial(copied)):
+                refactor_demo.copy_file(self.src, dst)
+                self.assertEqual(dst.read_bytes(), self.data)
+
+    @staticmethod
+    def _partial(count):
+        def copy(fin, fout, size):
+            fout.write(fin.read(count))
+            return count
+        return copy
+
+
+class TestRewriteFiles(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.root = Path(self._tmp.name)
+
+    def test_rewrite_file_statuses_and_backup(self):
+        path = self.root / 'page.html'
+        path.write_text('old', encoding='utf-8')
+        self.assertEqual(refactor_demo.rewrite_file(path, 'old'), 'unchanged')
+        self.assertFalse((self.root / 'page.html.bak').exists())
+
+        self.assertEqual(refactor_demo.rewrite_file(path, 'new'), 'written')
+        self.assertEqual(path.read_text(encoding='utf-8'), 'new')
+        self.assertEqual((self.root / 'page.html.bak').read_text(encoding='utf-8'), 'old')
+
+        with mock.patch('builtins.print'):
+            self.assertEqual(refactor_demo.rewrite_file(self.root / 'missing' / 'x.css', 'x'), 'failed')
+
+    def test_rewrite_files_reports_each_path(self):
+        same, changed = self.root / 'same.css', self.root / 'changed.css'
+        same.write_text('a', encoding='utf-8')
+        changed.write_text('b', encoding='utf-8')
+        missing_dir = self.root / 'nope' / 'c.css'
+        with mock.patch('builtins.print'):
+            results = refactor_demo.rewrite_files(
+                {same: 'a', changed: 'B', missing_dir: 'c'}, backup=False, max_workers=2)
+        self.assertEqual(results, {same: 'unchanged', changed: 'written', missing_dir: 'failed'})
+        self.assertEqual(changed.read_text(encoding='utf-8'), 'B')
+        self.assertFalse((self.root / 'changed.css.bak').exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
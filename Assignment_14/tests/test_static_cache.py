@@ -0,0 +1,96 @@
+import gzip
+import os
+import tempfile
+import unittest
+import zlib
+from pathlib import Path
+
+from flask import Flask
+
+import app as app_module
+from static_cache import StaticCache, IMMUTABLE_CACHE_CONTROL, REVALIDATE_CACHE_CONTROL
+
+
+CSS = 'body { color: #111; }\n' * 40
+
+
+class TestStaticCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        (self.root / 'page.html').write_text('<h1>hi</h1>', encoding='utf-8')
+        (self.root / 'site.0123456789.css').write_text(CSS, encoding='utf-8')
+        self.cache = StaticCache(self.root)
+        flask_app = Flask(__name__, static_folder=None)
+        flask_app.add_url_rule('/<path:filename>', 'static_file', self.cache.send)
+        self.client = flask_app.test_client()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_etag_and_not_modified(self):
+        first = self.client.get('/page.html')
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first.data, b'<h1>hi</h1>')
+        self.assertEqual(first.headers['Cache-Control'], REVALIDATE_CACHE_CONTROL)
+        etag = first.headers['ETag']
+
+        second = self.client.get('/page.html', headers={'If-None-Match': etag})
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(second.data, b'')
+        self.assertEqual(second.headers['ETag'], etag)
+        self.assertEqual(self.cache.stats(), {'hits': 1, 'misses': 1, 'not_modified': 1, 'entries': 1})
+
+        other = self.client.get('/page.html', headers={'If-None-Match': '"stale"'})
+        self.assertEqual(other.status_code, 200)
+
+    def test_compressed_variants(self):
+        plain = self.client.get('/site.0123456789.css')
+        self.assertNotIn('Content-Encoding', plain.headers)
+        self.assertEqual(plain.headers['Cache-Control'], IMMUTABLE_CACHE_CONTROL)
+        self.assertEqual(plain.headers['Vary'], 'Accept-Encoding')
+
+        zipped = self.client.get('/site.0123456789.css', headers={'Accept-Encoding': 'gzip, deflate'})
+        self.assertEqual(zipped.headers['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(zipped.data).decode('utf-8'), CSS)
+        self.assertNotEqual(zipped.headers['ETag'], plain.headers['ETag'])
+
+        deflated = self.client.get('/site.0123456789.css', headers={'Accept-Encoding': 'deflate'})
+        self.assertEqual(deflated.headers['Content-Encoding'], 'deflate')
+        self.assertEqual(zlib.decompress(deflated.data).decode('utf-8'), CSS)
+
+        refused = self.client.get('/site.0123456789.css', headers={'Accept-Encoding': 'gzip;q=0'})
+        self.assertNotIn('Content-Encoding', refused.headers)
+
+    def test_invalidates_on_mtime_change(self):
+        etag = self.client.get('/page.html').headers['ETag']
+        path = self.root / 'page.html'
+        path.write_text('<h1>bye</h1>', encoding='utf-8')
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        response = self.client.get('/page.html', headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, b'<h1>bye</h1>')
+        self.assertEqual(self.cache.misses, 2)
+
+    def test_missing_and_traversal(self):
+        self.assertEqual(self.client.get('/nope.css').status_code, 404)
+        self.assertEqual(self.client.get('/../secret').status_code, 404)
+        self.assertEqual(self.cache.stats()['entries'], 0)
+
+
+class TestAppStaticRoutes(unittest.TestCase):
+    def test_index_is_cached(self):
+        client = app_module.app.test_client()
+        first = client.get('/')
+        self.assertEqual(first.status_code, 200)
+        self.assertIn(b'<html', first.data)
+        again = client.get('/', headers={'If-None-Match': first.headers['ETag']})
+        self.assertEqual(again.status_code, 304)
+        stats = client.get('/_stats/static-cache').get_json()
+        self.assertGreaterEqual(stats['hits'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,359 @@
+"""
+Binary time-series store for IoT sensor readings
+------------------------------------------------
+
+Re-parsing ``iot_sensor.csv`` for every time-range query costs a full text scan
+plus float parsing per row. This module keeps the same data in a compact
+on-disk layout instead:
+
+- One append-only segment file per sensor (``<sensor_id>.seg``) made of
+  fixed-width little-endian records ``(epoch_seconds: int64, temperature:
+  float64, humidity: float64)``. Missing CSV values are stored as NaN.
+- A sparse timestamp index per sensor (``<sensor_id>.idx``) holding
+  ``(epoch_seconds, record_number)`` for every ``INDEX_STRIDE``-th record.
+- Range queries bisect the sparse index, then read the segment through
+  ``mmap`` and only unpack the records that can fall inside the range.
+
+Records within a segment must be appended in non-decreasing timestamp order,
+which is what makes the sparse index valid.
+"""
+
+from __future__ import annotations
+
+import bisect
+import calendar
+import csv
+import math
+import mmap
+import re
+import struct
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+RECORD = struct.Struct("<qdd")
+INDEX_ENTRY = struct.Struct("<qq")
+INDEX_STRIDE = 64
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+_SENSOR_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]+$")
+
+
+@dataclass(frozen=True)
+class Reading:
+    """One sensor reading; ``None`` marks a value missing from the source."""
+
+    timestamp: int
+    sensor_id: str
+    temperature: Optional[float]
+    humidity: Optional[float]
+
+
+def parse_timestamp(value: str) -> int:
+    """Convert a ``YYYY-MM-DD HH:MM:SS`` string (UTC) to epoch seconds."""
+    return calendar.timegm(datetime.strptime(value, TIMESTAMP_FORMAT).timetuple())
+
+
+def _parse_optional_float(value: str) -> Optional[float]:
+    value = value.strip()
+    return float(value) if value else None
+
+
+def _to_stored(value: Optional[float]) -> float:
+    return math.nan if value is None else float(value)
+
+
+def _from_stored(value: float) -> Optional[float]:
+    return None if math.isnan(value) else value
+
+
+class SensorStore:
+    """Directory of per-sensor append-only segments with sparse time indexes."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        # sensor_id -> (indexed timestamps, matching record numbers)
+        self._index_cache: Dict[str, Tuple[List[int], List[int]]] = {}
+
+    def _segment_path(self, sensor_id: str) -> Path:
+        if not _SENSOR_ID_PATTERN.match(sensor_id):
+            raise ValueError(f"Invalid sensor id: {sensor_id!r}")
+        return self.root / f"{sensor_id}.seg"
+
+    def _index_path(self, sensor_id: str) -> Path:
+        return self._segment_path(sensor_id).with_suffix(".idx")
+
+    def sensors(self) -> List[str]:
+        """Return the ids of all sensors that have a segment on disk."""
+        return sorted(path.stem for path in self.root.glob("*.seg"))
+
+    def record_count(self, sensor_id: str) -> int:
+        segment = self._segment_path(sensor_id)
+        if not segment.exists():
+            return 0
+        return segment.stat().st_size // RECORD.size
+
+    def _last_timestamp(self, sensor_id: str, count: int) -> Optional[int]:
+        if not count:
+            return None
+        with self._segment_path(sensor_id).open("rb") as source:
+            source.seek((count - 1) * RECORD.size)
+            return RECORD.unpack(source.read(RECORD.size))[0]
+
+    def append_many(
+        self,
+        sensor_id: str,
+        rows: Iterable[Tuple[int, Optional[float], Optional[float]]],
+    ) -> int:
+        """
+        Append ``(timestamp, temperature, humidity)`` rows to one sensor.
+
+        Raises ValueError if a timestamp is older than the segment's last one.
+        Returns the number of records written.
+        """
+        count = self.record_count(sensor_id)
+        last = self._last_timestamp(sensor_id, count)
+        records = bytearray()
+        index_entries = bytearray()
+        written = 0
+        for timestamp, temperature, humidity in rows:
+            timestamp = int(timestamp)
+            if last is not None and timestamp < last:
+                raise ValueError(
+                    f"Out-of-order timestamp {timestamp} for sensor {sensor_id} "
+                    f"(last stored: {last})"
+                )
+            record_number = count + written
+            if record_number % INDEX_STRIDE == 0:
+                index_entries += INDEX_ENTRY.pack(timestamp, record_number)
+            records += RECORD.pack(timestamp, _to_stored(temperature), _to_stored(humidity))
+            last = timestamp
+            written += 1
+
+        if written:
+            # Segment first: an index entry must never point past the data.
+            with self._segment_path(sensor_id).open("ab") as segment:
+                segment.write(records)
+            if index_entries:
+                with self._index_path(sensor_id).open("ab") as index:
+                    index.write(index_entries)
+            self._index_cache.pop(sensor_id, None)
+        return written
+
+    def append(
+        self,
+        sensor_id: str,
+        timestamp: int,
+        temperature: Optional[float],
+        humidity: Optional[float],
+    ) -> None:
+        self.append_many(sensor_id, [(timestamp, temperature, humidity)])
+
+    def _load_index(self, sensor_id: str) -> Tuple[List[int], List[int]]:
+        cached = self._index_cache.get(sensor_id)
+        if cached is not None:
+            return cached
+        timestamps: List[int] = []
+        record_numbers: List[int] = []
+        index_path = self._index_path(sensor_id)
+        if index_path.exists():
+            for timestamp, record_number in INDEX_ENTRY.iter_unpack(index_path.read_bytes()):
+                timestamps.append(timestamp)
+                record_numbers.append(record_number)
+        self._index_cache[sensor_id] = (timestamps, record_numbers)
+        return timestamps, record_numbers
+
+    def query(self, sensor_id: str, start: int, end: int) -> List[Reading]:
+        """Return readings with ``start <= timestamp < end`` in time order."""
+        count = self.record_count(sensor_id)
+        if not count or start >= end:
+            return []
+
+        timestamps, record_numbers = self._load_index(sensor_id)
+        # Last indexed block starting strictly before `start`; equal timestamps
+        # may spill over from the previous block, so bisect_left is required.
+        slot = bisect.bisect_left(timestamps, start) - 1
+        first_record = record_numbers[slot] if slot >= 0 else 0
+
+        results: List[Reading] = []
+        with self._segment_path(sensor_id).open("rb") as segment:
+            with mmap.mmap(segment.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                for offset in range(first_record * RECORD.size, count * RECORD.size, RECORD.size):
+                    timestamp, temperature, humidity = RECORD.unpack_from(view, offset)
+                    if timestamp < start:
+                        continue
+                    if timestamp >= end:
+                        break
+                    results.append(
+                        Reading(
+                            timestamp,
+                            sensor_id,
+                            _from_stored(temperature),
+                            _from_stored(humidity),
+                        )
+                    )
+        return results
+
+
+def import_csv(csv_path: Path, store: SensorStore) -> int:
+    """
+    Load an ``iot_sensor.csv``-style file into ``store``.
+
+    Rows are grouped per sensor and sorted by time before appending so that
+    unsorted input still produces valid segments. Returns rows imported.
+    """
+    per_sensor: Dict[str, List[Tuple[int, Optional[float], Optional[float]]]] = {}
+    with Path(csv_path).open("r", encoding="utf-8", newline="") as source:
+        for row in csv.DictReader(source):
+            per_sensor.setdefault(row["sensor_id"].strip(), []).append(
+                (
+                    parse_timestamp(row["timestamp"]),
+                    _parse_optional_float(row["temperature"]),
+                    _parse_optional_float(row["humidity"]),
+                )
+            )
+
+    imported = 0
+    for sensor_id, rows in per_sensor.items():
+        rows.sort(key=lambda item: item[0])
+        imported += store.append_many(sensor_id, rows)
+    return imported
+
+
+def scan_csv_range(csv_path: Path, sensor_id: str, start: int, end: int) -> List[Reading]:
+    """Baseline query: parse the whole CSV and filter (what callers did before)."""
+    results: List[Reading] = []
+    with Path(csv_path).open("r", encoding="utf-8", newline="") as source:
+        for row in csv.DictReader(source):
+            if row["sensor_id"].strip() != sensor_id:
+                continue
+            timestamp = parse_timestamp(row["timestamp"])
+            if start <= timestamp < end:
+                results.append(
+                    Reading(
+                        timestamp,
+                        sensor_id,
+                        _parse_optional_float(row["temperature"]),
+                        _parse_optional_float(row["humidity"]),
+                    )
+                )
+    results.sort(key=lambda reading: reading.timestamp)
+    return results
+
+
+def _write_synthetic_csv(path: Path, rows: int, sensors: int = 3) -> None:
+    base = parse_timestamp("2025-02-01 00:00:00")
+    with path.open("w", encoding="utf-8", newline="") as target:
+        writer = csv.writer(target)
+        writer.writerow(["timestamp", "sensor_id", "temperature", "humidity"])
+        for i in range(rows):
+            stamp = time.strftime(TIMESTAMP_FORMAT, time.gmtime(base + i * 60))
+            temperature = "" if i % 7 == 0 else f"{20 + i % 11}.0"
+            humidity = "" if i % 5 == 0 else f"{40 + i % 13}.0"
+            writer.writerow([stamp, f"S{i % sensors + 1}", temperature, humidity])
+
+
+def benchmark(rows: int = 200_000, queries: int = 20) -> Dict[str, float]:
+    """
+    Compare range-query latency of CSV scans against the binary store.
+
+    Generates a synthetic CSV of ``rows`` minute-spaced readings, imports it,
+    then times ``queries`` one-hour range lookups with each approach.
+    """
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = Path(tmp) / "sensors.csv"
+        _write_synthetic_csv(csv_path, rows)
+        store = SensorStore(Path(tmp) / "store")
+
+        started = time.perf_counter()
+        import_csv(csv_path, store)
+        import_seconds = time.perf_counter() - started
+
+        base = parse_timestamp("2025-02-01 00:00:00")
+        span = rows * 60
+        windows = [
+            (base + span * k // queries, base + span * k // queries + 3600)
+            for k in range(queries)
+        ]
+
+        started = time.perf_counter()
+        for start, end in windows:
+            scan_csv_range(csv_path, "S1", start, end)
+        csv_seconds = (time.perf_counter() - started) / queries
+
+        started = time.perf_counter()
+        for start, end in windows:
+            store.query("S1", start, end)
+        store_seconds = (time.perf_counter() - started) / queries
+
+    return {
+        "rows": rows,
+        "import_seconds": import_seconds,
+        "csv_query_ms": csv_seconds * 1000,
+        "store_query_ms": store_seconds * 1000,
+        "speedup": csv_seconds / store_seconds if store_seconds else math.inf,
+    }
+
+
+def test_sensor_store():
+    """Round-trip the bundled CSV and compare every query with a CSV scan."""
+    import tempfile
+
+    csv_path = Path(__file__).parent / "iot_sensor.csv"
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SensorStore(Path(tmp))
+        assert import_csv(csv_path, store) == 50
+        assert store.sensors() == ["S1", "S2", "S3"]
+
+        day_one = parse_timestamp("2025-02-01 00:00:00")
+        day_two = parse_timestamp("2025-02-02 00:00:00")
+        for sensor_id in store.sensors():
+            for start, end in [(day_one, day_two), (day_one, day_one + 3 * 86400),
+                               (day_two + 3600, day_two + 7200), (day_two, day_one)]:
+                assert store.query(sensor_id, start, end) == scan_csv_range(
+                    csv_path, sensor_id, start, end
+                )
+
+        # Missing humidity is preserved as None, not NaN.
+        first_s3 = store.query("S3", day_one, day_one + 7200)[0]
+        assert first_s3.temperature == 30.0 and first_s3.humidity is None
+
+        # Out-of-order appends are rejected.
+        try:
+            store.append("S1", day_one, 20.0, 40.0)
+            assert False, "Out-of-order append should fail"
+        except ValueError:
+            pass
+
+        # Queries that cross several sparse-index blocks.
+        store.append_many("S9", [(day_one + i, float(i), None) for i in range(INDEX_STRIDE * 5)])
+        window = store.query("S9", day_one + 70, day_one + 200)
+        assert [r.temperature for r in window] == [float(i) for i in range(70, 200)]
+
+        try:
+            store.append("../evil", day_one, 1.0, 1.0)
+            assert False, "Path-like sensor ids should fail"
+        except ValueError:
+            pass
+
+    print("All SensorStore tests passed! ✓")
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--bench", type=int, metavar="ROWS",
+                        help="benchmark range queries on a synthetic CSV of ROWS readings")
+    args = parser.parse_args()
+
+    if args.bench:
+        print(json.dumps(benchmark(args.bench), indent=2))
+    else:
+        test_sensor_store()
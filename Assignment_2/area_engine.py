@@ -0,0 +1,396 @@
+"""Columnar, NumPy-vectorised area engine for large shape files.
+
+``task3.calculate_areas_from_lines`` builds a tuple per line and evaluates each
+formula through an if-chain. Here each batch is tokenised by one ``split`` of
+its joined text (per-line token counts come from a vectorised pass over the
+bytes), all of its numbers go through ``float`` in a single pass, arguments are
+gathered into per-shape arrays, every shape's formula is evaluated over its whole
+array at once, and errors are kept as a compact integer code per row plus a
+table of distinct messages. Batches stream straight to JSONL or CSV.
+
+Two formula sets are available:
+  - ``'task3'``: the shapes and messages of ``task3.area_for_shape``.
+  - ``'assignment13'``: the ``_AREA_DISPATCH`` shapes of ``calculate_area`` in
+    ``Assignment_13/task1 (2).py`` (circle uses 3.14; one or two numbers, the
+    second defaulting to 0).
+
+Each vectorised formula applies the same operations in the same order as the
+scalar code, so areas are bit-for-bit identical.
+"""
+import csv
+import json
+import math
+from dataclasses import dataclass
+from itertools import compress, islice, repeat
+from operator import methodcaller, not_
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+import numpy as np
+
+DEFAULT_BATCH_SIZE = 1_000_000
+
+# shape -> (accepted argument counts, formula over columns, message for a bad count)
+Formula = Tuple[Tuple[int, ...], Callable[..., np.ndarray], Optional[str]]
+
+
+@dataclass(frozen=True)
+class FormulaSet:
+    """Shapes plus the error wording of the scalar implementation they mirror."""
+
+    formulas: Dict[str, Formula]
+    unsupported: str
+    # Argument counts checked before the shape lookup (a positional call signature).
+    call_arity: Optional[Tuple[int, ...]] = None
+
+
+TASK3 = FormulaSet(
+    formulas={
+        'circle': ((1,), lambda r: math.pi * r * r, 'circle requires 1 argument: radius'),
+        'rectangle': ((2,), lambda w, h: w * h, 'rectangle requires 2 arguments: width height'),
+        'square': ((1,), lambda s: s * s, 'square requires 1 argument: side'),
+        'triangle': ((2,), lambda b, h: 0.5 * b * h, 'triangle requires 2 arguments: base height'),
+        'ellipse': ((2,), lambda a, b: math.pi * a * b, 'ellipse requires 2 arguments: a b'),
+        'trapezoid': ((3,), lambda a, b, h: 0.5 * (a + b) * h,
+                      'trapezoid requires 3 arguments: a b height'),
+    },
+    unsupported='unsupported shape: {shape}',
+)
+
+# Mirrors Assignment_13 calculate_area(shape, x, y=0): a missing y is 0, and a
+# wrong number of numbers fails in the call itself, before the shape lookup.
+ASSIGNMENT13 = FormulaSet(
+    formulas={
+        'rectangle': ((1, 2), lambda length, width: length * width, None),
+        'square': ((1, 2), lambda side, _: side * side, None),
+        'circle': ((1, 2), lambda radius, _: 3.14 * radius * radius, None),
+    },
+    unsupported='Unsupported shape: {shape}',
+    call_arity=(1, 2),
+)
+
+FORMULA_SETS = {'task3': TASK3, 'assignment13': ASSIGNMENT13}
+
+
+def _call_arity_message(count: int) -> str:
+    if count == 0:
+        return "calculate_area() missing 1 required positional argument: 'x'"
+    return f"calculate_area() takes from 2 to 3 positional arguments but {count + 1} were given"
+
+
+class ErrorTable:
+    """Interns error messages; code 0 means 'no error', code k is messages[k - 1]."""
+
+    def __init__(self) -> None:
+        self.messages: List[str] = []
+        self._codes: Dict[str, int] = {}
+
+    def code(self, message: str) -> int:
+        code = self._codes.get(message)
+        if code is None:
+            self.messages.append(message)
+            code = self._codes[message] = len(self.messages)
+        return code
+
+    def message(self, code: int) -> Optional[str]:
+        return self.messages[code - 1] if code else None
+
+
+@dataclass
+class AreaBatch:
+    """Results for one batch of non-blank, non-comment lines, in input order."""
+
+    lines: List[str]
+    areas: np.ndarray        # float64, NaN where error_codes != 0
+    error_codes: np.ndarray  # uint32 codes into `errors`
+    errors: ErrorTable
+
+    @property
+    def error_mask(self) -> np.ndarray:
+        return self.error_codes != 0
+
+    def rows(self) -> Iterator[Tuple[str, Optional[float], Optional[str]]]:
+        """Yield ``(line, area, error)`` tuples like ``calculate_areas_from_lines``."""
+        areas = self.areas.tolist()
+        for line, area, code in zip(self.lines, areas, self.error_codes.tolist()):
+            if code:
+                yield line, None, self.errors.messages[code - 1]
+            else:
+                yield line, area, None
+
+
+def _scalar_row(parts: List[str], formula_set: FormulaSet) -> Tuple[Optional[float], Optional[str]]:
+    """Evaluate one tokenised line exactly as the scalar implementation would."""
+    try:
+        nums = list(map(float, parts[1:]))
+    except ValueError as e:
+        return None, str(e)
+    count = len(nums)
+    call_arity = formula_set.call_arity
+    if call_arity is not None and count not in call_arity:
+        return None, _call_arity_message(count)
+    formula = formula_set.formulas.get(parts[0].lower())
+    if formula is None:
+        return None, formula_set.unsupported.format(shape=parts[0])
+    accepted, compute, arity_message = formula
+    if count not in accepted:
+        return None, arity_message
+    return compute(*nums, *[0.0] * (max(accepted) - count)), None
+
+
+# Bytes that str.split() treats as whitespace in ASCII text.
+_ASCII_SPACE = np.zeros(256, dtype=bool)
+_ASCII_SPACE[[9, 10, 11, 12, 13, 28, 29, 30, 31, 32]] = True
+
+
+def _token_counts(text: str, lines: List[str]) -> np.ndarray:
+    """Tokens per line of ``text = '\\n'.join(lines)``, as ``str.split`` counts them."""
+    breaks = len(lines) - 1
+    if text.isascii() and text.count('\n') == breaks:
+        buf = np.frombuffer(text.encode('ascii'), dtype=np.uint8)
+        if np.count_nonzero(buf < 32) == breaks:
+            space = buf <= 32  # the only control bytes are the line breaks
+        else:
+            space = _ASCII_SPACE[buf]
+        is_start = ~space
+        is_start[1:] &= space[:-1]
+        starts = np.flatnonzero(is_start)
+        # Tokens before each line break, then per-line differences.
+        before_break = np.searchsorted(starts, np.flatnonzero(buf == 10))
+        return np.diff(before_break, prepend=0, append=starts.size)
+    # Unicode whitespace or a line with an embedded newline: count per line.
+    return np.fromiter(map(len, map(str.split, lines)), dtype=np.intp, count=len(lines))
+
+
+def _parse_floats(tokens: Iterable[str]) -> Tuple[List[float], List[int]]:
+    """float() every token in one C-level pass; returns (values, indices of bad tokens).
+
+    A bad token stops ``list.extend`` with the values parsed so far kept, so it
+    costs one exception; it is recorded as 0.0 and parsing resumes after it.
+    """
+    values: List[float] = []
+    bad: List[int] = []
+    tokens = iter(tokens)
+    while True:
+        try:
+            values.extend(map(float, tokens))
+            return values, bad
+        except ValueError:
+            bad.append(len(values))
+            values.append(0.0)
+
+
+def _evaluate(lines: List[str], text: str, formula_set: FormulaSet, errors: ErrorTable) -> AreaBatch:
+    """Evaluate non-blank, non-comment `lines`; `text` is ``'\\n'.join(lines)``."""
+    n = len(lines)
+    areas = np.full(n, np.nan)
+    codes = np.zeros(n, dtype=np.uint32)
+    # One split for the whole batch; every line contributes at least its name.
+    tokens = text.split()
+    counts = _token_counts(text, lines)
+    first = np.zeros(n, dtype=np.intp)
+    np.cumsum(counts[:-1], out=first[1:])
+    arg_counts = counts - 1
+    is_name = np.zeros(len(tokens), dtype=bool)
+    is_name[first] = True
+
+    shape_ids = {shape: i for i, shape in enumerate(formula_set.formulas)}
+    names = map(tokens.__getitem__, first.tolist())
+    shapes = np.fromiter(map(shape_ids.get, names, repeat(-1)), dtype=np.intp, count=n)
+    # Only names that miss the exact lookup pay for lower().
+    for row in np.flatnonzero(shapes < 0).tolist():
+        shapes[row] = shape_ids.get(tokens[first[row]].lower(), -1)
+
+    values, bad = _parse_floats(compress(tokens, (~is_name).tolist()))
+    values = np.array(values, dtype=np.float64)
+    # Index into `values` of each line's first argument.
+    arg_start = first - np.arange(n)
+    usable = np.ones(n, dtype=bool)
+    if bad:
+        bad = np.array(bad)
+        bad_rows = np.searchsorted(arg_start, bad, side='right') - 1
+        usable[bad_rows] = False
+    done = np.zeros(n, dtype=bool)
+
+    for shape_id, (accepted, compute, _) in enumerate(formula_set.formulas.values()):
+        is_shape = (shapes == shape_id) & usable
+        if not is_shape.any():
+            continue
+        width = max(accepted)
+        for count in accepted:
+            rows = np.flatnonzero(is_shape & (arg_counts == count))
+            if not rows.size:
+                continue
+            starts = arg_start[rows]
+            args = [values[starts + k] for k in range(count)]
+            args += [np.zeros(rows.size)] * (width - count)
+            areas[rows] = compute(*args)
+            done[rows] = True
+
+    # Everything left is an error row, classified in the scalar code's order
+    # as groups of rows sharing one message.
+    groups: List[Tuple[np.ndarray, str]] = []
+    # A bad number comes first: float()'s message for the row's first bad token.
+    if len(bad):
+        rows, first_bad = np.unique(bad_rows, return_index=True)
+        by_token: Dict[str, List[int]] = {}
+        # Number k of row r is token k + r + 1 (r names before it, plus its own).
+        for row, index in zip(rows.tolist(), (bad[first_bad] + rows + 1).tolist()):
+            by_token.setdefault(tokens[index], []).append(row)
+        for token, token_rows in by_token.items():
+            groups.append((np.array(token_rows), _scalar_row(['', token], formula_set)[1]))
+    left = ~done & usable
+    if formula_set.call_arity is not None:
+        for count in np.unique(arg_counts[left]).tolist():
+            if count not in formula_set.call_arity:
+                rows = np.flatnonzero(left & (arg_counts == count))
+                groups.append((rows, _call_arity_message(count)))
+                left[rows] = False
+    unknown: Dict[str, List[int]] = {}
+    for row in np.flatnonzero(left & (shapes < 0)).tolist():
+        unknown.setdefault(tokens[first[row]], []).append(row)
+    groups.extend((np.array(rows), formula_set.unsupported.format(shape=name))
+                  for name, rows in unknown.items())
+    # The rest are known shapes with an argument count they do not accept.
+    for shape_id, (_, _, arity_message) in enumerate(formula_set.formulas.values()):
+        rows = np.flatnonzero(left & (shapes == shape_id))
+        if rows.size:
+            groups.append((rows, arity_message))
+    # Intern messages in order of first occurrence, as a row-by-row pass would.
+    for rows, message in sorted(groups, key=lambda group: int(group[0][0])):
+        codes[rows] = errors.code(message)
+    return AreaBatch(lines, areas, codes, errors)
+
+
+def iter_area_batches(lines: Iterable[str], batch_size: int = DEFAULT_BATCH_SIZE,
+                      formulas: str = 'task3') -> Iterator[AreaBatch]:
+    """Stream `lines` (e.g. an open file) into evaluated batches.
+
+    Each batch covers up to `batch_size` input lines; blank lines and lines
+    starting with '#' are skipped, as in task3, so a batch may hold fewer. All batches
+    share one ErrorTable, so error codes are comparable across the whole run.
+    """
+    try:
+        formula_set = FORMULA_SETS[formulas]
+    except KeyError as exc:
+        raise ValueError(f"unknown formula set: {formulas}") from exc
+    errors = ErrorTable()
+    is_comment = methodcaller('startswith', '#')
+    lines = iter(lines)
+    while True:
+        chunk = list(islice(lines, batch_size))
+        if not chunk:
+            return
+        kept = list(filter(None, map(str.strip, chunk)))
+        text = '\n'.join(kept)
+        if text.startswith('#') or '\n#' in text:
+            kept = list(compress(kept, map(not_, map(is_comment, kept))))
+            text = '\n'.join(kept)
+        if kept:
+            yield _evaluate(kept, text, formula_set, errors)
+
+
+def calculate_areas_columnar(lines: Iterable[str], formulas: str = 'task3'
+                             ) -> List[Tuple[str, Optional[float], Optional[str]]]:
+    """Drop-in equivalent of ``calculate_areas_from_lines`` built on the batch engine."""
+    return [row for batch in iter_area_batches(lines, formulas=formulas) for row in batch.rows()]
+
+
+def write_jsonl(batches: Iterable[AreaBatch], out: TextIO) -> int:
+    """Write one ``{"line", "area", "error"}`` object per row; returns rows written."""
+    written = 0
+    dumps = json.dumps
+    for batch in batches:
+        out.writelines(
+            dumps({'line': line, 'area': area, 'error': error}) + '\n'
+            for line, area, error in batch.rows()
+        )
+        written += len(batch.lines)
+    return written
+
+
+def write_csv(batches: Iterable[AreaBatch], out: TextIO) -> int:
+    """Write ``line,area,error`` rows (empty cell for missing values); returns rows written."""
+    writer = csv.writer(out)
+    writer.writerow(['line', 'area', 'error'])
+    written = 0
+    for batch in batches:
+        writer.writerows(
+            (line, '' if area is None else repr(area), error or '')
+            for line, area, error in batch.rows()
+        )
+        written += len(batch.lines)
+    return written
+
+
+def process_file(in_path: str, out_path: str, fmt: str = 'jsonl', formulas: str = 'task3',
+                 batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+    """Stream a shape file to JSONL or CSV without holding more than one batch."""
+    writers = {'jsonl': write_jsonl, 'csv': write_csv}
+    if fmt not in writers:
+        raise ValueError(f"unknown output format: {fmt}")
+    with open(in_path, 'r', encoding='utf-8-sig') as src, \
+            open(out_path, 'w', encoding='utf-8', newline='') as dst:
+        return writers[fmt](iter_area_batches(src, batch_size, formulas), dst)
+
+
+def benchmark(n: int = 1_000_000, error_rate: float = 0.0, repeat: int = 3,
+              seed: int = 0) -> Dict[str, float]:
+    """Best-of-`repeat` seconds for task3 against this engine on `n` random lines.
+
+    ``engine_batches`` stops at the columnar AreaBatch arrays;
+    ``engine_rows`` also builds task3's list of tuples. A fraction
+    `error_rate` of the lines is malformed (bad number, unknown shape or
+    wrong argument count).
+    """
+    import random
+    import time
+
+    from task3 import calculate_areas_from_lines
+
+    rng = random.Random(seed)
+    shapes = [(name, accepted[0]) for name, (accepted, _, _) in TASK3.formulas.items()]
+    malformed = ['hexagon 1 2', 'circle x', 'rectangle 1', 'square 1 2 3']
+    lines = []
+    for _ in range(n):
+        if rng.random() < error_rate:
+            lines.append(rng.choice(malformed))
+        else:
+            shape, count = rng.choice(shapes)
+            lines.append(' '.join([shape] + [str(round(rng.uniform(0, 100), 3)) for _ in range(count)]))
+
+    runs = {
+        'task3': lambda: calculate_areas_from_lines(lines),
+        'engine_batches': lambda: list(iter_area_batches(lines)),
+        'engine_rows': lambda: calculate_areas_columnar(lines),
+    }
+    results: Dict[str, float] = {'n': n, 'error_rate': error_rate}
+    for label, run in runs.items():
+        best = math.inf
+        for _ in range(repeat):
+            started = time.perf_counter()
+            run()
+            best = min(best, time.perf_counter() - started)
+        results[f'{label}_seconds'] = best
+    return results
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Compute shape areas in vectorised batches')
+    parser.add_argument('input', nargs='?', help='shape file: "shape num num ..." per line')
+    parser.add_argument('output', nargs='?', help='JSONL or CSV output path')
+    parser.add_argument('--format', choices=('jsonl', 'csv'), default='jsonl')
+    parser.add_argument('--formulas', choices=sorted(FORMULA_SETS), default='task3')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument('--bench', type=int, metavar='N', nargs='?', const=1_000_000,
+                        help='benchmark against task3 on N lines (default 10^6) instead')
+    args = parser.parse_args()
+    if args.bench:
+        for error_rate in (0.0, 0.1):
+            print(json.dumps(benchmark(args.bench, error_rate)))
+        raise SystemExit(0)
+    if not args.output:
+        parser.error('input and output paths are required')
+    count = process_file(args.input, args.output, args.format, args.formulas, args.batch_size)
+    print(f"Wrote {count} rows to {args.output}")
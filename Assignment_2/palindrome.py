@@ -0,0 +1,201 @@
+"""Palindrome checks and analytics for large text corpora.
+
+Normalisation goes through a single ``str.translate`` table per option set
+instead of building a filtered character list per call, and the substring
+queries use Manacher's algorithm so they stay linear in the text length.
+
+The keyword options match ``task2.is_palindrome``; ``is_sentence_palindrome``
+reproduces the ASCII-only rules of ``Assignment_8/TASK3.PY``.
+"""
+from functools import lru_cache
+from typing import Iterable, List, Optional, Tuple
+
+
+class _NormalizeTable(dict):
+    """Lazily filled ``str.translate`` table.
+
+    Maps a code point to ``None`` (drop it), to its lower-case form, or to
+    itself. Each code point is classified once and then cached, so the table
+    only ever holds the characters actually seen.
+    """
+
+    def __init__(self, ignore_spaces: bool, ignore_case: bool,
+                 alphanumeric_only: bool, ascii_only: bool) -> None:
+        super().__init__()
+        self.ignore_spaces = ignore_spaces
+        self.ignore_case = ignore_case
+        self.alphanumeric_only = alphanumeric_only
+        self.ascii_only = ascii_only
+
+    def __missing__(self, code: int) -> Optional[str]:
+        ch = chr(code)
+        keep = True
+        if ch.isspace() and self.ignore_spaces:
+            keep = False
+        elif self.alphanumeric_only:
+            keep = ch.isalnum() and (ch.isascii() or not self.ascii_only)
+        mapped = (ch.lower() if self.ignore_case else ch) if keep else None
+        self[code] = mapped
+        return mapped
+
+
+# The only code point whose lower-case form is more than one character; it is
+# compared as a single unit, like the per-character list in task2.
+_EXPANDING_UPPER = '\u0130'
+
+
+@lru_cache(maxsize=None)
+def _table(ignore_spaces: bool, ignore_case: bool,
+           alphanumeric_only: bool, ascii_only: bool = False) -> _NormalizeTable:
+    return _NormalizeTable(ignore_spaces, ignore_case, alphanumeric_only, ascii_only)
+
+
+def _check(s: str, table: _NormalizeTable) -> bool:
+    if table.ignore_case and _EXPANDING_UPPER in s:
+        units = [unit for unit in (ch.translate(table) for ch in s) if unit]
+        return units == units[::-1]
+    cleaned = s.translate(table)
+    return cleaned == cleaned[::-1]
+
+
+def normalize(s: str,
+              *,
+              ignore_spaces: bool = True,
+              ignore_case: bool = True,
+              alphanumeric_only: bool = True) -> str:
+    """Return `s` reduced to the characters a palindrome check compares."""
+    return s.translate(_table(ignore_spaces, ignore_case, alphanumeric_only))
+
+
+def is_palindrome(s: str,
+                  *,
+                  ignore_spaces: bool = True,
+                  ignore_case: bool = True,
+                  alphanumeric_only: bool = True) -> bool:
+    """Return True if `s` is a palindrome; same rules as ``task2.is_palindrome``.
+
+    Non-string input (including None) returns False.
+    """
+    if not isinstance(s, str):
+        return False
+    return _check(s, _table(ignore_spaces, ignore_case, alphanumeric_only))
+
+
+def is_sentence_palindrome(sentence: str) -> bool:
+    """Return True if `sentence` is a palindrome over its ASCII letters and digits."""
+    if not isinstance(sentence, str):
+        return False
+    cleaned = sentence.translate(_table(True, True, True, True))
+    return cleaned == cleaned[::-1]
+
+
+def is_palindrome_many(texts: Iterable[str],
+                       *,
+                       ignore_spaces: bool = True,
+                       ignore_case: bool = True,
+                       alphanumeric_only: bool = True) -> List[bool]:
+    """Check every string in `texts`, resolving the translate table only once.
+
+    Examples:
+        is_palindrome_many(['Racecar', 'hello', None]) -> [True, False, False]
+    """
+    table = _table(ignore_spaces, ignore_case, alphanumeric_only)
+    return [isinstance(s, str) and _check(s, table) for s in texts]
+
+
+def _manacher(t: str) -> Tuple[List[int], List[int]]:
+    """Return Manacher radii for `t`.
+
+    ``odd[i]`` is the number of odd-length palindromes centred on ``t[i]``;
+    ``even[i]`` is the number of even-length palindromes centred between
+    ``t[i - 1]`` and ``t[i]``.
+    """
+    n = len(t)
+    odd = [0] * n
+    left, right = 0, -1
+    for i in range(n):
+        k = 1 if i > right else min(odd[left + right - i], right - i + 1)
+        while i - k >= 0 and i + k < n and t[i - k] == t[i + k]:
+            k += 1
+        odd[i] = k
+        if i + k - 1 > right:
+            left, right = i - k + 1, i + k - 1
+
+    even = [0] * n
+    left, right = 0, -1
+    for i in range(n):
+        k = 0 if i > right else min(even[left + right - i + 1], right - i + 1)
+        while i - k - 1 >= 0 and i + k < n and t[i - k - 1] == t[i + k]:
+            k += 1
+        even[i] = k
+        if i + k - 1 > right:
+            left, right = i - k, i + k - 1
+    return odd, even
+
+
+def longest_palindromic_substring(s: str,
+                                  *,
+                                  ignore_spaces: bool = True,
+                                  ignore_case: bool = True,
+                                  alphanumeric_only: bool = True) -> str:
+    """Return the longest palindromic stretch of `s` under the given rules.
+
+    The palindrome is found on the normalised text, and the matching slice of
+    the original string is returned (so punctuation inside it is kept). Ties
+    go to the leftmost occurrence; an empty string is returned if nothing
+    survives normalisation.
+
+    Examples:
+        longest_palindromic_substring('xx Never odd or even!') -> 'Never odd or even'
+    """
+    if not isinstance(s, str):
+        return ''
+    table = _table(ignore_spaces, ignore_case, alphanumeric_only)
+    chars: List[str] = []
+    origin: List[int] = []
+    for index, ch in enumerate(s):
+        mapped = ch.translate(table)
+        chars.extend(mapped)
+        origin.extend([index] * len(mapped))
+    if not chars:
+        return ''
+
+    odd, even = _manacher(''.join(chars))
+    best_start, best_len = 0, 0
+    for i in range(len(chars)):
+        length = 2 * odd[i] - 1
+        if length > best_len:
+            best_start, best_len = i - odd[i] + 1, length
+        length = 2 * even[i]
+        if length > best_len:
+            best_start, best_len = i - even[i], length
+    return s[origin[best_start]:origin[best_start + best_len - 1] + 1]
+
+
+def count_palindromic_substrings(s: str,
+                                 *,
+                                 ignore_spaces: bool = True,
+                                 ignore_case: bool = True,
+                                 alphanumeric_only: bool = True) -> int:
+    """Count non-empty palindromic substrings of the normalised text, by position.
+
+    Examples:
+        count_palindromic_substrings('aaa') -> 6
+    """
+    if not isinstance(s, str):
+        return 0
+    odd, even = _manacher(s.translate(_table(ignore_spaces, ignore_case, alphanumeric_only)))
+    return sum(odd) + sum(even)
+
+
+if __name__ == '__main__':
+    samples = [
+        'racecar',
+        'A man, a plan, a canal: Panama',
+        'No lemon, no melon',
+        'not a palindrome',
+    ]
+    print(is_palindrome_many(samples))
+    for s in samples:
+        print(f"{s!r}: longest={longest_palindromic_substring(s)!r}, "
+              f"count={count_palindromic_substrings(s)}")
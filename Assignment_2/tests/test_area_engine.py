@@ -0,0 +1,130 @@
+import csv
+import importlib.util
+import io
+import json
+import math
+import random
+import unittest
+from pathlib import Path
+
+from area_engine import (
+    calculate_areas_columnar,
+    iter_area_batches,
+    process_file,
+    write_csv,
+    write_jsonl,
+)
+from task3 import calculate_areas_from_lines
+
+
+def _load_calculate_area():
+    path = Path(__file__).resolve().parents[2] / 'Assignment_13' / 'task1 (2).py'
+    spec = importlib.util.spec_from_file_location('assignment13_task1', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.calculate_area
+
+
+def _assignment13_reference(lines):
+    calculate_area = _load_calculate_area()
+    results = []
+    for raw in lines:
+        line = raw.strip()
+        if not line or line.startswith('#'):
+            continue
+        parts = line.split()
+        try:
+            results.append((line, calculate_area(parts[0], *map(float, parts[1:])), None))
+        except Exception as e:
+            results.append((line, None, str(e)))
+    return results
+
+
+def _random_lines(rng, shapes, count):
+    lines = []
+    for _ in range(count):
+        shape = rng.choice(shapes)
+        if rng.random() < 0.3:
+            shape = shape.upper()
+        numbers = [repr(rng.uniform(-50, 50)) for _ in range(rng.randint(0, 4))]
+        if rng.random() < 0.05:
+            numbers.append('abc')
+        lines.append(' '.join([shape] + numbers))
+    return lines + ['', '   ', '# comment', 'circle 1e400', 'square nan', 'rectangle -0.0 3']
+
+
+class TestAreaEngine(unittest.TestCase):
+    def assertSameResults(self, actual, expected):
+        self.assertEqual(len(actual), len(expected))
+        for (line, area, error), (e_line, e_area, e_error) in zip(actual, expected):
+            self.assertEqual((line, error), (e_line, e_error))
+            if e_area is None or math.isnan(e_area):
+                self.assertTrue(area is None if e_area is None else math.isnan(area), line)
+            else:
+                self.assertEqual(area.hex(), float(e_area).hex(), line)
+
+    def test_matches_task3(self):
+        rng = random.Random(3)
+        shapes = ['circle', 'rectangle', 'square', 'triangle', 'ellipse', 'trapezoid', 'hexagon']
+        lines = _random_lines(rng, shapes, 3000)
+        self.assertSameResults(calculate_areas_columnar(lines), calculate_areas_from_lines(lines))
+
+    def test_tokenising_edge_cases(self):
+        # Mixed whitespace, control bytes, non-ASCII and embedded newlines take
+        # different token-counting paths; all must agree with str.split.
+        lines = ['circle\t2', 'rectangle  3   4', 'triangle 3\x1c4', 'square\x0b5',
+                 'circle 1\x01', 'square 2', 'ellipse 1\u00a02', 'circle 3\u2003',
+                 'trapezoid 1 2\n3', 'square 1 x y', 'blob x', 'circle 1_0', 'rect 1 2']
+        for batch in (lines, lines[:5], lines[5:8], lines[8:]):
+            with self.subTest(batch=batch):
+                self.assertSameResults(calculate_areas_columnar(batch), calculate_areas_from_lines(batch))
+                for formulas, reference in (('task3', calculate_areas_from_lines),
+                                            ('assignment13', _assignment13_reference)):
+                    self.assertSameResults(calculate_areas_columnar(batch, formulas=formulas),
+                                           reference(batch))
+
+    def test_matches_assignment13_dispatch(self):
+        rng = random.Random(13)
+        lines = _random_lines(rng, ['circle', 'rectangle', 'square', 'triangle'], 3000)
+        self.assertSameResults(calculate_areas_columnar(lines, formulas='assignment13'),
+                               _assignment13_reference(lines))
+
+    def test_batches_share_error_table(self):
+        lines = ['circle 1', 'blob 2', 'square x', 'blob 2', 'square 3'] * 3
+        batches = list(iter_area_batches(lines, batch_size=4))
+        self.assertEqual([len(b.lines) for b in batches], [4, 4, 4, 3])
+        self.assertIs(batches[0].errors, batches[-1].errors)
+        self.assertEqual(batches[0].errors.messages,
+                         ['unsupported shape: blob', "could not convert string to float: 'x'"])
+        self.assertEqual(batches[0].error_mask.tolist(), [False, True, True, True])
+        self.assertEqual(batches[0].error_codes.tolist(), [0, 1, 2, 1])
+
+    def test_streams_jsonl_and_csv(self):
+        lines = ['circle 3', 'rectangle 4 5', 'unknown 1 2']
+        expected = calculate_areas_from_lines(lines)
+
+        out = io.StringIO()
+        self.assertEqual(write_jsonl(iter_area_batches(lines), out), 3)
+        rows = [json.loads(row) for row in out.getvalue().splitlines()]
+        self.assertEqual([(r['line'], r['area'], r['error']) for r in rows], expected)
+
+        out = io.StringIO()
+        write_csv(iter_area_batches(lines), out)
+        rows = list(csv.DictReader(io.StringIO(out.getvalue())))
+        self.assertEqual(float(rows[0]['area']), expected[0][1])
+        self.assertEqual(rows[2]['error'], 'unsupported shape: unknown')
+
+    def test_process_file(self):
+        import tempfile
+
+        with tempfile.TemporaryDirectory() as tmp:
+            src = Path(tmp) / 'shapes.txt'
+            dst = Path(tmp) / 'areas.jsonl'
+            src.write_text('\ufeffsquare 2\n\ntriangle 3 4\n', encoding='utf-8')
+            self.assertEqual(process_file(str(src), str(dst), batch_size=1), 2)
+            rows = [json.loads(row) for row in dst.read_text(encoding='utf-8').splitlines()]
+        self.assertEqual([r['area'] for r in rows], [4.0, 6.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import importlib.machinery
+import importlib.util
+import random
+import unittest
+from pathlib import Path
+
+from palindrome import (
+    count_palindromic_substrings,
+    is_palindrome,
+    is_palindrome_many,
+    is_sentence_palindrome,
+    longest_palindromic_substring,
+    normalize,
+)
+from task2 import is_palindrome as reference_is_palindrome
+
+
+def _load_sentence_reference():
+    path = Path(__file__).resolve().parents[2] / 'Assignment_8' / 'TASK3.PY'
+    loader = importlib.machinery.SourceFileLoader('assignment8_task3', str(path))
+    spec = importlib.util.spec_from_loader(loader.name, loader)
+    module = importlib.util.module_from_spec(spec)
+    loader.exec_module(module)
+    return module.is_sentence_palindrome
+
+
+SAMPLES = [
+    'racecar', 'RaceCar', 'A man, a plan, a canal: Panama', 'No lemon, no melon',
+    'not a palindrome', '', ' ', '!!!', 'ab', 'Was it a car or a cat I saw?',
+    'Ésé', 'été', 'a\tb\nb a', '1 2 3 2 1', 'İi', 'ǅǆ',
+]
+OPTIONS = [
+    dict(ignore_spaces=s, ignore_case=c, alphanumeric_only=a)
+    for s in (True, False) for c in (True, False) for a in (True, False)
+]
+
+
+def _brute_force(text):
+    found = [text[i:j] for i in range(len(text)) for j in range(i + 1, len(text) + 1)
+             if text[i:j] == text[i:j][::-1]]
+    return len(found), max(found, key=len, default='')
+
+
+class TestPalindromeChecks(unittest.TestCase):
+    def test_matches_task2_for_every_option_set(self):
+        for options in OPTIONS:
+            for s in SAMPLES:
+                with self.subTest(s=s, **options):
+                    self.assertEqual(is_palindrome(s, **options),
+                                     reference_is_palindrome(s, **options))
+
+    def test_many_matches_single(self):
+        for options in OPTIONS:
+            self.assertEqual(is_palindrome_many(SAMPLES + [None], **options),
+                             [is_palindrome(s, **options) for s in SAMPLES] + [False])
+
+    def test_sentence_matches_assignment8(self):
+        reference = _load_sentence_reference()
+        for s in SAMPLES + [None, 12321, ['A', 'man']]:
+            with self.subTest(s=s):
+                self.assertEqual(is_sentence_palindrome(s), reference(s))
+
+    def test_non_string_is_false(self):
+        self.assertFalse(is_palindrome(None))
+        self.assertEqual(is_palindrome_many([]), [])
+
+
+class TestManacherQueries(unittest.TestCase):
+    def test_against_brute_force(self):
+        rng = random.Random(7)
+        for _ in range(300):
+            text = ''.join(rng.choice('abA b,') for _ in range(rng.randint(0, 14)))
+            cleaned = normalize(text)
+            count, _ = _brute_force(cleaned)
+            self.assertEqual(count_palindromic_substrings(text), count)
+            longest = longest_palindromic_substring(text)
+            self.assertEqual(len(normalize(longest)), len(_brute_force(cleaned)[1]))
+            self.assertTrue(is_palindrome(longest))
+
+    def test_returns_original_slice(self):
+        self.assertEqual(longest_palindromic_substring('xx Never odd or even!'),
+                         'Never odd or even')
+        self.assertEqual(longest_palindromic_substring('abcd'), 'a')
+        self.assertEqual(longest_palindromic_substring('...'), '')
+
+    def test_respects_options(self):
+        self.assertEqual(longest_palindromic_substring('Abba', ignore_case=False), 'bb')
+        self.assertEqual(count_palindromic_substrings('aaa'), 6)
+        self.assertEqual(count_palindromic_substrings('a a', ignore_spaces=False,
+                                                      alphanumeric_only=False), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
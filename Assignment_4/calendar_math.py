@@ -0,0 +1,177 @@
+"""
+Closed-form calendar arithmetic around `is_leap_year`.
+
+Reporting code used to loop over every year in a span to count leap days or
+to add up day differences. Everything here is O(1) per query instead, using
+the Gregorian rule of `task1.is_leap_year` applied proleptically:
+
+    leap years in [1, y] = y // 4 - y // 100 + y // 400
+
+Python's floor division keeps that identity valid for zero and negative years
+too, so `count_leap_years` agrees with a loop over `is_leap_year` on any range.
+Dates are ``(year, month, day)`` tuples; ordinals match ``date.toordinal()``
+(0001-01-01 is day 1) wherever `datetime` can represent the date.
+"""
+
+from __future__ import annotations
+
+from typing import Tuple
+
+from task1 import is_leap_year
+
+Date = Tuple[int, int, int]
+
+_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+# Days before the first of each month in a common year (index 1 = January).
+_DAYS_BEFORE_MONTH = (0, 0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+
+
+def _leap_years_through(year: int) -> int:
+    """Number of leap years in [1, year] (negative for year < 0, by floor division)."""
+    return year // 4 - year // 100 + year // 400
+
+
+def count_leap_years(start: int, stop: int) -> int:
+    """Leap years in ``range(start, stop)``; 0 for an empty range."""
+    if stop <= start:
+        return 0
+    return _leap_years_through(stop - 1) - _leap_years_through(start - 1)
+
+
+def days_in_month(year: int, month: int) -> int:
+    """Length of `month` in `year`; raises ValueError for a month outside 1..12."""
+    if not 1 <= month <= 12:
+        raise ValueError(f"month must be in 1..12, not {month}")
+    return _DAYS_IN_MONTH[month] + (month == 2 and is_leap_year(year))
+
+
+def day_of_year(year: int, month: int, day: int) -> int:
+    """1-based day of the year; raises ValueError for an impossible date."""
+    if not 1 <= day <= days_in_month(year, month):
+        raise ValueError(f"day is out of range for {year:04d}-{month:02d}: {day}")
+    return _DAYS_BEFORE_MONTH[month] + (month > 2 and is_leap_year(year)) + day
+
+
+def to_ordinal(date: Date) -> int:
+    """Days since 0000-12-31, like ``datetime.date.toordinal``."""
+    year, month, day = date
+    previous = year - 1
+    return previous * 365 + _leap_years_through(previous) + day_of_year(year, month, day)
+
+
+def days_between(start: Date, end: Date) -> int:
+    """Signed number of days from `start` to `end`."""
+    return to_ordinal(end) - to_ordinal(start)
+
+
+def is_leap_year_array(years):
+    """Vectorised `is_leap_year` over an integer array-like; returns a bool ndarray."""
+    import numpy as np
+
+    years = np.asarray(years)
+    if years.dtype.kind not in "iu":
+        raise TypeError(f"years must be integers, not {years.dtype}")
+    return (years % 4 == 0) & ((years % 100 != 0) | (years % 400 == 0))
+
+
+def benchmark(n: int = 10_000_000) -> dict:
+    """
+    Time the year-by-year loops against the closed forms on `n` inputs.
+
+    The loops are what reporting code did before: call `is_leap_year` on each
+    year, and add 365/366 per year to get a day difference across `n` years.
+    """
+    import random
+    import time
+
+    import numpy as np
+
+    results: dict = {"n": n}
+    rng = random.Random(0)
+    years = [rng.randrange(1, 10_000) for _ in range(n)]
+
+    started = time.perf_counter()
+    looped = sum(map(is_leap_year, years))
+    results["is_leap_year_loop_seconds"] = time.perf_counter() - started
+
+    array = np.array(years, dtype=np.int64)
+    started = time.perf_counter()
+    vectorised = int(is_leap_year_array(array).sum())
+    results["is_leap_year_array_seconds"] = time.perf_counter() - started
+    assert looped == vectorised
+
+    started = time.perf_counter()
+    looped = sum(map(is_leap_year, range(1, n + 1)))
+    results["count_loop_seconds"] = time.perf_counter() - started
+    started = time.perf_counter()
+    assert count_leap_years(1, n + 1) == looped
+    results["count_closed_form_seconds"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    looped = sum(366 if is_leap_year(y) else 365 for y in range(1, n + 1))
+    results["days_between_loop_seconds"] = time.perf_counter() - started
+    started = time.perf_counter()
+    assert days_between((1, 1, 1), (n + 1, 1, 1)) == looped
+    results["days_between_closed_form_seconds"] = time.perf_counter() - started
+    return results
+
+
+def test_calendar_math():
+    """Property tests against task1.is_leap_year and datetime.date."""
+    import random
+    from datetime import date
+
+    rng = random.Random(38)
+    for _ in range(2000):
+        start = rng.randint(-3000, 3000)
+        stop = start + rng.randint(-5, 900)
+        expected = sum(1 for year in range(start, stop) if is_leap_year(year))
+        assert count_leap_years(start, stop) == expected, (start, stop)
+    for year in range(-1200, 2801):
+        assert count_leap_years(year, year + 1) == int(is_leap_year(year))
+
+    for _ in range(5000):
+        a = date.fromordinal(rng.randint(1, date.max.toordinal()))
+        b = date.fromordinal(rng.randint(1, date.max.toordinal()))
+        assert to_ordinal((a.year, a.month, a.day)) == a.toordinal()
+        assert day_of_year(a.year, a.month, a.day) == a.timetuple().tm_yday
+        assert days_between((a.year, a.month, a.day), (b.year, b.month, b.day)) == (b - a).days
+
+    for bad in [(2023, 2, 29), (2023, 4, 31), (2023, 13, 1), (2023, 1, 0)]:
+        try:
+            day_of_year(*bad)
+            assert False, f"{bad} should be rejected"
+        except ValueError:
+            pass
+    assert day_of_year(2024, 2, 29) == 60 and day_of_year(1900, 3, 1) == 60
+
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+    if np is not None:
+        years = np.arange(-2000, 10_001)
+        assert is_leap_year_array(years).tolist() == [is_leap_year(y) for y in years.tolist()]
+        assert is_leap_year_array([1900, 2000, 2024]).tolist() == [False, True, True]
+        try:
+            is_leap_year_array([2000.0])
+            assert False, "Float years should be rejected"
+        except TypeError:
+            pass
+
+    print("All calendar_math tests passed! ✓")
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="Calendar arithmetic tests and benchmark")
+    parser.add_argument("--bench", type=int, metavar="N", nargs="?", const=10_000_000,
+                        help="benchmark on N inputs (default 10^7)")
+    args = parser.parse_args()
+
+    if args.bench:
+        print(json.dumps(benchmark(args.bench), indent=2))
+    else:
+        test_calendar_math()
@@ -0,0 +1,305 @@
+"""
+Persisted line-offset index for large text files.
+
+Stores the byte offset of every Nth line start so that any line k can be
+reached with one seek plus at most N-1 ``readline`` calls, and so a file can
+be cut into byte ranges that start exactly on line boundaries for parallel
+workers. Lines in the index are terminated by ``\\n`` only (a ``\\r\\n`` line
+keeps its ``\\r``); use `count_lines_in_file` for the universal-newline count.
+
+Index file layout (``<file>.lidx``, little-endian):
+    header  - magic, source size, source mtime_ns, stride N, line count
+    offsets - uint64 start offset of lines 0, N, 2N, ...
+
+The header's size/mtime pair is checked on load; a stale index is rebuilt.
+"""
+
+from __future__ import annotations
+
+import bisect
+import struct
+from array import array
+from dataclasses import dataclass
+from itertools import accumulate
+from pathlib import Path
+from typing import List, Tuple, Union
+
+from task5 import CHUNK_SIZE
+
+DEFAULT_STRIDE = 1024
+INDEX_SUFFIX = ".lidx"
+
+_HEADER = struct.Struct("<8sQqQQ")
+_MAGIC = b"LINEIDX1"
+_PLUS_ONE = (1).__add__
+
+
+@dataclass
+class LineIndex:
+    """Sparse line-start offsets for one file."""
+
+    path: Path
+    stride: int
+    line_count: int
+    size: int
+    mtime_ns: int
+    offsets: array
+
+    def _seek_line(self, source, k: int) -> int:
+        if not 0 <= k < self.line_count:
+            raise IndexError(f"line {k} out of range (file has {self.line_count} lines)")
+        offset = self.offsets[k // self.stride]
+        source.seek(offset)
+        for _ in range(k % self.stride):
+            offset += len(source.readline())
+        return offset
+
+    def line_offset(self, k: int) -> int:
+        """Return the byte offset where line `k` (0-based) starts."""
+        with self.path.open("rb") as source:
+            return self._seek_line(source, k)
+
+    def read_line(self, k: int, encoding: str = "utf-8") -> str:
+        """Return line `k` including its terminator, like ``readlines()[k]``."""
+        with self.path.open("rb") as source:
+            self._seek_line(source, k)
+            return source.readline().decode(encoding)
+
+    def split(self, parts: int) -> List[Tuple[int, int, int]]:
+        """
+        Cut the file into at most `parts` line-aligned byte ranges.
+
+        Returns ``(start_offset, end_offset, first_line)`` tuples that cover the
+        file exactly once. Boundaries snap to indexed line starts, so ranges are
+        balanced to within one stride of lines.
+        """
+        if parts < 1:
+            raise ValueError("parts must be at least 1")
+        if not self.line_count:
+            return []
+        boundaries = [0]
+        for i in range(1, parts):
+            slot = bisect.bisect_left(self.offsets, self.size * i // parts)
+            if slot < len(self.offsets) and self.offsets[slot] > self.offsets[boundaries[-1]]:
+                boundaries.append(slot)
+        ranges = []
+        for current, following in zip(boundaries, boundaries[1:] + [None]):
+            end = self.size if following is None else self.offsets[following]
+            ranges.append((self.offsets[current], end, current * self.stride))
+        return ranges
+
+    def is_current(self) -> bool:
+        """True if the source file is unchanged since the index was built."""
+        stat = self.path.stat()
+        return stat.st_size == self.size and stat.st_mtime_ns == self.mtime_ns
+
+    def save(self, index_path: Union[str, Path, None] = None) -> Path:
+        target = Path(index_path) if index_path else _default_index_path(self.path)
+        with target.open("wb") as out:
+            out.write(_HEADER.pack(_MAGIC, self.size, self.mtime_ns, self.stride, self.line_count))
+            self.offsets.tofile(out)
+        return target
+
+
+def _default_index_path(path: Path) -> Path:
+    return path.with_name(path.name + INDEX_SUFFIX)
+
+
+def build_line_index(path: Union[str, Path], stride: int = DEFAULT_STRIDE,
+                     chunk_size: int = CHUNK_SIZE) -> LineIndex:
+    """
+    Scan `path` once and record the start offset of every `stride`-th line.
+
+    Each chunk is split on newlines and the line lengths are prefix-summed with
+    ``itertools.accumulate``, so per-line work stays in C; Python only touches
+    the offsets that are actually kept. Memory is bounded by `chunk_size`.
+    """
+    if stride < 1:
+        raise ValueError("stride must be at least 1")
+    path = Path(path)
+    stat = path.stat()
+    offsets = array("Q", [0])
+    newlines = 0
+    position = 0
+    last_byte = b""
+    with path.open("rb") as source:
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                break
+            last_byte = chunk[-1:]
+            pieces = chunk.split(b"\n")
+            pieces.pop()  # bytes after the last newline belong to the next chunk's line
+            # Absolute offset just past each newline, i.e. where the next line starts.
+            starts = list(accumulate(map(_PLUS_ONE, map(len, pieces)), initial=position))
+            first = (-newlines - 1) % stride + 1
+            offsets.extend(starts[first::stride])
+            newlines += len(pieces)
+            position += len(chunk)
+    if offsets and offsets[-1] == stat.st_size and stat.st_size:
+        offsets.pop()  # trailing newline: no line starts at EOF
+    line_count = newlines + (1 if last_byte and last_byte != b"\n" else 0)
+    return LineIndex(path, stride, line_count, stat.st_size, stat.st_mtime_ns, offsets)
+
+
+def load_line_index(path: Union[str, Path], stride: int = DEFAULT_STRIDE,
+                    persist: bool = True) -> LineIndex:
+    """
+    Return the index for `path`, reusing ``<path>.lidx`` when it is current.
+
+    A missing, corrupt, stale or different-stride index is rebuilt and, if
+    `persist` is true, written back next to the source file.
+    """
+    path = Path(path)
+    index_path = _default_index_path(path)
+    try:
+        with index_path.open("rb") as source:
+            magic, size, mtime_ns, stored_stride, line_count = _HEADER.unpack(
+                source.read(_HEADER.size)
+            )
+            offsets = array("Q")
+            offsets.frombytes(source.read())
+        index = LineIndex(path, stored_stride, line_count, size, mtime_ns, offsets)
+        if magic == _MAGIC and stored_stride == stride and index.is_current():
+            return index
+    except (OSError, struct.error, ValueError):
+        pass
+    index = build_line_index(path, stride)
+    if persist:
+        index.save(index_path)
+    return index
+
+
+def benchmark(size_mb: int = 10 * 1024, path: Union[str, Path, None] = None,
+              include_readlines: bool = False) -> dict:
+    """
+    Time counting, indexing and random access on a file of about `size_mb` MiB.
+
+    Writes a synthetic file (80-byte lines) unless `path` points at an existing
+    one. Peak RSS (``ru_maxrss``) is sampled after every stage. The original
+    ``readlines()`` approach needs the whole file in memory, so it only runs
+    when `include_readlines` is set.
+    """
+    import random
+    import resource
+    import tempfile
+    import time
+
+    from task5 import count_lines_in_file
+
+    def peak_rss_mb() -> float:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+    results: dict = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        target = Path(path) if path else Path(tmp) / "big.txt"
+        if not target.exists():
+            line = (b"x" * 79) + b"\n"
+            block = line * (CHUNK_SIZE // len(line))
+            with target.open("wb") as out:
+                for _ in range(size_mb * (1 << 20) // len(block)):
+                    out.write(block)
+        results["file_mb"] = round(target.stat().st_size / (1 << 20), 1)
+        results["baseline_rss_mb"] = peak_rss_mb()
+
+        started = time.perf_counter()
+        results["lines"] = count_lines_in_file(str(target))
+        results["count_seconds"] = time.perf_counter() - started
+        results["count_peak_rss_mb"] = peak_rss_mb()
+
+        started = time.perf_counter()
+        index = build_line_index(target)
+        index.save(Path(tmp) / "big.lidx")
+        results["index_seconds"] = time.perf_counter() - started
+        results["index_entries"] = len(index.offsets)
+        results["index_peak_rss_mb"] = peak_rss_mb()
+
+        rng = random.Random(0)
+        picks = [rng.randrange(index.line_count) for _ in range(1000)]
+        started = time.perf_counter()
+        for k in picks:
+            index.read_line(k)
+        results["random_access_ms_per_line"] = (time.perf_counter() - started) * 1000 / len(picks)
+
+        if include_readlines:
+            started = time.perf_counter()
+            with target.open("r", encoding="utf-8") as source:
+                results["readlines_lines"] = len(source.readlines())
+            results["readlines_seconds"] = time.perf_counter() - started
+            results["readlines_peak_rss_mb"] = peak_rss_mb()
+    return results
+
+
+def test_line_index():
+    """Compare index lookups with readlines() on small files."""
+    import tempfile
+
+    from task5 import count_lines_in_file
+
+    contents = [
+        b"",
+        b"one line no newline",
+        b"a\n",
+        b"a\nb\nc",
+        b"\n\n\n",
+        "".join(f"line {i} é\n" for i in range(1000)).encode("utf-8"),
+        "".join(f"row {i}\n" for i in range(257)).encode("utf-8") + b"tail",
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "sample.txt"
+        for data in contents:
+            path.write_bytes(data)
+            with path.open("r", encoding="utf-8", newline="\n") as source:
+                expected = source.readlines()
+            for stride in (1, 3, 64):
+                for chunk_size in (4, 1 << 20):
+                    index = build_line_index(path, stride, chunk_size)
+                    assert index.line_count == len(expected), (data[:20], stride)
+                    for k in range(0, len(expected), 7):
+                        assert index.read_line(k) == expected[k]
+                    covered = b"".join(data[start:end] for start, end, _ in index.split(4))
+                    assert covered == data
+                    for start, _, first_line in index.split(4):
+                        assert index.line_offset(first_line) == start
+            assert count_lines_in_file(str(path)) == len(expected)
+
+        # Universal newlines, including a '\r\n' split across chunks.
+        path.write_bytes(b"a\r\nb\rc\n\rd")
+        with path.open("r", encoding="utf-8") as source:
+            assert count_lines_in_file(str(path)) == len(source.readlines()) == 5
+        with path.open("rb") as source:
+            from task5 import count_line_breaks
+            assert count_line_breaks(source, chunk_size=2) == 5
+
+        # Persistence and staleness.
+        path.write_bytes(b"x\n" * 100)
+        first = load_line_index(path, stride=8)
+        assert _default_index_path(path).exists()
+        assert load_line_index(path, stride=8).offsets == first.offsets
+        path.write_bytes(b"y\n" * 50)
+        assert load_line_index(path, stride=8).line_count == 50
+
+        try:
+            first.read_line(10_000)
+            assert False, "Out-of-range line should fail"
+        except IndexError:
+            pass
+
+    print("All line_index tests passed! ✓")
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="Line-offset index tests and benchmark")
+    parser.add_argument("--bench", type=int, metavar="MB", nargs="?", const=10 * 1024,
+                        help="benchmark on a synthetic file of MB MiB (default 10 GiB)")
+    parser.add_argument("--readlines", action="store_true",
+                        help="also time the old readlines() approach")
+    args = parser.parse_args()
+
+    if args.bench:
+        print(json.dumps(benchmark(args.bench, include_readlines=args.readlines), indent=2))
+    else:
+        test_line_index()
@@ -1,11 +1,46 @@
+CHUNK_SIZE = 1 << 20
+
+
+def count_line_breaks(file, chunk_size=CHUNK_SIZE):
+    """
+    Count lines in a binary file object without holding more than one chunk.
+    
+    Matches text-mode readlines(): '\\n', '\\r' and '\\r\\n' each end a line,
+    and a final line without a terminator still counts.
+    
+    Args:
+        file: A file object opened in binary mode
+        chunk_size (int): Bytes read per iteration
+    
+    Returns:
+        int: The number of lines
+    """
+    lines = 0
+    previous_cr = False
+    last_byte = b''
+    while True:
+        chunk = file.read(chunk_size)
+        if not chunk:
+            break
+        crlf = chunk.count(b'\r\n')
+        if previous_cr and chunk[:1] == b'\n':
+            crlf += 1  # '\r\n' split across two chunks
+        lines += chunk.count(b'\n') + chunk.count(b'\r') - crlf
+        previous_cr = chunk.endswith(b'\r')
+        last_byte = chunk[-1:]
+    if last_byte and last_byte not in (b'\n', b'\r'):
+        lines += 1
+    return lines
+
+
 def count_lines_in_file(filename):
     """
     Read a .txt file and return the number of lines.
     
     This function demonstrates AI-guided logic for file processing:
     - Opens the file safely using context manager (with statement)
-    - Reads all lines from the file
-    - Returns the total count of lines
+    - Counts line breaks chunk by chunk, so memory stays flat for huge files
+    - Returns the total count of lines (same result as len(readlines()))
     - Handles file not found errors gracefully
     
     Args:
@@ -22,9 +57,8 @@ def count_lines_in_file(filename):
         -1
     """
     try:
-        with open(filename, 'r', encoding='utf-8') as file:
-            lines = file.readlines()
-            return len(lines)
+        with open(filename, 'rb') as file:
+            return count_line_breaks(file)
     except FileNotFoundError:
         print(f"Error: File '{filename}' not found.")
         return -1
@@ -0,0 +1,178 @@
+"""
+Streaming character-class statistics for large text files.
+
+`count_vowels` in task4.py tests string membership once per character, which
+is far too slow for multi-GB logs. This module reads files as raw byte chunks
+and classifies every byte with a single ``bytes.translate`` call, then tallies
+each class with ``bytes.count`` - both loops run in C.
+
+Unicode handling:
+    Input is treated as UTF-8 (plain ASCII is a subset). Vowels, consonants,
+    digits and whitespace are the ASCII classes only: ``aeiouAEIOU``, the other
+    ASCII letters, ``0-9`` and `` \\t\\n\\r\\v\\f``. UTF-8 never uses bytes
+    below 0x80 inside a multi-byte sequence, so ASCII counts are exact no matter
+    where a chunk boundary splits a character. Every non-ASCII character (for
+    example 'é', 'ß', Arabic-Indic digits or U+00A0 no-break space) is counted
+    once in ``non_ascii`` by counting UTF-8 lead bytes, and is never a vowel -
+    which matches `count_vowels`, since it only recognises ASCII vowels too.
+    Invalid UTF-8 is not rejected; stray lead bytes are still counted.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Union
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+_VOWEL, _CONSONANT, _DIGIT, _SPACE, _OTHER, _LEAD, _CONTINUATION = b"vcdsolx"
+
+
+def _build_class_table() -> bytes:
+    table = bytearray([_OTHER] * 256)
+    for byte in range(256):
+        ch = chr(byte)
+        if byte >= 0xC0:
+            table[byte] = _LEAD
+        elif byte >= 0x80:
+            table[byte] = _CONTINUATION
+        elif ch in "aeiouAEIOU":
+            table[byte] = _VOWEL
+        elif ch.isalpha():
+            table[byte] = _CONSONANT
+        elif ch.isdigit():
+            table[byte] = _DIGIT
+        elif ch in " \t\n\r\v\f":
+            table[byte] = _SPACE
+    return bytes(table)
+
+
+_CLASS_TABLE = _build_class_table()
+
+
+@dataclass
+class TextStats:
+    """Character-class totals; see the module docstring for the class rules."""
+
+    vowels: int = 0
+    consonants: int = 0
+    digits: int = 0
+    whitespace: int = 0
+    other_ascii: int = 0
+    non_ascii: int = 0
+
+    def __add__(self, other: "TextStats") -> "TextStats":
+        return TextStats(*(getattr(self, f.name) + getattr(other, f.name) for f in fields(self)))
+
+    @property
+    def characters(self) -> int:
+        """Total decoded characters counted."""
+        return sum(getattr(self, f.name) for f in fields(self))
+
+
+def stats_for_bytes(data: Union[bytes, bytearray, memoryview]) -> TextStats:
+    """Classify a UTF-8 byte buffer: one translate, then one count per class."""
+    classes = bytes(data).translate(_CLASS_TABLE)
+    return TextStats(
+        vowels=classes.count(_VOWEL),
+        consonants=classes.count(_CONSONANT),
+        digits=classes.count(_DIGIT),
+        whitespace=classes.count(_SPACE),
+        other_ascii=classes.count(_OTHER),
+        non_ascii=classes.count(_LEAD),
+    )
+
+
+def stats_for_text(text: str) -> TextStats:
+    """Classify an in-memory string (encoded as UTF-8)."""
+    return stats_for_bytes(text.encode("utf-8", errors="surrogatepass"))
+
+
+def stream_stats(path: Union[str, Path], chunk_size: int = DEFAULT_CHUNK_SIZE) -> TextStats:
+    """Classify a file chunk by chunk; memory use is bounded by `chunk_size`."""
+    total = TextStats()
+    with open(path, "rb", buffering=0) as source:
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                break
+            total = total + stats_for_bytes(chunk)
+    return total
+
+
+def stats_for_files(
+    paths: Iterable[Union[str, Path]],
+    processes: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Dict[str, TextStats]:
+    """
+    Compute `stream_stats` for many files, one file per worker process.
+
+    ``processes=1`` (or a single file) runs in the calling process. Results are
+    keyed by the path as given, in input order.
+    """
+    names = [str(path) for path in paths]
+    workers = processes or os.cpu_count() or 1
+    if workers == 1 or len(names) <= 1:
+        return {name: stream_stats(name, chunk_size) for name in names}
+    with ProcessPoolExecutor(max_workers=min(workers, len(names))) as pool:
+        results = pool.map(stream_stats, names, [chunk_size] * len(names))
+        return dict(zip(names, results))
+
+
+def test_text_stats():
+    """Cross-check against count_vowels and exercise chunk boundaries."""
+    import tempfile
+
+    from task4 import count_vowels
+
+    samples = [
+        "Hello World",
+        "Python Programming",
+        "AEIOU",
+        "bcdfg",
+        "The quick brown fox jumps over the lazy dog",
+        "aEiOu",
+        "",
+        "naïve café — Ünïcode ½ ٣ 12\t\n",
+    ]
+    for sample in samples:
+        stats = stats_for_text(sample)
+        assert stats.vowels == count_vowels(sample), sample
+        assert stats.characters == len(sample), sample
+
+    stats = stats_for_text("ab1 é!")
+    assert stats == TextStats(vowels=1, consonants=1, digits=1, whitespace=1,
+                              other_ascii=1, non_ascii=1)
+
+    text = "".join(samples) * 50
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for i in range(3):
+            path = Path(tmp) / f"log{i}.txt"
+            path.write_text(text * (i + 1), encoding="utf-8")
+            paths.append(path)
+
+        # A 7-byte chunk splits multi-byte characters across reads.
+        assert stream_stats(paths[0], chunk_size=7) == stats_for_text(text)
+        assert stream_stats(paths[0], chunk_size=7).vowels == count_vowels(text)
+
+        sequential = stats_for_files(paths, processes=1)
+        parallel = stats_for_files(paths, processes=3)
+        assert sequential == parallel
+        assert parallel[str(paths[2])].vowels == 3 * count_vowels(text)
+
+    print("All text_stats tests passed! ✓")
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) > 1:
+        for name, stats in stats_for_files(sys.argv[1:]).items():
+            print(f"{name}: {stats}")
+    else:
+        test_text_stats()
@@ -0,0 +1,79 @@
+"""
+Logins per second against worker count for LoginService.
+
+Creates a throwaway store with a few users, then times `authenticate_many`
+and `authenticate_async` for 1, 2, 4, ... workers up to the core count:
+
+    python bench_logins.py --logins 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from task1 import CredentialStore, LoginService
+
+
+def _worker_counts(limit: int) -> List[int]:
+    counts = [1]
+    while counts[-1] * 2 <= limit:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != limit:
+        counts.append(limit)
+    return counts
+
+
+def benchmark(logins: int = 200, max_workers: Optional[int] = None) -> Dict[str, object]:
+    cores = os.cpu_count() or 1
+    users = [(f"user{i}", f"password{i}") for i in range(8)]
+    attempts = [users[i % len(users)] for i in range(logins)]
+    results: Dict[str, object] = {"cores": cores, "logins": logins, "runs": []}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = CredentialStore(Path(tmp) / "bench.json")
+        store.bulk_add_users(users)
+
+        started = time.perf_counter()
+        service = LoginService(store)
+        assert all(service.authenticate(u, p) for u, p in attempts)
+        serial = time.perf_counter() - started
+        results["serial_logins_per_sec"] = round(logins / serial, 1)
+
+        for workers in _worker_counts(max_workers or cores):
+            service = LoginService(store, max_workers=workers)
+            try:
+                started = time.perf_counter()
+                assert all(service.authenticate_many(attempts))
+                threaded = time.perf_counter() - started
+
+                async def run_async() -> List[bool]:
+                    return await asyncio.gather(
+                        *(service.authenticate_async(u, p) for u, p in attempts))
+
+                started = time.perf_counter()
+                assert all(asyncio.run(run_async()))
+                asynchronous = time.perf_counter() - started
+                results["runs"].append({
+                    "workers": workers,
+                    "many_logins_per_sec": round(logins / threaded, 1),
+                    "async_logins_per_sec": round(logins / asynchronous, 1),
+                    "max_queued": service.metrics()["max_queued"],
+                })
+            finally:
+                service.close()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark LoginService throughput")
+    parser.add_argument("--logins", type=int, default=200, help="logins per run")
+    parser.add_argument("--max-workers", type=int, help="largest pool size (default: cores)")
+    args = parser.parse_args()
+    print(json.dumps(benchmark(args.logins, args.max_workers), indent=2))
@@ -0,0 +1,34 @@
+"""
+Migrate a JSON credential store to the append-only log or SQLite backend.
+
+Stored hashes are copied unchanged, so no passwords are needed:
+
+    python migrate_credentials.py credential_store.json credentials.db
+    python migrate_credentials.py credential_store.json credentials.log --backend log
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+from task1 import BACKENDS, migrate_store
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Copy credentials between store backends")
+    parser.add_argument("source", type=Path, help="existing store (JSON by default)")
+    parser.add_argument("target", type=Path, help="new store; must not hold the same users")
+    parser.add_argument("--backend", choices=sorted(BACKENDS),
+                        help="target backend (default: from the target suffix)")
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    args = parser.parse_args()
+
+    if not args.source.exists():
+        raise SystemExit(f"No credential store at {args.source}")
+    count = migrate_store(args.source, args.target, args.backend, args.batch_size)
+    print(f"Migrated {count} users to {args.target}")
+
+
+if __name__ == "__main__":
+    main()
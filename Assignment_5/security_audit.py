@@ -0,0 +1,340 @@
+"""
+On-demand, AST-based security audit for the repository.
+
+Replaces the substring checks that `task1.audit_security_posture` used to run
+on its own source at import time. Each Python file is parsed with `ast` and
+checked for:
+
+- hardcoded_secret: a non-empty string literal assigned (or passed as a
+  keyword / dict value) to a name such as API_KEY, password, token or secret.
+- hardcoded_password: a password-like name compared with a string literal.
+- default_account: a username-like name compared with "admin"/"root".
+- insecure_shortcut: `if True:` blocks, and auth-style functions
+  (authenticate, login, verify_*, check_*...) that can only return True.
+
+`scan_repository` walks a directory tree, parses files in a process pool and
+caches findings per file content hash, so unchanged files are not parsed
+again on the next run:
+
+    python security_audit.py ..            # scan the repository
+    python security_audit.py .. --json     # machine-readable findings
+    python security_audit.py --self-test
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+# Bump when the rules change so cached results from older rules are ignored.
+RULES_VERSION = 1
+CACHE_FILENAME = ".security_audit_cache.json"
+SKIP_DIRS = {".git", "__pycache__", ".venv", "venv", "node_modules", "dist", ".pytest_cache"}
+
+# Matched against the end of a name: DB_PASSWORD and auth_token count, password_hash does not.
+_SECRET_NAME = re.compile(r"(pass(word|wd)?|pwd|secret|api_?key|access_?key|private_?key|token|credentials?)$",
+                          re.IGNORECASE)
+_PASSWORD_NAME = re.compile(r"pass(word|wd)?$|pwd$", re.IGNORECASE)
+_USERNAME_NAME = re.compile(r"user(name)?$|login$|account$", re.IGNORECASE)
+_DEFAULT_ACCOUNTS = {"admin", "root", "administrator"}
+_AUTH_FUNCTION = re.compile(r"auth|login|verify|check_(password|credentials|user)|is_admin",
+                            re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class Finding:
+    check: str
+    line: int
+    message: str
+
+
+@dataclass
+class ScanReport:
+    findings: Dict[str, List[Finding]] = field(default_factory=dict)  # path -> findings
+    scanned: int = 0
+    cached: int = 0
+
+    @property
+    def total(self) -> int:
+        return sum(len(items) for items in self.findings.values())
+
+
+def _name_of(node: ast.AST) -> Optional[str]:
+    """Identifier for a Name, Attribute (last part) or string dict key."""
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    return None
+
+
+def _is_secret_literal(node: Optional[ast.AST]) -> bool:
+    return isinstance(node, ast.Constant) and isinstance(node.value, str) and node.value.strip() != ""
+
+
+def _own_returns(function: ast.AST) -> Tuple[List[ast.Return], bool]:
+    """Return statements of `function` itself (not nested defs), and whether it raises."""
+    returns: List[ast.Return] = []
+    raises = False
+    stack = list(ast.iter_child_nodes(function))
+    while stack:
+        node = stack.pop()
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda, ast.ClassDef)):
+            continue
+        if isinstance(node, ast.Return):
+            returns.append(node)
+        elif isinstance(node, ast.Raise):
+            raises = True
+        stack.extend(ast.iter_child_nodes(node))
+    returns.sort(key=lambda r: r.lineno)
+    return returns, raises
+
+
+class _Auditor(ast.NodeVisitor):
+    def __init__(self) -> None:
+        self.findings: List[Finding] = []
+
+    def _add(self, check: str, node: ast.AST, message: str) -> None:
+        self.findings.append(Finding(check, node.lineno, message))
+
+    def _check_assignment(self, target: ast.AST, value: Optional[ast.AST], node: ast.AST) -> None:
+        name = _name_of(target)
+        if name and _SECRET_NAME.search(name) and _is_secret_literal(value):
+            self._add("hardcoded_secret", node, f"string literal assigned to {name}")
+
+    def visit_Assign(self, node: ast.Assign) -> None:
+        for target in node.targets:
+            self._check_assignment(target, node.value, node)
+        self.generic_visit(node)
+
+    def visit_AnnAssign(self, node: ast.AnnAssign) -> None:
+        self._check_assignment(node.target, node.value, node)
+        self.generic_visit(node)
+
+    def visit_keyword(self, node: ast.keyword) -> None:
+        if node.arg:
+            self._check_assignment(ast.Name(id=node.arg), node.value, node.value)
+        self.generic_visit(node)
+
+    def visit_Dict(self, node: ast.Dict) -> None:
+        for key, value in zip(node.keys, node.values):
+            if key is not None:
+                self._check_assignment(key, value, key)
+        self.generic_visit(node)
+
+    def visit_Compare(self, node: ast.Compare) -> None:
+        operands = [node.left, *node.comparators]
+        for left, right in zip(operands, operands[1:]):
+            for name_node, literal in ((left, right), (right, left)):
+                name = _name_of(name_node) if not isinstance(name_node, ast.Constant) else None
+                if not name or not _is_secret_literal(literal):
+                    continue
+                if _PASSWORD_NAME.search(name):
+                    self._add("hardcoded_password", node, f"{name} compared with a string literal")
+                elif _USERNAME_NAME.search(name) and literal.value.lower() in _DEFAULT_ACCOUNTS:
+                    self._add("default_account", node, f"{name} compared with {literal.value!r}")
+        self.generic_visit(node)
+
+    def visit_If(self, node: ast.If) -> None:
+        if isinstance(node.test, ast.Constant) and node.test.value is True:
+            self._add("insecure_shortcut", node, "if True: block")
+        self.generic_visit(node)
+
+    def _check_function(self, node: Union[ast.FunctionDef, ast.AsyncFunctionDef]) -> None:
+        if _AUTH_FUNCTION.search(node.name):
+            returns, raises = _own_returns(node)
+            if returns and not raises and all(
+                    isinstance(r.value, ast.Constant) and r.value.value is True for r in returns):
+                self._add("insecure_shortcut", returns[0],
+                          f"{node.name}() can only ever return True")
+        self.generic_visit(node)
+
+    visit_FunctionDef = _check_function
+    visit_AsyncFunctionDef = _check_function
+
+
+def audit_source(source: Union[str, bytes], filename: str = "<source>") -> List[Finding]:
+    """Findings for one file's source; a file that does not parse yields one parse_error."""
+    try:
+        tree = ast.parse(source, filename=filename)
+    except (SyntaxError, ValueError) as exc:
+        return [Finding("parse_error", getattr(exc, "lineno", None) or 0, str(exc))]
+    auditor = _Auditor()
+    auditor.visit(tree)
+    return sorted(auditor.findings, key=lambda f: (f.line, f.check))
+
+
+def _audit_file(job: Tuple[str, bytes]) -> List[Finding]:
+    path, source = job
+    return audit_source(source, path)
+
+
+def iter_python_files(root: Path, include_tests: bool = False) -> Iterator[Path]:
+    """
+    Every *.py file under `root` (any case of the suffix), skipping SKIP_DIRS.
+    Test code (``tests`` directories, ``test_*.py``) is full of throwaway
+    credentials and stubs, so it is left out unless `include_tests` is set.
+    """
+    for directory, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames
+                             if d not in SKIP_DIRS and (include_tests or d != "tests"))
+        for filename in sorted(filenames):
+            if filename.lower().endswith(".py") and (include_tests or not filename.startswith("test_")):
+                yield Path(directory) / filename
+
+
+def _load_cache(path: Optional[Path]) -> Dict[str, List[List]]:
+    if path is None:
+        return {}
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data.get("results", {}) if data.get("rules_version") == RULES_VERSION else {}
+
+
+def _save_cache(path: Optional[Path], results: Dict[str, List[List]]) -> None:
+    if path is None:
+        return
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps({"rules_version": RULES_VERSION, "results": results}), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def scan_repository(root: Union[str, Path], processes: Optional[int] = None,
+                    cache_path: Union[str, Path, None] = "default",
+                    include_tests: bool = False) -> ScanReport:
+    """
+    Audit every Python file under `root`.
+
+    Files whose SHA-256 is already in the cache are not parsed; the rest are
+    parsed in a process pool (`processes=1` parses in this process). The cache
+    defaults to CACHE_FILENAME in `root`; pass None to disable it. Entries for
+    content no longer present are dropped when the cache is saved.
+    """
+    root = Path(root)
+    cache_file = root / CACHE_FILENAME if cache_path == "default" else (
+        Path(cache_path) if cache_path else None)
+    cache = _load_cache(cache_file)
+    report = ScanReport()
+
+    files: List[Tuple[str, str]] = []  # (relative path, content hash)
+    pending: Dict[str, Tuple[str, bytes]] = {}  # content hash -> job
+    for path in iter_python_files(root, include_tests):
+        data = path.read_bytes()
+        digest = hashlib.sha256(data).hexdigest()
+        relative = path.relative_to(root).as_posix()
+        files.append((relative, digest))
+        report.scanned += 1
+        if digest in cache:
+            report.cached += 1
+        elif digest not in pending:
+            pending[digest] = (relative, data)
+
+    if pending:
+        digests = list(pending)
+        jobs = [pending[d] for d in digests]
+        if processes == 1 or len(jobs) == 1:
+            results = list(map(_audit_file, jobs))
+        else:
+            with ProcessPoolExecutor(max_workers=processes) as pool:
+                results = list(pool.map(_audit_file, jobs, chunksize=max(1, len(jobs) // 32)))
+        for digest, findings in zip(digests, results):
+            cache[digest] = [[f.check, f.line, f.message] for f in findings]
+
+    for relative, digest in files:
+        findings = [Finding(*item) for item in cache[digest]]
+        if findings:
+            report.findings[relative] = findings
+    _save_cache(cache_file, {digest: cache[digest] for _, digest in files})
+    return report
+
+
+def test_security_audit():
+    """Rule checks on snippets plus a cached re-scan of a temporary tree."""
+    import tempfile
+
+    def checks(source):
+        return [f.check for f in audit_source(source)]
+
+    assert checks('API_KEY = "e6c6083509fc4d450cde0ca4414b3a9f"') == ["hardcoded_secret"]
+    assert checks('settings.db_password: str = "hunter2"') == ["hardcoded_secret"]
+    assert checks('connect(token="abc123")') == ["hardcoded_secret"]
+    assert checks('params = {"api_key": "abc123"}') == ["hardcoded_secret"]
+    assert checks('API_KEY = os.getenv("API_KEY")') == []
+    assert checks('password = ""') == []
+    assert checks('if password == "letmein":\n    pass') == ["hardcoded_password"]
+    assert checks('if "admin" == username:\n    pass') == ["default_account"]
+    assert checks('if username == "alice":\n    pass') == []
+    assert checks('if True:\n    pass') == ["insecure_shortcut"]
+    assert checks('def authenticate(u, p):\n    return True') == ["insecure_shortcut"]
+    assert checks('def login(u):\n    if u:\n        return True\n    return True') == ["insecure_shortcut"]
+    assert checks('def authenticate(u):\n    if not u:\n        raise ValueError\n    return True') == []
+    assert checks('_TOKEN_PREFIX = "pbkdf2_"\npassword_hash = "x"') == []
+    assert checks('def authenticate(u, p):\n    if ok(u, p):\n        return True\n    return False') == []
+    assert checks('def is_palindrome(s):\n    return True') == []
+    assert checks('print "python 2"') == ["parse_error"]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        (root / "pkg").mkdir()
+        (root / "pkg" / "weather.py").write_text('API_KEY = "secret-value"\n', encoding="utf-8")
+        (root / "pkg" / "copy.PY").write_text('API_KEY = "secret-value"\n', encoding="utf-8")
+        (root / "clean.py").write_text('x = 1\n', encoding="utf-8")
+        (root / "__pycache__").mkdir()
+        (root / "__pycache__" / "skip.py").write_text('token = "x"\n', encoding="utf-8")
+        (root / "test_fixture.py").write_text('password = "pw"\n', encoding="utf-8")
+
+        first = scan_repository(root, processes=2)
+        assert sorted(first.findings) == ["pkg/copy.PY", "pkg/weather.py"]
+        assert (first.scanned, first.cached, first.total) == (3, 0, 2)
+
+        second = scan_repository(root, processes=2)
+        assert (second.scanned, second.cached) == (3, 3)
+        assert second.findings == first.findings
+
+        (root / "clean.py").write_text('password = "changed"\n', encoding="utf-8")
+        third = scan_repository(root, processes=1)
+        assert third.cached == 2 and "clean.py" in third.findings
+
+    print("All security_audit tests passed! ✓")
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description="AST-based security audit of Python files")
+    parser.add_argument("root", nargs="?", default=".", help="directory to scan (default: .)")
+    parser.add_argument("--processes", type=int, help="worker processes (default: CPU count)")
+    parser.add_argument("--no-cache", action="store_true", help="ignore and do not write the cache")
+    parser.add_argument("--json", action="store_true", help="print findings as JSON")
+    parser.add_argument("--include-tests", action="store_true", help="also scan test files")
+    parser.add_argument("--self-test", action="store_true", help="run the built-in tests")
+    args = parser.parse_args()
+
+    if args.self_test:
+        test_security_audit()
+        sys.exit(0)
+
+    result = scan_repository(args.root, args.processes, None if args.no_cache else "default",
+                             args.include_tests)
+    if args.json:
+        print(json.dumps({path: [asdict(f) for f in items]
+                          for path, items in result.findings.items()}, indent=2))
+    else:
+        for path, items in result.findings.items():
+            for finding in items:
+                print(f"{path}:{finding.line}: {finding.check}: {finding.message}")
+        print(f"{result.total} findings in {len(result.findings)} files "
+              f"({result.scanned} scanned, {result.cached} from cache)")
+    sys.exit(1 if result.total else 0)
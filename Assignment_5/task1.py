@@ -17,108 +17,554 @@ The code demonstrates the core pieces you would expect from an application-level
 authentication module:
 
 - Credentials are persisted outside of the source code (JSON file whose location
-  is supplied via the `CREDENTIAL_STORE_PATH` environment variable).
+  is supplied via the `CREDENTIAL_STORE_PATH` environment variable, or an
+  append-only log / SQLite database for large stores).
 - Passwords are never stored in plaintext; they are salted and hashed with PBKDF2.
 - A single entry-point, `LoginService.authenticate`, performs timing-safe password
   verification, rejecting missing users or incorrect passwords without leaking detail.
-- An automated security self-check (`audit_security_posture`) validates that the
-  module does not contain obvious hardcoded secrets or bypass conditions that some
-  AI-generated code might introduce inadvertently.
+- An automated security self-check (`audit_security_posture`, backed by the AST
+  scanner in security_audit.py) validates that the module does not contain obvious
+  hardcoded secrets or bypass conditions that some AI-generated code might
+  introduce inadvertently. It runs on demand, not at import.
 """
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import hashlib
 import hmac
 import json
 import os
+import sqlite3
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 DEFAULT_ITERATIONS = 100_000
+DEFAULT_ALGORITHM = "sha256"
+SUPPORTED_ALGORITHMS = ("sha256", "sha512")
+# Cost for new hashes; pick a value per machine with calibrate_iterations().
+PASSWORD_HASH_ITERATIONS = int(os.getenv("PASSWORD_HASH_ITERATIONS", DEFAULT_ITERATIONS))
 CREDENTIAL_STORE_PATH = Path(
     os.getenv("CREDENTIAL_STORE_PATH", "credential_store.json")
 )
+# "json", "log" or "sqlite"; unset picks one from the store path's suffix.
+CREDENTIAL_STORE_BACKEND = os.getenv("CREDENTIAL_STORE_BACKEND")
 
+SALT_BYTES = 16
+_TOKEN_PREFIX = "pbkdf2_"
+_MAX_ITERATIONS = 2 ** 31 - 1  # the largest count hashlib.pbkdf2_hmac accepts
 
-def _hash_password(password: str, *, salt: bytes) -> bytes:
-    """Derive a PBKDF2-HMAC hash using SHA-256."""
+
+def _hash_password(password: str, *, salt: bytes, iterations: int = DEFAULT_ITERATIONS,
+                   algorithm: str = DEFAULT_ALGORITHM) -> bytes:
+    """Derive a PBKDF2-HMAC hash (SHA-256 unless told otherwise)."""
     return hashlib.pbkdf2_hmac(
-        "sha256",
+        algorithm,
         password.encode("utf-8"),
         salt,
-        DEFAULT_ITERATIONS,
+        iterations,
     )
 
 
-def generate_password_hash(password: str) -> str:
+def generate_password_hash(password: str, iterations: Optional[int] = None,
+                           algorithm: str = DEFAULT_ALGORITHM) -> str:
     """
     Produce a salted password hash ready for storage.
 
-    The resulting token contains both the salt and the derived hash, encoded in base64.
+    The token records its own parameters so they can change later without
+    breaking verification: ``pbkdf2_<algorithm>$<iterations>$<salt>$<hash>``,
+    with salt and hash in base64.
+    """
+    if algorithm not in SUPPORTED_ALGORITHMS:
+        raise ValueError(f"Unsupported hash algorithm: {algorithm}")
+    iterations = iterations or PASSWORD_HASH_ITERATIONS
+    salt = os.urandom(SALT_BYTES)
+    derived = _hash_password(password, salt=salt, iterations=iterations, algorithm=algorithm)
+    return "$".join([
+        f"{_TOKEN_PREFIX}{algorithm}",
+        str(iterations),
+        base64.b64encode(salt).decode("ascii"),
+        base64.b64encode(derived).decode("ascii"),
+    ])
+
+
+def _decode_hash(encoded: str) -> Tuple[str, int, bytes, bytes]:
+    """Split a stored token into (algorithm, iterations, salt, hash).
+
+    Tokens without a ``$`` are the original format: base64(salt + hash) made
+    with SHA-256 and DEFAULT_ITERATIONS.
     """
-    salt = os.urandom(16)
-    derived = _hash_password(password, salt=salt)
-    return base64.b64encode(salt + derived).decode("ascii")
+    try:
+        if "$" not in encoded:
+            decoded = base64.b64decode(encoded.encode("ascii"))
+            return DEFAULT_ALGORITHM, DEFAULT_ITERATIONS, decoded[:SALT_BYTES], decoded[SALT_BYTES:]
+        scheme, iterations, salt, derived = encoded.split("$")
+        algorithm = scheme[len(_TOKEN_PREFIX):]
+        if not scheme.startswith(_TOKEN_PREFIX) or algorithm not in SUPPORTED_ALGORITHMS:
+            raise ValueError(f"Unsupported hash scheme: {scheme}")
+        if not (iterations.isascii() and iterations.isdigit()
+                and 1 <= int(iterations) <= _MAX_ITERATIONS):
+            raise ValueError(f"Invalid iteration count: {iterations!r}")
+        return (algorithm, int(iterations), base64.b64decode(salt.encode("ascii")),
+                base64.b64decode(derived.encode("ascii")))
+    except (ValueError, TypeError, AttributeError) as exc:
+        raise ValueError("Stored password hash is corrupted") from exc
 
 
 def verify_password(password: str, encoded: str) -> bool:
-    """Verify a plaintext password against a stored base64-encoded hash."""
-    try:
-        decoded = base64.b64decode(encoded.encode("ascii"))
-    except (ValueError, TypeError) as exc:
-        raise ValueError("Stored password hash is corrupted") from exc
+    """
+    Verify a plaintext password against a stored hash token (either format).
 
-    salt, stored_hash = decoded[:16], decoded[16:]
-    computed = _hash_password(password, salt=salt)
+    Raises ValueError for a malformed token; `LoginService.authenticate`
+    treats that as a failed login.
+    """
+    algorithm, iterations, salt, stored_hash = _decode_hash(encoded)
+    computed = _hash_password(password, salt=salt, iterations=iterations, algorithm=algorithm)
     return hmac.compare_digest(stored_hash, computed)
 
 
+def needs_rehash(encoded: str, iterations: Optional[int] = None,
+                 algorithm: str = DEFAULT_ALGORITHM) -> bool:
+    """
+    True if `encoded` was not made with the given (or current) parameters.
+
+    A malformed token always needs replacing, so it returns True as well.
+    """
+    try:
+        stored_algorithm, stored_iterations, _, _ = _decode_hash(encoded)
+    except ValueError:
+        return True
+    return "$" not in encoded or (stored_algorithm, stored_iterations) != (
+        algorithm, iterations or PASSWORD_HASH_ITERATIONS)
+
+
+def calibrate_iterations(target_seconds: float = 0.1, algorithm: str = DEFAULT_ALGORITHM,
+                         minimum: int = DEFAULT_ITERATIONS, probe_iterations: int = 20_000,
+                         rounds: int = 3) -> int:
+    """
+    Iterations that make one verification take about `target_seconds` here.
+
+    PBKDF2 cost is linear in the iteration count, so the fastest of a few
+    probe runs is scaled up. The result is rounded to a multiple of 1000 and
+    never goes below `minimum`, so calibration cannot weaken existing hashes.
+    """
+    salt = os.urandom(SALT_BYTES)
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        _hash_password("calibration", salt=salt, iterations=probe_iterations, algorithm=algorithm)
+        best = min(best, time.perf_counter() - started)
+    per_iteration = best / probe_iterations
+    iterations = int(target_seconds / per_iteration) // 1000 * 1000
+    return max(minimum, iterations)
+
+
 @dataclass
 class User:
     username: str
     password_hash: str
 
 
-class CredentialStore:
-    """Simple file-backed credential repository."""
+FileStamp = Tuple[int, int, int]
 
-    def __init__(self, path: Path = CREDENTIAL_STORE_PATH) -> None:
-        self.path = path
-        self._ensure_store_exists()
 
-    def _ensure_store_exists(self) -> None:
+def _file_stamp(path: Path) -> FileStamp:
+    st = os.stat(path)
+    return st.st_ino, st.st_mtime_ns, st.st_size
+
+
+def _atomic_write_text(path: Path, text: str) -> None:
+    """Write via a temp file and os.replace so a crash never leaves a torn store."""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+
+class JsonBackend:
+    """
+    The original format: one JSON object mapping username -> password hash.
+
+    Reads go through an in-memory index. Each lookup costs one `os.stat`; the
+    file is parsed again only when its (inode, mtime_ns, size) stamp changes,
+    e.g. after another process rewrites it. `cache_hits` and `reloads` count
+    how lookups were served. Writes still rewrite the whole file (atomically).
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.cache_hits = 0
+        self.reloads = 0
+        self._index: Dict[str, str] = {}
+        self._stamp: Optional[FileStamp] = None
+        self._lock = threading.Lock()
         if not self.path.exists():
-            self.path.write_text("{}", encoding="utf-8")
+            _atomic_write_text(self.path, "{}")
 
     def _load(self) -> Dict[str, str]:
         return json.loads(self.path.read_text(encoding="utf-8"))
 
-    def _save(self, data: Dict[str, str]) -> None:
-        self.path.write_text(json.dumps(data), encoding="utf-8")
+    def _current_index(self) -> Dict[str, str]:
+        stamp = _file_stamp(self.path)
+        with self._lock:
+            if stamp == self._stamp:
+                self.cache_hits += 1
+                return self._index
+            # Stamp taken before the read: a write racing the read leaves the
+            # stamp stale, so the next lookup reloads again.
+            self._index = self._load()
+            self._stamp = stamp
+            self.reloads += 1
+            return self._index
+
+    def get(self, username: str) -> Optional[str]:
+        return self._current_index().get(username)
+
+    def items(self) -> List[Tuple[str, str]]:
+        return list(self._current_index().items())
+
+    def add_many(self, entries: Dict[str, str]) -> None:
+        with self._lock:
+            data = self._load()
+            for username in entries:
+                if username in data:
+                    raise ValueError(f"User already exists: {username}")
+            self._write_locked(data, entries)
+
+    def set_many(self, entries: Dict[str, str]) -> None:
+        """Replace the hashes of existing users."""
+        with self._lock:
+            data = self._load()
+            for username in entries:
+                if username not in data:
+                    raise KeyError(username)
+            self._write_locked(data, entries)
+
+    def _write_locked(self, data: Dict[str, str], entries: Dict[str, str]) -> None:
+        data.update(entries)
+        _atomic_write_text(self.path, json.dumps(data))
+        self._index = data
+        self._stamp = _file_stamp(self.path)
+
+
+class LogBackend:
+    """
+    Append-only log: one ``["username", "hash"]`` JSON line per record.
+
+    Adding users appends and fsyncs once per batch instead of rewriting the
+    store. Later records win, so a replaced hash leaves a dead record behind;
+    once dead records outnumber live ones (and exceed `compact_min_dead`) the
+    log is rewritten with live records only. A line torn by a crash is skipped
+    on replay and counted as dead. Lookups use the same stat-checked index as
+    JsonBackend; when the file has only grown, just the new tail is read.
+    """
+
+    def __init__(self, path: Path, compact_min_dead: int = 1000) -> None:
+        self.path = path
+        self.compact_min_dead = compact_min_dead
+        self.cache_hits = 0
+        self.reloads = 0
+        self.compactions = 0
+        self._index: Dict[str, str] = {}
+        self._records = 0
+        self._offset = 0  # end of the last complete line replayed
+        self._stamp: Optional[FileStamp] = None
+        self._lock = threading.Lock()
+        self.path.touch(exist_ok=True)
+
+    @property
+    def dead_records(self) -> int:
+        return self._records - len(self._index)
+
+    def _refresh_locked(self, stamp: FileStamp) -> None:
+        grown = (self._stamp is not None and stamp[0] == self._stamp[0]
+                 and stamp[2] >= self._offset)
+        if not grown:
+            self._index, self._records, self._offset = {}, 0, 0
+        with open(self.path, "rb") as f:
+            f.seek(self._offset)
+            data = f.read()
+        end = data.rfind(b"\n") + 1  # a trailing partial line may still be being written
+        for line in data[:end].splitlines():
+            self._records += 1
+            try:
+                username, password_hash = json.loads(line)
+            except ValueError:
+                continue
+            self._index[username] = password_hash
+        self._offset += end
+        self._stamp = stamp
+        self.reloads += 1
+
+    def _current_index(self) -> Dict[str, str]:
+        stamp = _file_stamp(self.path)
+        with self._lock:
+            if stamp == self._stamp:
+                self.cache_hits += 1
+            else:
+                self._refresh_locked(stamp)
+            return self._index
+
+    def get(self, username: str) -> Optional[str]:
+        return self._current_index().get(username)
+
+    def items(self) -> List[Tuple[str, str]]:
+        return list(self._current_index().items())
+
+    def _append_locked(self, entries: Dict[str, str]) -> None:
+        payload = "".join(json.dumps([u, h]) + "\n" for u, h in entries.items())
+        with open(self.path, "ab") as f:
+            if f.tell() > self._offset:
+                # Leftover bytes of a torn append: end that line so it is skipped.
+                payload = "\n" + payload
+                self._records += 1
+            f.write(payload.encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+            self._offset = f.tell()
+        self._records += len(entries)
+        self._index.update(entries)
+        self._stamp = _file_stamp(self.path)
+
+    def _write_locked(self, entries: Dict[str, str], replace: bool) -> None:
+        stamp = _file_stamp(self.path)
+        if stamp != self._stamp:
+            self._refresh_locked(stamp)
+        for username in entries:
+            exists = username in self._index
+            if exists and not replace:
+                raise ValueError(f"User already exists: {username}")
+            if replace and not exists:
+                raise KeyError(username)
+        self._append_locked(entries)
+        if self.dead_records > max(self.compact_min_dead, len(self._index)):
+            self._compact_locked()
+
+    def add_many(self, entries: Dict[str, str]) -> None:
+        with self._lock:
+            self._write_locked(entries, replace=False)
+
+    def set_many(self, entries: Dict[str, str]) -> None:
+        """Append replacement hashes for existing users (old records become dead)."""
+        with self._lock:
+            self._write_locked(entries, replace=True)
+
+    def _compact_locked(self) -> None:
+        _atomic_write_text(self.path, "".join(
+            json.dumps([u, h]) + "\n" for u, h in self._index.items()))
+        self._records = len(self._index)
+        self._stamp = _file_stamp(self.path)
+        self._offset = self._stamp[2]
+        self.compactions += 1
+
+    def compact(self) -> None:
+        with self._lock:
+            self._refresh_locked(_file_stamp(self.path))
+            self._compact_locked()
+
+
+class SqliteBackend:
+    """
+    stdlib sqlite3 in WAL mode: readers never block the writer, lookups use the
+    primary-key index, and each batch is one transaction. Connections are
+    per-thread because sqlite3 connections cannot be shared across threads.
+    """
+
+    def __init__(self, path: Path, timeout: float = 30.0) -> None:
+        self.path = path
+        self.timeout = timeout
+        self._local = threading.local()
+        conn = self._conn()
+        conn.execute("PRAGMA journal_mode=WAL")
+        with conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS users ("
+                "username TEXT PRIMARY KEY, password_hash TEXT NOT NULL) WITHOUT ROWID"
+            )
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.path), timeout=self.timeout)
+            # Safe with WAL: a crash can lose the last commit, never corrupt the file.
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, username: str) -> Optional[str]:
+        row = self._conn().execute(
+            "SELECT password_hash FROM users WHERE username = ?", (username,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def items(self) -> List[Tuple[str, str]]:
+        return self._conn().execute("SELECT username, password_hash FROM users").fetchall()
+
+    def add_many(self, entries: Dict[str, str]) -> None:
+        conn = self._conn()
+        try:
+            with conn:
+                conn.executemany("INSERT INTO users VALUES (?, ?)", entries.items())
+        except sqlite3.IntegrityError as exc:
+            raise ValueError(f"User already exists: {exc}") from exc
+
+    def set_many(self, entries: Dict[str, str]) -> None:
+        """Replace the hashes of existing users; KeyError (and no change) if one is missing."""
+        conn = self._conn()
+        with conn:
+            cursor = conn.executemany(
+                "UPDATE users SET password_hash = ? WHERE username = ?",
+                [(h, u) for u, h in entries.items()],
+            )
+            if cursor.rowcount != len(entries):
+                raise KeyError("Unknown user in update")
+
+
+BACKENDS = {"json": JsonBackend, "log": LogBackend, "sqlite": SqliteBackend}
+_SUFFIX_BACKENDS = {".log": "log", ".jsonl": "log", ".db": "sqlite", ".sqlite": "sqlite",
+                    ".sqlite3": "sqlite"}
+
+
+def _backend_name(path: Path, backend: Optional[str]) -> str:
+    name = backend or _SUFFIX_BACKENDS.get(path.suffix.lower(), "json")
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown credential store backend: {name}")
+    return name
+
+
+class CredentialStore:
+    """
+    Credential repository over a pluggable backend.
+
+    `backend` is "json" (the original single-file map), "log" (append-only
+    log with compaction) or "sqlite" (WAL-mode database); when omitted it is
+    taken from CREDENTIAL_STORE_BACKEND or else the path's suffix
+    (.log/.jsonl, .db/.sqlite/.sqlite3; anything else is JSON).
+    """
+
+    def __init__(self, path: Path = CREDENTIAL_STORE_PATH,
+                 backend: Optional[str] = CREDENTIAL_STORE_BACKEND) -> None:
+        self.path = Path(path)
+        self.backend_name = _backend_name(self.path, backend)
+        self.backend = BACKENDS[self.backend_name](self.path)
+
+    @property
+    def cache_hits(self) -> int:
+        return getattr(self.backend, "cache_hits", 0)
+
+    @property
+    def reloads(self) -> int:
+        return getattr(self.backend, "reloads", 0)
 
     def get_user(self, username: str) -> Optional[User]:
-        data = self._load()
-        if username not in data:
+        password_hash = self.backend.get(username)
+        if password_hash is None:
             return None
-        return User(username=username, password_hash=data[username])
+        return User(username=username, password_hash=password_hash)
 
     def add_user(self, username: str, password: str) -> User:
-        data = self._load()
-        if username in data:
+        # Check first: hashing is the expensive part. add_many re-checks atomically.
+        if self.backend.get(username) is not None:
             raise ValueError("User already exists")
-        data[username] = generate_password_hash(password)
-        self._save(data)
-        return User(username=username, password_hash=data[username])
+        password_hash = generate_password_hash(password)
+        self.backend.add_many({username: password_hash})
+        return User(username=username, password_hash=password_hash)
+
+    def update_password_hash(self, username: str, password_hash: str) -> None:
+        """Replace a stored hash (KeyError if the user does not exist)."""
+        self.backend.set_many({username: password_hash})
+
+    def bulk_add_users(self, users: Iterable[Tuple[str, str]], batch_size: int = 1000,
+                       max_workers: Optional[int] = None) -> int:
+        """
+        Add (username, password) pairs, hashing on a thread pool (PBKDF2 releases
+        the GIL) and writing one backend batch per `batch_size` users.
+
+        A duplicate username raises ValueError for its batch; earlier batches
+        stay committed. Returns the number of users added.
+        """
+        added = 0
+        users = iter(users)
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as pool:
+            while True:
+                batch = list(islice(users, batch_size))
+                if not batch:
+                    return added
+                names = [username for username, _ in batch]
+                if len(set(names)) != len(names):
+                    raise ValueError("Duplicate usernames in batch")
+                hashes = pool.map(generate_password_hash, [password for _, password in batch])
+                self.backend.add_many(dict(zip(names, hashes)))
+                added += len(batch)
+
+
+def migrate_store(source: Path, target: Path, backend: Optional[str] = None,
+                  batch_size: int = 10_000) -> int:
+    """
+    Copy every stored hash from `source` into a new store at `target`.
+
+    Hashes are copied as-is (no passwords are needed). Returns the number of
+    users migrated; a target that already holds any of them raises ValueError.
+    """
+    source_store = CredentialStore(Path(source))
+    target_store = CredentialStore(Path(target), backend)
+    items = iter(source_store.backend.items())
+    migrated = 0
+    while True:
+        batch = dict(islice(items, batch_size))
+        if not batch:
+            return migrated
+        target_store.backend.add_many(batch)
+        migrated += len(batch)
 
 
 class LoginService:
-    """Handles user authentication against the credential store."""
+    """
+    Handles user authentication against the credential store.
+
+    A successful login whose stored hash was made with other parameters than
+    `hash_iterations`/`hash_algorithm` (including the original unversioned
+    format) is rehashed with the current ones, so a new cost setting rolls out
+    as users log in.
+
+    `authenticate` verifies on the caller's thread. `authenticate_many` and
+    `authenticate_async` run verifications on a shared thread pool; PBKDF2 in
+    hashlib releases the GIL, so they scale with cores. `authenticate_async`
+    admits at most `max_concurrency` verifications at a time, and `metrics()`
+    reports how many are queued (waiting for a slot or a worker) and running.
+    """
 
-    def __init__(self, store: Optional[CredentialStore] = None) -> None:
+    def __init__(self, store: Optional[CredentialStore] = None, max_workers: Optional[int] = None,
+                 max_concurrency: Optional[int] = None, hash_iterations: Optional[int] = None,
+                 hash_algorithm: str = DEFAULT_ALGORITHM) -> None:
         self.store = store or CredentialStore()
+        self.hash_iterations = hash_iterations or PASSWORD_HASH_ITERATIONS
+        self.hash_algorithm = hash_algorithm
+        self.rehashes = 0
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_concurrency = max_concurrency or self.max_workers
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._slots_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._metrics_lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._max_queued = 0
+        self._completed = 0
 
     def authenticate(self, username: str, password: str) -> bool:
         if not username or not password:
@@ -127,29 +573,129 @@ class LoginService:
         user = self.store.get_user(username)
         if user is None:
             return False
-        return verify_password(password, user.password_hash)
+        try:
+            if not verify_password(password, user.password_hash):
+                return False
+        except ValueError:
+            return False  # a corrupted stored token can never match
+        if needs_rehash(user.password_hash, self.hash_iterations, self.hash_algorithm):
+            self._rehash(username, password)
+        return True
+
+    def _rehash(self, username: str, password: str) -> None:
+        new_hash = generate_password_hash(password, self.hash_iterations, self.hash_algorithm)
+        try:
+            self.store.update_password_hash(username, new_hash)
+        except (KeyError, OSError, sqlite3.Error):
+            return  # the login already succeeded; try again next time
+        with self._metrics_lock:
+            self.rehashes += 1
+
+    def _executor(self) -> ThreadPoolExecutor:
+        with self._metrics_lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(self.max_workers, thread_name_prefix="pbkdf2")
+            return self._pool
+
+    def _enqueue(self) -> None:
+        with self._metrics_lock:
+            self._queued += 1
+            self._max_queued = max(self._max_queued, self._queued)
+
+    def _run(self, username: str, password: str) -> bool:
+        with self._metrics_lock:
+            self._queued -= 1
+            self._running += 1
+        try:
+            return self.authenticate(username, password)
+        finally:
+            with self._metrics_lock:
+                self._running -= 1
+                self._completed += 1
+
+    def authenticate_many(self, credentials: Iterable[Tuple[str, str]]) -> List[bool]:
+        """Authenticate (username, password) pairs concurrently; results keep input order."""
+        pool = self._executor()
+        futures = []
+        for username, password in credentials:
+            self._enqueue()
+            futures.append(pool.submit(self._run, username, password))
+        return [future.result() for future in futures]
+
+    async def authenticate_async(self, username: str, password: str) -> bool:
+        """Awaitable `authenticate` that never blocks the event loop."""
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._slots_loop is not loop:
+            self._slots, self._slots_loop = asyncio.Semaphore(self.max_concurrency), loop
+        self._enqueue()
+        try:
+            await self._slots.acquire()
+        except BaseException:
+            with self._metrics_lock:
+                self._queued -= 1
+            raise
+        try:
+            future = self._executor().submit(self._run, username, password)
+            try:
+                return await asyncio.wrap_future(future)
+            except asyncio.CancelledError:
+                if future.cancel():  # never started, so _run will not dequeue it
+                    with self._metrics_lock:
+                        self._queued -= 1
+                raise
+        finally:
+            self._slots.release()
+
+    def metrics(self) -> Dict[str, int]:
+        with self._metrics_lock:
+            return {
+                "queued": self._queued,
+                "running": self._running,
+                "max_queued": self._max_queued,
+                "completed": self._completed,
+            }
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
 
 
 def audit_security_posture(source: str) -> Dict[str, bool]:
     """
-    Naïve automated audit to detect common insecure patterns that AI-generated
-    code could accidentally introduce.
+    Flag insecure patterns in `source` using the AST rules of security_audit.py.
+
+    Runs only when called (nothing is scanned at import); use
+    `python security_audit.py <dir>` to audit a whole tree with caching.
     """
+    audit = _load_security_audit()
+    checks = {finding.check for finding in audit.audit_source(source)}
     return {
-        "hardcoded_password_literal": "password" in source.lower()
-        and any(token in source for token in ["=", "==", "!="]),
-        "hardcoded_username_literal": "admin" in source.lower(),
-        "insecure_shortcuts": "if True" in source or "return True" in source,
+        "hardcoded_password_literal": bool(checks & {"hardcoded_secret", "hardcoded_password"}),
+        "hardcoded_username_literal": "default_account" in checks,
+        "insecure_shortcuts": "insecure_shortcut" in checks,
     }
 
 
-SECURITY_ANALYSIS = audit_security_posture(Path(__file__).read_text(encoding="utf-8"))
+def _load_security_audit():
+    # Loaded by path: this module is itself often imported by path from other folders.
+    import importlib.util
+    import sys
+
+    name = "assignment5_security_audit"
+    if name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(
+            name, Path(__file__).resolve().with_name("security_audit.py"))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module  # dataclasses resolve annotations through sys.modules
+        spec.loader.exec_module(module)
+    return sys.modules[name]
 
 
 if __name__ == "__main__":
     service = LoginService()
 
-    print("Security audit flags:", SECURITY_ANALYSIS)
+    print("Security audit flags:", audit_security_posture(Path(__file__).read_text(encoding="utf-8")))
     action = input("Select action (register/login): ").strip().lower()
 
     if action not in {"register", "login"}:
@@ -5,15 +5,20 @@ Job Applicant Scoring System
 This module defines a transparent scoring pipeline for job applicants based on
 structured feature inputs. The design emphasizes explainability, tunable
 weightings, and fairness safeguards (e.g., no demographic attributes).
+
+`ApplicantScorer.score` handles one applicant and prints its breakdown;
+`ApplicantScorer.score_many` scores a whole feature matrix with NumPy.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Mapping, Tuple
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 
 Numeric = float
 
+SENSITIVE_FEATURES = frozenset({"gender", "race", "ethnicity", "age", "marital_status"})
+
 
 @dataclass
 class FeatureRule:
@@ -36,6 +41,17 @@ class FeatureRule:
         return self.weight * self.normalize(value)
 
 
+@dataclass(frozen=True)
+class CompiledRules:
+    """Feature rules flattened into parallel tuples for batch scoring."""
+
+    names: Tuple[str, ...]
+    weights: Tuple[Numeric, ...]
+    lower: Tuple[Numeric, ...]
+    upper: Tuple[Numeric, ...]
+    total_weight: Numeric
+
+
 @dataclass
 class ApplicantScorer:
     """
@@ -78,18 +94,48 @@ class ApplicantScorer:
             ),
         }
     )
+    _compiled: Optional[CompiledRules] = field(default=None, init=False, repr=False, compare=False)
 
-    def score(self, features: Mapping[str, Numeric]) -> Numeric:
+    def compiled_rules(self) -> CompiledRules:
+        """
+        Return the rules as parallel tuples, rebuilt only when a rule changed.
+
+        Raises ValueError if the weights sum to zero.
+        """
+        rules = self.feature_rules
+        compiled = self._compiled
+        if (
+            compiled is None
+            or compiled.names != tuple(rules)
+            or any(
+                rule.weight != weight or rule.bounds != (lower, upper)
+                for rule, weight, lower, upper in zip(
+                    rules.values(), compiled.weights, compiled.lower, compiled.upper
+                )
+            )
+        ):
+            total_weight = sum(rule.weight for rule in rules.values())
+            if not total_weight:
+                raise ValueError("Total feature weight must be greater than zero.")
+            compiled = self._compiled = CompiledRules(
+                names=tuple(rules),
+                weights=tuple(rule.weight for rule in rules.values()),
+                lower=tuple(rule.bounds[0] for rule in rules.values()),
+                upper=tuple(rule.bounds[1] for rule in rules.values()),
+                total_weight=total_weight,
+            )
+        return compiled
+
+    def score(self, features: Mapping[str, Numeric], verbose: bool = True) -> Numeric:
         """
         Compute the aggregate score for the applicant from 0 to 100.
 
         Any missing feature defaults to the minimum bound (i.e., neutral zero).
         Demographic attributes must NOT be part of the input; validators should
-        strip such fields before calling this function.
+        strip such fields before calling this function. Pass ``verbose=False``
+        to skip building and printing the breakdown.
         """
-        total_weight = sum(rule.weight for rule in self.feature_rules.values())
-        if not total_weight:
-            raise ValueError("Total feature weight must be greater than zero.")
+        total_weight = self.compiled_rules().total_weight
 
         weighted_sum = 0.0
         breakdowns: List[str] = []
@@ -97,20 +143,78 @@ class ApplicantScorer:
             value = features.get(name, rule.bounds[0])
             contribution = rule.contribution(value)
             weighted_sum += contribution
-            breakdowns.append(f"{name}: value={value}, contribution={contribution:.2f}")
+            if verbose:
+                breakdowns.append(f"{name}: value={value}, contribution={contribution:.2f}")
 
         score_out_of_100 = (weighted_sum / total_weight) * 100.0
         self._validate_no_sensitive_features(features)
 
-        # Debug statement (could be replaced by logging in production)
-        print("Score breakdown:\n  " + "\n  ".join(breakdowns))
+        if verbose:
+            # Debug statement (could be replaced by logging in production)
+            print("Score breakdown:\n  " + "\n  ".join(breakdowns))
         return round(score_out_of_100, 2)
 
+    def score_many(
+        self,
+        matrix,
+        columns: Optional[Sequence[str]] = None,
+        breakdown: bool = False,
+    ):
+        """
+        Score every row of a 2D feature matrix; returns a float array of scores.
+
+        `columns` names the matrix columns (default: the rule order). Columns
+        without a rule are ignored and rules without a column count as their
+        minimum bound, as in `score`. The sensitive-attribute check runs once,
+        against the column names. Scores agree with `score` up to float
+        rounding in the last place before the final 2-decimal round, NaN
+        values included.
+
+        With ``breakdown=True`` returns ``(scores, contributions)`` where
+        `contributions` maps each rule name to its per-row weighted
+        contribution array; nothing is printed either way.
+        """
+        import numpy as np
+
+        compiled = self.compiled_rules()
+        matrix = np.asarray(matrix, dtype=np.float64)
+        if matrix.ndim != 2:
+            raise ValueError(f"Feature matrix must be 2D, not {matrix.ndim}D.")
+        columns = compiled.names if columns is None else tuple(columns)
+        if len(columns) != matrix.shape[1]:
+            raise ValueError(
+                f"Got {len(columns)} column names for a matrix with {matrix.shape[1]} columns."
+            )
+        self._validate_no_sensitive_features(columns)
+
+        positions = {name: i for i, name in enumerate(columns)}
+        present = [j for j, name in enumerate(compiled.names) if name in positions]
+        lower = np.array(compiled.lower)[present]
+        upper = np.array(compiled.upper)[present]
+        span = upper - lower
+        weights = np.array(compiled.weights)[present]
+
+        values = matrix[:, [positions[compiled.names[j]] for j in present]]
+        # Same clamp as FeatureRule.normalize: max(lower, min(upper, value)).
+        # Python's min/max keep the bound when the value is NaN, so a NaN
+        # feature scores as its upper bound there; fmin/fmax do the same.
+        normalized = np.fmax(lower, np.fmin(upper, values)) - lower
+        # A rule with lower == upper always contributes 0.
+        np.divide(normalized, span, out=normalized, where=span != 0)
+        normalized[:, span == 0] = 0.0
+        scores = np.round(normalized @ weights / compiled.total_weight * 100.0, 2)
+        if not breakdown:
+            return scores
+
+        contributions = {name: np.zeros(len(matrix)) for name in compiled.names}
+        for k, j in enumerate(present):
+            contributions[compiled.names[j]] = normalized[:, k] * weights[k]
+        return scores, contributions
+
     @staticmethod
-    def _validate_no_sensitive_features(features: Mapping[str, Numeric]) -> None:
+    def _validate_no_sensitive_features(features: Iterable[str]) -> None:
         """Reject inputs containing obvious demographic proxies."""
-        sensitive = {"gender", "race", "ethnicity", "age", "marital_status"}
-        overlap = sensitive.intersection(features)
+        overlap = SENSITIVE_FEATURES.intersection(features)
         if overlap:
             raise ValueError(
                 f"Sensitive attributes {sorted(overlap)} must be excluded from scoring."
@@ -126,7 +230,67 @@ def explain_weights(scorer: ApplicantScorer) -> Dict[str, str]:
     return explanations
 
 
+def test_score_many():
+    """Check score_many against score on random applicants."""
+    import contextlib
+    import io
+    import random
+
+    import numpy as np
+
+    scorer = ApplicantScorer()
+    names = list(scorer.feature_rules)
+    rng = random.Random(46)
+    rows = [[rng.uniform(-5, 120) for _ in names] for _ in range(500)]
+    with contextlib.redirect_stdout(io.StringIO()) as out:
+        expected = [scorer.score(dict(zip(names, row)), verbose=False) for row in rows]
+    assert out.getvalue() == "", "verbose=False must not print"
+    assert np.allclose(scorer.score_many(rows), expected, atol=0.011)
+
+    # Reordered, extra and missing columns behave like the mapping API.
+    columns = ["relevant_certifications", "referral_bonus", "technical_assessment"]
+    subset = [[row[4], 99.0, row[2]] for row in rows]
+    with contextlib.redirect_stdout(io.StringIO()) as out:
+        expected = [scorer.score(dict(zip(columns, row)), verbose=False) for row in subset]
+        scores, contributions = scorer.score_many(subset, columns, breakdown=True)
+    assert out.getvalue() == ""
+    assert np.allclose(scores, expected, atol=0.011)
+    assert set(contributions) == set(names)
+    assert not contributions["years_experience"].any()
+    assert np.isclose(contributions["technical_assessment"][0],
+                      scorer.feature_rules["technical_assessment"].contribution(rows[0][2]))
+
+    # NaN features clamp exactly as the scalar path clamps them.
+    nan = float("nan")
+    odd = [[nan] * len(names), [nan, 1.0, nan, 2.0, float("inf")], [float("-inf"), nan, 50.0, nan, 1.0]]
+    with contextlib.redirect_stdout(io.StringIO()):
+        expected = [scorer.score(dict(zip(names, row)), verbose=False) for row in odd]
+    scores = scorer.score_many(odd)
+    assert not np.isnan(scores).any()
+    assert np.allclose(scores, expected, atol=0.011)
+
+    # Rule edits invalidate the compiled cache; degenerate bounds contribute 0.
+    scorer.feature_rules["soft_skills_rating"] = FeatureRule(0.5, (2.0, 2.0), "flat")
+    assert scorer.compiled_rules().total_weight == sum(r.weight for r in scorer.feature_rules.values())
+    assert np.allclose(scorer.score_many(rows),
+                       [scorer.score(dict(zip(names, row)), verbose=False) for row in rows], atol=0.011)
+
+    for bad_columns in (["gender"] + names[1:], names[:-1]):
+        try:
+            scorer.score_many(rows, bad_columns)
+            assert False, f"{bad_columns} should be rejected"
+        except ValueError:
+            pass
+    print("All score_many tests passed! ✓")
+
+
 if __name__ == "__main__":
+    import sys
+
+    if "--self-test" in sys.argv:
+        test_score_many()
+        raise SystemExit(0)
+
     scorer = ApplicantScorer()
     applicant_features = {
         "years_experience": 7,
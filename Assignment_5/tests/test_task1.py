@@ -0,0 +1,192 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import task1
+
+
+class TestCredentialStoreCache(unittest.TestCase):
+    def test_reloads_only_when_file_changes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'creds.json'
+            store = task1.CredentialStore(path)
+            store.add_user('ana', 'pw')
+            self.assertEqual(store.get_user('ana').username, 'ana')
+            self.assertIsNone(store.get_user('bob'))
+            self.assertEqual((store.reloads, store.cache_hits), (1, 2))
+
+            # Another writer replaces the file: the next lookup reloads once.
+            other = task1.CredentialStore(path)
+            other.add_user('bob', 'pw2')
+            self.assertIsNotNone(store.get_user('bob'))
+            self.assertIsNotNone(store.get_user('ana'))
+            self.assertEqual((store.reloads, store.cache_hits), (2, 3))
+
+
+class TestCredentialBackends(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.tmp = Path(self._tmp.name)
+
+    def test_every_backend_adds_and_authenticates(self):
+        for name, filename in [('json', 'c.json'), ('log', 'c.log'), ('sqlite', 'c.db')]:
+            with self.subTest(backend=name):
+                store = task1.CredentialStore(self.tmp / filename)
+                self.assertEqual(store.backend_name, name)
+                store.add_user('ana', 'pw')
+                added = store.bulk_add_users([(f'u{i}', f'pw{i}') for i in range(5)],
+                                             batch_size=2, max_workers=2)
+                self.assertEqual(added, 5)
+                with self.assertRaises(ValueError):
+                    store.add_user('u3', 'again')
+                with self.assertRaises(ValueError):
+                    store.bulk_add_users([('new', 'x'), ('ana', 'y')])
+                self.assertIsNone(store.get_user('new'))
+
+                reopened = task1.CredentialStore(self.tmp / filename)
+                service = task1.LoginService(reopened)
+                self.assertTrue(service.authenticate('u4', 'pw4'))
+                self.assertFalse(service.authenticate('u4', 'pw3'))
+                self.assertEqual(len(reopened.backend.items()), 6)
+
+    def test_log_skips_torn_line_and_compacts(self):
+        path = self.tmp / 'c.log'
+        store = task1.CredentialStore(path)
+        store.add_user('ana', 'pw')
+        with path.open('ab') as f:
+            f.write(b'["half-writ')  # crash mid-append
+        store.add_user('bob', 'pw')
+        self.assertEqual(task1.CredentialStore(path).backend.items(),
+                         store.backend.items())
+
+        backend = store.backend
+        backend.compact_min_dead = 2
+        # Torn line + two replaced hashes = 3 dead records > max(2, live users).
+        for _ in range(2):
+            backend.set_many({'ana': backend.get('bob')})
+        self.assertEqual(backend.compactions, 1)
+        self.assertEqual(len(path.read_text(encoding='utf-8').splitlines()), 2)
+        self.assertTrue(task1.LoginService(task1.CredentialStore(path))
+                        .authenticate('ana', 'pw'))
+
+    def test_migrate_json_store(self):
+        source = self.tmp / 'c.json'
+        task1.CredentialStore(source).bulk_add_users([('ana', 'pw'), ('bob', 'pw2')])
+        for target in ('c.db', 'c.log'):
+            self.assertEqual(task1.migrate_store(source, self.tmp / target), 2)
+            migrated = task1.CredentialStore(self.tmp / target)
+            self.assertEqual(sorted(migrated.backend.items()),
+                             sorted(task1.CredentialStore(source).backend.items()))
+
+
+class TestHashParameters(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.tmp = Path(self._tmp.name)
+
+    def _legacy_token(self, password):
+        import base64
+        import hashlib
+        import os
+
+        salt = os.urandom(16)
+        derived = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt, 100_000)
+        return base64.b64encode(salt + derived).decode('ascii')
+
+    def test_token_records_parameters(self):
+        token = task1.generate_password_hash('pw', iterations=2000, algorithm='sha512')
+        self.assertTrue(token.startswith('pbkdf2_sha512$2000$'))
+        self.assertTrue(task1.verify_password('pw', token))
+        self.assertFalse(task1.verify_password('nope', token))
+        self.assertTrue(task1.needs_rehash(token, 3000, 'sha512'))
+        self.assertFalse(task1.needs_rehash(token, 2000, 'sha512'))
+        with self.assertRaises(ValueError):
+            task1.verify_password('pw', 'pbkdf2_md5$1$AA==$AA==')
+
+    def test_malformed_iteration_count_fails_login(self):
+        good = task1.generate_password_hash('pw', iterations=2000)
+        _, _, salt, derived = good.split('$')
+        store = task1.CredentialStore(self.tmp / 'c.json')
+        store.backend.add_many({'ana': good})
+        service = task1.LoginService(store, hash_iterations=2000)
+        for count in ('0', '-5', ' 7', '1_000', '2147483648', '99999999999999999999', 'x'):
+            with self.subTest(iterations=count):
+                token = f'pbkdf2_sha256${count}${salt}${derived}'
+                with self.assertRaises(ValueError):
+                    task1.verify_password('pw', token)
+                self.assertTrue(task1.needs_rehash(token, 2000))
+                store.backend.set_many({'ana': token})
+                self.assertFalse(service.authenticate('ana', 'pw'))
+        self.assertTrue(task1.needs_rehash('not base64 $$$'))
+        self.assertEqual(service.rehashes, 0)
+
+    def test_legacy_token_verifies_and_is_rehashed_on_login(self):
+        for filename in ('c.json', 'c.log', 'c.db'):
+            with self.subTest(store=filename):
+                store = task1.CredentialStore(self.tmp / filename)
+                store.backend.add_many({'ana': self._legacy_token('pw')})
+                service = task1.LoginService(store, hash_iterations=3000)
+                self.assertFalse(service.authenticate('ana', 'wrong'))
+                self.assertEqual(service.rehashes, 0)
+                self.assertTrue(service.authenticate('ana', 'pw'))
+                self.assertTrue(store.get_user('ana').password_hash.startswith('pbkdf2_sha256$3000$'))
+                self.assertTrue(service.authenticate('ana', 'pw'))
+                self.assertEqual(service.rehashes, 1)
+
+    def _calibrate(self, target, probe_seconds, **kwargs):
+        # Each probe round reads the clock twice; the fastest round is used.
+        ticks = []
+        for elapsed in probe_seconds:
+            ticks += [0.0, elapsed]
+        with mock.patch.object(task1.time, 'perf_counter', side_effect=ticks):
+            return task1.calibrate_iterations(target, rounds=len(probe_seconds), **kwargs)
+
+    def test_calibration_scales_with_target(self):
+        # Fastest probe: 2000 iterations in 0.02 s, i.e. 10 microseconds each.
+        probes = [0.03, 0.02, 0.025]
+        self.assertEqual(self._calibrate(0.05, probes, minimum=1000, probe_iterations=2000), 5000)
+        self.assertEqual(self._calibrate(0.1, probes, minimum=1000, probe_iterations=2000), 10000)
+        # Rounded down to a multiple of 1000.
+        self.assertEqual(self._calibrate(0.1234, probes, minimum=1000, probe_iterations=2000), 12000)
+        # A slower machine needs proportionally fewer iterations.
+        self.assertEqual(self._calibrate(0.1, [0.04], minimum=1000, probe_iterations=2000), 5000)
+        # Never below the floor.
+        self.assertEqual(self._calibrate(0.001, probes, minimum=1000, probe_iterations=2000), 1000)
+        self.assertEqual(self._calibrate(0.0, probes, probe_iterations=1000),
+                         task1.DEFAULT_ITERATIONS)
+
+
+class TestConcurrentAuthentication(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        store = task1.CredentialStore(Path(self._tmp.name) / 'c.json')
+        store.bulk_add_users([('ana', 'pw'), ('bob', 'pw2')])
+        self.service = task1.LoginService(store, max_workers=2, max_concurrency=1)
+        self.addCleanup(self.service.close)
+
+    def test_authenticate_many_keeps_order(self):
+        results = self.service.authenticate_many(
+            [('ana', 'pw'), ('bob', 'wrong'), ('carl', 'x'), ('bob', 'pw2')])
+        self.assertEqual(results, [True, False, False, True])
+        self.assertEqual(self.service.metrics()['completed'], 4)
+
+    def test_async_is_bounded_and_reports_queue_depth(self):
+        import asyncio
+
+        async def run():
+            return await asyncio.gather(*(self.service.authenticate_async('ana', pw)
+                                          for pw in ['pw', 'no', 'pw']))
+
+        self.assertEqual(asyncio.run(run()), [True, False, True])
+        metrics = self.service.metrics()
+        self.assertEqual((metrics['queued'], metrics['running'], metrics['completed']), (0, 0, 3))
+        # One slot: while the first check holds it, the other two wait in the queue.
+        self.assertGreaterEqual(metrics['max_queued'], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
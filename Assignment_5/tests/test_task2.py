@@ -0,0 +1,148 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import task2
+from task2 import (
+    _evaluate_lines,
+    _read_chunks,
+    detect_bias_indicators,
+    evaluate_bias_stream,
+    mitigation_recommendations,
+)
+
+BIASED = "Reject if female. Use applicant name to infer ethnicity."
+NEUTRAL = "Approve if income covers repayments and credit history is clean."
+
+
+class TestEvaluateBiasStream(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.input = os.path.join(self.tmp.name, "in.jsonl")
+        self.output = os.path.join(self.tmp.name, "out.jsonl")
+        self.summary = os.path.join(self.tmp.name, "summary.json")
+
+    def write_input(self, lines):
+        with open(self.input, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+
+    def read_output(self):
+        with open(self.output, encoding="utf-8") as f:
+            return [json.loads(line) for line in f]
+
+    def test_records_keep_input_order_across_chunks(self):
+        lines = []
+        for i in range(23):
+            response = BIASED if i % 3 == 0 else NEUTRAL
+            lines.append(json.dumps({"id": i, "prompt": f"p{i}", "ai_response": response}))
+        lines.insert(5, "")
+        lines.insert(11, "   ")
+        self.write_input(lines)
+
+        for processes in (1, 2):
+            with self.subTest(processes=processes):
+                evaluate_bias_stream(self.input, self.output, processes=processes, chunk_size=4)
+                records = self.read_output()
+                self.assertEqual([r["id"] for r in records], list(range(23)))
+                expected_lines = [n for n, line in enumerate(lines, start=1) if line.strip()]
+                self.assertEqual([r["line"] for r in records], expected_lines)
+                for record in records:
+                    response = BIASED if record["id"] % 3 == 0 else NEUTRAL
+                    indicators = detect_bias_indicators(response)
+                    self.assertEqual(record["indicators"], indicators)
+                    self.assertEqual(record["mitigations"], mitigation_recommendations(indicators))
+
+    def test_bad_records_are_reported_in_place(self):
+        self.write_input([
+            json.dumps({"prompt": "a", "ai_response": NEUTRAL}),
+            "{not json",
+            json.dumps({"prompt": "missing response"}),
+            json.dumps({"prompt": "b", "ai_response": 42}),
+            json.dumps(["not", "an", "object"]),
+            json.dumps({"ai_response": BIASED}),
+        ])
+        summary = evaluate_bias_stream(self.input, self.output, processes=1, chunk_size=2)
+        records = self.read_output()
+
+        self.assertEqual([r["line"] for r in records], [1, 2, 3, 4, 5, 6])
+        errors = {r["line"]: r["error"] for r in records if "error" in r}
+        self.assertEqual(sorted(errors), [2, 3, 4, 5])
+        self.assertTrue(errors[2].startswith("JSONDecodeError"))
+        self.assertTrue(errors[3].startswith("KeyError"))
+        self.assertTrue(errors[4].startswith("TypeError"))
+        self.assertTrue(errors[5].startswith("AttributeError"))
+        self.assertEqual(records[5]["prompt"], "")
+        self.assertEqual(summary["errors"], 4)
+        self.assertEqual(summary["records"], 6)
+
+    def test_summary_counts(self):
+        self.write_input([
+            json.dumps({"ai_response": BIASED}),
+            json.dumps({"ai_response": NEUTRAL}),
+            json.dumps({"ai_response": "Reject if female applicants apply."}),
+            "garbage",
+        ])
+        summary = evaluate_bias_stream(
+            self.input, self.output, summary_path=self.summary, processes=1, chunk_size=3
+        )
+
+        biased = detect_bias_indicators(BIASED)
+        rejected = detect_bias_indicators("Reject if female applicants apply.")
+        expected = {}
+        for indicator in biased + rejected:
+            expected[indicator] = expected.get(indicator, 0) + 1
+        self.assertEqual(summary["records"], 4)
+        self.assertEqual(summary["flagged"], 2)
+        self.assertEqual(summary["errors"], 1)
+        self.assertEqual(summary["indicators"], expected)
+        with open(self.summary, encoding="utf-8") as f:
+            self.assertEqual(json.load(f), summary)
+        self.assertFalse(os.path.exists(self.summary + ".tmp"))
+
+    def test_summary_is_rewritten_as_records_stream(self):
+        self.write_input([json.dumps({"ai_response": BIASED})] * 10)
+        snapshots = []
+        original = task2._write_summary
+
+        def record_write(path, summary):
+            snapshots.append((summary["records"], summary["flagged"]))
+            original(path, summary)
+
+        with mock.patch.object(task2, "_write_summary", side_effect=record_write):
+            evaluate_bias_stream(
+                self.input, self.output, summary_path=self.summary,
+                processes=1, chunk_size=2, summary_every=4,
+            )
+        # Written at chunk boundaries once `summary_every` more records are in, then at the end.
+        self.assertEqual(snapshots, [(4, 4), (8, 8), (10, 10)])
+
+    def test_no_summary_file_without_path(self):
+        self.write_input([json.dumps({"ai_response": NEUTRAL})])
+        with mock.patch.object(task2, "_write_summary") as write:
+            evaluate_bias_stream(self.input, self.output, processes=1, summary_every=1)
+        write.assert_not_called()
+
+
+class TestChunkHelpers(unittest.TestCase):
+    def test_read_chunks_numbers_lines_and_skips_blanks(self):
+        source = ["a\n", "\n", "b\n", "c\n", "  \n", "d\n", "e"]
+        chunks = list(_read_chunks(iter(source), 2))
+        self.assertEqual(chunks, [
+            [(1, "a\n"), (3, "b\n")],
+            [(4, "c\n"), (6, "d\n")],
+            [(7, "e")],
+        ])
+        self.assertEqual(list(_read_chunks(iter([]), 3)), [])
+
+    def test_evaluate_lines_copies_id(self):
+        records = _evaluate_lines([(9, json.dumps({"id": "x", "prompt": "p", "ai_response": NEUTRAL}))])
+        self.assertEqual(records, [
+            {"line": 9, "prompt": "p", "indicators": [], "mitigations": mitigation_recommendations([]), "id": "x"},
+        ])
+
+
+if __name__ == "__main__":
+    unittest.main()
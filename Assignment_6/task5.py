@@ -1,3 +1,21 @@
+"""
+Bank account model plus a thread-safe transaction engine over many accounts.
+
+`BankAccount` guards its read-modify-write updates with a lock so concurrent
+deposits and withdrawals never lose an update. `TransactionEngine` shares a
+fixed pool of stripe locks between its accounts: an operation locks only the
+stripes of the accounts it touches, always in ascending stripe order, so
+transfers in opposite directions cannot deadlock, and a batch of transactions
+takes its locks once for the whole list.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+
+
 class BankAccount:
     """
     Simple bank account model that supports deposits, withdrawals, and balance checks.
@@ -7,12 +25,20 @@ class BankAccount:
         balance (float): Current balance of the account.
     """
 
-    def __init__(self, owner: str, opening_balance: float = 0.0) -> None:
-        """Create a bank account with an owner and optional opening balance."""
+    def __init__(self, owner: str, opening_balance: float = 0.0,
+                 lock: Optional[threading.Lock] = None) -> None:
+        """
+        Create a bank account with an owner and optional opening balance.
+
+        Args:
+            lock (threading.Lock, optional): Lock guarding the balance; accounts
+                may share one (lock striping). A private lock by default.
+        """
         if opening_balance < 0:
             raise ValueError("Opening balance cannot be negative.")
         self.owner = owner
         self.balance = float(opening_balance)
+        self._lock = lock if lock is not None else threading.Lock()
 
     def deposit(self, amount: float) -> None:
         """
@@ -23,7 +49,8 @@ class BankAccount:
         """
         if amount <= 0:
             raise ValueError("Deposit amount must be positive.")
-        self.balance += amount
+        with self._lock:
+            self.balance += amount
 
     def withdraw(self, amount: float) -> None:
         """
@@ -35,16 +62,331 @@ class BankAccount:
         """
         if amount <= 0:
             raise ValueError("Withdrawal amount must be positive.")
-        if amount > self.balance:
-            raise ValueError("Insufficient funds.")
-        self.balance -= amount
+        with self._lock:
+            if amount > self.balance:
+                raise ValueError("Insufficient funds.")
+            self.balance -= amount
 
     def get_balance(self) -> float:
         """Return the current account balance."""
         return self.balance
 
 
+class _StripeGuard:
+    """Context manager holding a pre-sorted list of locks."""
+
+    __slots__ = ("_locks",)
+
+    def __init__(self, locks: List[threading.Lock]) -> None:
+        self._locks = locks
+
+    def __enter__(self) -> None:
+        acquired = 0
+        try:
+            for lock in self._locks:
+                lock.acquire()
+                acquired += 1
+        except BaseException:
+            for lock in reversed(self._locks[:acquired]):
+                lock.release()
+            raise
+
+    def __exit__(self, *exc_info) -> None:
+        for lock in reversed(self._locks):
+            lock.release()
+
+
+@dataclass(frozen=True)
+class Transaction:
+    """
+    One money movement between accounts of a `TransactionEngine`.
+
+    Attributes:
+        source (str | None): Account debited; None for a deposit.
+        target (str | None): Account credited; None for a withdrawal.
+        amount (float): Positive amount moved.
+    """
+
+    source: Optional[str]
+    target: Optional[str]
+    amount: float
+
+
+class TransactionEngine:
+    """
+    Accounts keyed by id, updated under a fixed pool of striped locks.
+
+    Account i (in opening order) uses stripe ``i % stripes``. Every operation
+    locks the distinct stripes it needs in ascending index order, which is
+    the same global order for all threads, so no two operations can each
+    hold a lock the other is waiting for.
+    """
+
+    def __init__(self, stripes: int = 64) -> None:
+        if stripes < 1:
+            raise ValueError("Stripe count must be positive.")
+        self._stripes = [threading.Lock() for _ in range(stripes)]
+        self._accounts: Dict[str, BankAccount] = {}
+        self._stripe_of: Dict[str, int] = {}
+        self._registry_lock = threading.Lock()
+
+    def open_account(self, account_id: str, owner: str,
+                     opening_balance: float = 0.0) -> BankAccount:
+        """
+        Create an account whose lock is one of the engine's stripes.
+
+        The returned account's own deposit/withdraw methods stay safe to use
+        alongside engine operations because they take the same stripe lock.
+        """
+        with self._registry_lock:
+            if account_id in self._accounts:
+                raise ValueError(f"Account {account_id!r} already exists.")
+            stripe = len(self._accounts) % len(self._stripes)
+            account = BankAccount(owner, opening_balance, lock=self._stripes[stripe])
+            self._stripe_of[account_id] = stripe
+            self._accounts[account_id] = account
+        return account
+
+    def account(self, account_id: str) -> BankAccount:
+        """Return the account with this id; raises KeyError if unknown."""
+        return self._accounts[account_id]
+
+    def _lock_order(self, account_ids: Iterable[Optional[str]]) -> List[threading.Lock]:
+        stripe_of = self._stripe_of
+        try:
+            indices = {stripe_of[a] for a in account_ids if a is not None}
+        except KeyError as exc:
+            raise KeyError(f"Unknown account: {exc.args[0]}") from None
+        return [self._stripes[i] for i in sorted(indices)]
+
+    def _apply(self, tx: Transaction) -> None:
+        """Apply one transaction; caller holds the stripe locks of its accounts."""
+        if tx.amount <= 0:
+            raise ValueError("Transaction amount must be positive.")
+        if tx.source is None and tx.target is None:
+            raise ValueError("Transaction needs a source or a target account.")
+        if tx.source is not None:
+            source = self._accounts[tx.source]
+            if tx.amount > source.balance:
+                raise ValueError("Insufficient funds.")
+            source.balance -= tx.amount
+        if tx.target is not None:
+            self._accounts[tx.target].balance += tx.amount
+
+    def deposit(self, account_id: str, amount: float) -> None:
+        """Credit `amount` to one account."""
+        self.apply(Transaction(None, account_id, amount))
+
+    def withdraw(self, account_id: str, amount: float) -> None:
+        """Debit `amount` from one account; raises ValueError on insufficient funds."""
+        self.apply(Transaction(account_id, None, amount))
+
+    def transfer(self, source: str, target: str, amount: float) -> None:
+        """Move `amount` between two accounts atomically."""
+        self.apply(Transaction(source, target, amount))
+
+    def apply(self, tx: Transaction) -> None:
+        """Apply a single transaction under its accounts' stripe locks."""
+        with _StripeGuard(self._lock_order((tx.source, tx.target))):
+            self._apply(tx)
+
+    def apply_batch(self, transactions: Iterable[Transaction],
+                    atomic: bool = False) -> List[Optional[str]]:
+        """
+        Apply a list of transactions in order, taking every lock once.
+
+        Args:
+            transactions: Transactions to apply.
+            atomic (bool): If True, a rejected transaction undoes the whole
+                batch and its ValueError propagates.
+
+        Returns:
+            list: Per transaction, None if applied or the rejection message.
+        """
+        transactions = list(transactions)
+        accounts = [a for tx in transactions for a in (tx.source, tx.target)]
+        results: List[Optional[str]] = []
+        with _StripeGuard(self._lock_order(accounts)):
+            if atomic:
+                before = {a: self._accounts[a].balance for a in accounts if a is not None}
+            for tx in transactions:
+                try:
+                    self._apply(tx)
+                except ValueError as exc:
+                    if atomic:
+                        for account_id, balance in before.items():
+                            self._accounts[account_id].balance = balance
+                        raise
+                    results.append(str(exc))
+                else:
+                    results.append(None)
+        return results
+
+    def total_balance(self) -> float:
+        """Sum of all balances, read as one consistent snapshot."""
+        # Registry before stripes: nothing takes them in the other order.
+        with self._registry_lock, _StripeGuard(list(self._stripes)):
+            return sum(account.balance for account in self._accounts.values())
+
+
+def stress_test(accounts: int = 200, threads: int = 8, operations: int = 20_000,
+                batch_size: int = 1, stripes: int = 64, seed: int = 0) -> Dict[str, float]:
+    """
+    Hammer a TransactionEngine from many threads and check money is conserved.
+
+    Each thread runs `operations` random transfers (in batches of `batch_size`)
+    plus direct BankAccount withdraw/deposit pairs that cancel out (the
+    deposit only follows a successful withdrawal, since a concurrent transfer
+    may have drained the account). Amounts are whole numbers, so float
+    balances stay exact and the final total must equal the opening total.
+    An exception in any worker is re-raised here after all threads finish.
+
+    Returns:
+        dict: Counts, elapsed seconds and transactions per second.
+    """
+    import random
+    import time
+
+    engine = TransactionEngine(stripes)
+    ids = [f"acct-{i}" for i in range(accounts)]
+    for account_id in ids:
+        engine.open_account(account_id, account_id, 1000.0)
+    opening_total = engine.total_balance()
+    rejected = [0] * threads
+    errors: List[BaseException] = []
+
+    def worker(index: int) -> None:
+        try:
+            run(index)
+        except BaseException as exc:
+            errors.append(exc)
+
+    def run(index: int) -> None:
+        rng = random.Random(seed * 1000 + index)
+        remaining = operations
+        while remaining:
+            size = min(batch_size, remaining)
+            batch = []
+            for _ in range(size):
+                source, target = rng.sample(ids, 2)
+                batch.append(Transaction(source, target, float(rng.randint(1, 300))))
+            if size == 1:
+                try:
+                    engine.apply(batch[0])
+                except ValueError:
+                    rejected[index] += 1
+            else:
+                rejected[index] += sum(r is not None for r in engine.apply_batch(batch))
+            remaining -= size
+            account = engine.account(rng.choice(ids))
+            try:
+                account.withdraw(5.0)
+            except ValueError:
+                continue
+            account.deposit(5.0)
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    started = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    if errors:
+        raise errors[0]
+
+    final_total = engine.total_balance()
+    assert final_total == opening_total, f"Money not conserved: {opening_total} -> {final_total}"
+    assert all(engine.account(a).balance >= 0 for a in ids), "Negative balance"
+    transactions = threads * operations
+    return {
+        "threads": threads,
+        "batch_size": batch_size,
+        "transactions": transactions,
+        "rejected": sum(rejected),
+        "seconds": elapsed,
+        "transactions_per_second": transactions / elapsed,
+    }
+
+
+def test_transaction_engine():
+    """Batch rollback, rejection messages and totals while accounts open."""
+    engine = TransactionEngine(stripes=2)
+    for account_id, balance in (("a", 100.0), ("b", 0.0), ("c", 0.0)):
+        engine.open_account(account_id, account_id.upper(), balance)
+
+    def balances():
+        return {a: engine.account(a).balance for a in "abc"}
+
+    # The third transfer overdraws "a" after the first two were applied.
+    batch = [Transaction("a", "b", 60.0), Transaction("b", "c", 30.0),
+             Transaction("a", "c", 50.0), Transaction(None, "b", 5.0)]
+    try:
+        engine.apply_batch(batch, atomic=True)
+        assert False, "atomic batch should be rejected"
+    except ValueError as exc:
+        assert str(exc) == "Insufficient funds."
+    assert balances() == {"a": 100.0, "b": 0.0, "c": 0.0}
+
+    for bad in (Transaction("a", "zz", 1.0), Transaction(None, None, 1.0)):
+        try:
+            engine.apply_batch([Transaction("a", "b", 1.0), bad], atomic=True)
+            assert False, f"{bad} should be rejected"
+        except (KeyError, ValueError):
+            pass
+        assert balances() == {"a": 100.0, "b": 0.0, "c": 0.0}
+
+    assert engine.apply_batch(batch) == [None, None, "Insufficient funds.", None]
+    assert balances() == {"a": 40.0, "b": 35.0, "c": 30.0}
+    drain = [Transaction("b", "c", 35.0), Transaction("a", "b", 40.0)]
+    assert engine.apply_batch(drain, atomic=True) == [None, None]
+    assert balances() == {"a": 0.0, "b": 40.0, "c": 65.0}
+
+    # Totals stay readable while another thread keeps opening accounts.
+    errors = []
+    done = threading.Event()
+
+    def opener():
+        try:
+            for i in range(20_000):
+                engine.open_account(f"extra-{i}", "extra", 1.0)
+        except BaseException as exc:
+            errors.append(exc)
+        finally:
+            done.set()
+
+    thread = threading.Thread(target=opener)
+    thread.start()
+    totals = []
+    while not done.is_set():
+        totals.append(engine.total_balance())
+    thread.join()
+    assert not errors, errors
+    assert totals == sorted(totals)
+    assert engine.total_balance() == 105.0 + 20_000
+
+    # Small stress runs; stress_test itself checks conservation and worker errors.
+    for size in (1, 8):
+        result = stress_test(accounts=20, threads=4, operations=2000, batch_size=size, stripes=4)
+        assert result["transactions"] == 8000
+    print("All TransactionEngine tests passed! ✓")
+
+
 if __name__ == "__main__":
+    import sys
+
+    if "--self-test" in sys.argv:
+        test_transaction_engine()
+        raise SystemExit(0)
+
+    if "--stress" in sys.argv:
+        for size in (1, 64):
+            result = stress_test(batch_size=size)
+            print(f"batch_size={size}: {result['transactions']} transfers in "
+                  f"{result['seconds']:.2f}s ({result['transactions_per_second']:,.0f} tx/s), "
+                  f"{result['rejected']} rejected; total balance conserved")
+        raise SystemExit(0)
+
     # Demonstration of the BankAccount class usage.
     account = BankAccount("Jordan", 100.0)
 
@@ -1,4 +1,25 @@
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Iterable, List, Optional, Set
+
+# Characters an address may not start or end with; '@' and '.' are included.
+_SPECIAL = r"""!@#$%^&*()_+\-=\[\]{};':"\\|,<>/?`~."""
+
+# One compiled pattern checks everything in a single match call:
+#   - exactly one '@', at least one '.' anywhere
+#   - first and last characters are not special characters
+#   - no '.' directly before or after the '@'
+_EMAIL_RE = re.compile(
+    rf"""(?=[^.]*\.)
+        [^{_SPECIAL}] (?:[^@]*[^@.])?            # local part
+        @
+        (?:[^@.][^@]*[^{_SPECIAL}]|[^{_SPECIAL}])  # domain
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+_match_email = _EMAIL_RE.fullmatch
 
 
 def is_valid_email(email):
@@ -7,6 +28,7 @@ def is_valid_email(email):
     - Must contain @ and . characters
     - Must not start or end with special characters
     - Should not allow multiple @
+    - Must not have a . directly before or after the @
     
     Args:
         email (str): The email address to validate
@@ -14,35 +36,77 @@ def is_valid_email(email):
     Returns:
         bool: True if email is valid, False otherwise
     """
-    if not email or not isinstance(email, str):
-        return False
-    
-    # Check if email contains @ and . characters
-    if '@' not in email or '.' not in email:
-        return False
-    
-    # Check for multiple @ characters
-    if email.count('@') != 1:
-        return False
-    
-    # Define special characters (excluding @ and . which are allowed in the middle)
-    # Common special characters that shouldn't be at start/end
-    special_chars = r'[!@#$%^&*()_+\-=\[\]{};\':"\\|,<>/?`~]'
-    
-    # Check if email starts or ends with special characters
-    # We need to be careful - @ and . are special but have specific rules
-    # Let's check for other special characters at start/end
-    # Also check if it starts/ends with @ or .
-    if email[0] in '@.' or email[-1] in '@.':
+    if not isinstance(email, str):
         return False
-    
-    # Check for other special characters at start/end (excluding @ and .)
-    # Remove @ and . from the pattern for start/end check
-    other_special = r'[!#$%^&*()_+\-=\[\]{};\':"\\|,<>/?`~]'
-    if re.match(other_special, email[0]) or re.match(other_special, email[-1]):
-        return False
-    
-    return True
+    return _match_email(email) is not None
+
+
+def normalize_email(email):
+    """Dedup key for an address: the domain is case-insensitive, the local part is not."""
+    local, at, domain = email.rpartition('@')
+    return f"{local}@{domain.lower()}" if at else email
+
+
+@dataclass
+class EmailReport:
+    """Outcome of validating a batch of addresses, keyed by normalised address."""
+    valid: Set[str] = field(default_factory=set)
+    invalid: Set[str] = field(default_factory=set)
+    total: int = 0
+    non_strings: int = 0
+
+    @property
+    def duplicates(self):
+        return self.total - self.non_strings - len(self.valid) - len(self.invalid)
+
+    def merge(self, other):
+        self.valid |= other.valid
+        self.invalid |= other.invalid
+        self.total += other.total
+        self.non_strings += other.non_strings
+        return self
+
+
+def validate_emails(emails: Iterable, report: Optional[EmailReport] = None) -> EmailReport:
+    """
+    Validate every address in `emails`, running the pattern once per distinct
+    normalised address. Lowercasing the domain never changes validity, so a
+    repeat is answered from the sets alone.
+    """
+    report = report if report is not None else EmailReport()
+    valid, invalid = report.valid, report.invalid
+    count = 0
+    for email in emails:
+        count += 1
+        if not isinstance(email, str):
+            report.non_strings += 1
+            continue
+        key = normalize_email(email)
+        if key in valid or key in invalid:
+            continue
+        (valid if _match_email(email) else invalid).add(key)
+    report.total += count
+    return report
+
+
+def validate_email_file(path: str) -> EmailReport:
+    """One address per line; line endings are dropped and blank lines skipped."""
+    with open(path, 'r', encoding='utf-8', errors='replace', newline='') as f:
+        lines = (line.rstrip('\r\n') for line in f)
+        return validate_emails(line for line in lines if line)
+
+
+def validate_email_files(paths: List[str], processes: Optional[int] = None) -> EmailReport:
+    """Validate files in a process pool (one file per task) and merge the reports."""
+    report = EmailReport()
+    if processes == 1 or len(paths) <= 1:
+        for path in paths:
+            report.merge(validate_email_file(path))
+        return report
+    with ProcessPoolExecutor(max_workers=processes or os.cpu_count()) as pool:
+        for part in pool.map(validate_email_file, paths):
+            report.merge(part)
+    return report
 
 
 # Test cases generated using AI reasoning
@@ -101,7 +165,50 @@ def test_is_valid_email():
     print("All test cases passed! ✓")
 
 
+def test_validate_emails():
+    """Batch, dedup and file modes agree with is_valid_email."""
+    import random
+    import tempfile
+
+    def rules(email):
+        # The rules above, written out as separate checks.
+        special = '!@#$%^&*()_+-=[]{};\':"\\|,<>/?`~.'
+        return (isinstance(email, str) and email != '' and email.count('@') == 1
+                and '.' in email and email[0] not in special and email[-1] not in special
+                and '.@' not in email and '@.' not in email)
+
+    rng = random.Random(39)
+    alphabet = 'ab.@-_ !#\n\u00e9K'
+    samples = [''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 8))) for _ in range(20000)]
+    for email in samples:
+        assert is_valid_email(email) == rules(email), repr(email)
+
+    emails = ["user@example.com", "User@EXAMPLE.com", "user@example.com", "bad@", None,
+              "USER@example.com", "bad@"]
+    report = validate_emails(emails)
+    assert report.valid == {"user@example.com", "User@example.com", "USER@example.com"}
+    assert report.invalid == {"bad@"}
+    assert (report.total, report.non_strings, report.duplicates) == (7, 1, 2)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for i in range(3):
+            path = os.path.join(tmp, f"list{i}.txt")
+            with open(path, 'w', encoding='utf-8', newline='') as f:
+                f.write("a@b.co\r\nA@B.CO\n\nx@y\n" + f"only{i}@list.org\n")
+            paths.append(path)
+        merged = validate_email_files(paths, processes=2)
+        serial = validate_email_files(paths, processes=1)
+    assert merged == serial
+    assert merged.valid == {"a@b.co", "A@b.co", "only0@list.org", "only1@list.org", "only2@list.org"}
+    assert merged.invalid == {"x@y"}
+    assert merged.total == 12 and merged.duplicates == 6
+
+    print("All validate_emails tests passed! ✓")
+
+
 if __name__ == "__main__":
     test_is_valid_email()
+    test_validate_emails()
     print("\nEmail validation logic passing all test cases ✓")
 